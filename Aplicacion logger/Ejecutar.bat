@@ -5,9 +5,10 @@ ECHO Al finalizar encontrara el grafico que se abrira fuera de esta carpeta.
 
 SET /P DATOS=Archivo a procesar (sin extension):
 SET /P SALIDA=Ingrese nombre archivo salida:
-python graficar.py "%DATOS%.txt" "%SALIDA%"
+SET ARCHIVO=%DATOS%.txt
+IF EXIST "%DATOS%.bin" SET ARCHIVO=%DATOS%.bin
+python graficar.py "%ARCHIVO%" "%SALIDA%"
 echo Tarea finalizada.
-IF EXIST "%SALIDA%".pkl DEL /F "%SALIDA%".pkl
 echo Pulsa una tecla para salir
 pause>nul
 exit
\ No newline at end of file
@@ -0,0 +1,335 @@
+# benchmark.py
+# Mediciones de rendimiento sobre logs sinteticos con el formato de DHT22.ino
+
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from combinar import combinar_logs
+from estadisticas import PerfilExcedencia
+from lectura import escribir_binario, indice_tiempo, leer_binario, leer_log, leer_log_rango, motores, nombres_lecturas
+from plots import columnar_source, default_xrange
+
+
+def generar_log(ruta: str, filas: int, inicio: str = '2023-01-01',
+                paso_s: int = 2, semilla: int = 0, sensores: int = 2) -> str:
+    """Write a synthetic logNNNN.txt file with the same layout as DHT22.ino.
+
+    Timestamps are written unpadded (``Y/M/D H:M:S``) and readings with two
+    decimals, as ``print(float)`` does on the board.
+
+    :param ruta: output file path.
+    :param filas: number of samples to write.
+    :param inicio: timestamp of the first sample.
+    :param paso_s: seconds between samples.
+    :param semilla: random seed.
+    :param sensores: DHT22 sensors; from the third on, T3/H3, T4/H4... are
+            added as copies of the interior ones plus noise.
+    :return: path of the written file.
+    """
+    rng = np.random.RandomState(semilla)
+    bloque = 1000000
+    t0 = pd.Timestamp(inicio)
+    extra = nombres_lecturas(sensores)[4:]
+    with open(ruta, 'w') as f:
+        f.write(','.join(['Tiempo'] + nombres_lecturas(sensores) + ['Puerta']) + '\n')
+        for ini in range(0, filas, bloque):
+            n = min(bloque, filas - ini)
+            t = t0 + pd.to_timedelta(np.arange(ini, ini + n) * paso_s, unit='s')
+            tiempo = (t.year.astype(str) + '/' + t.month.astype(str) + '/' +
+                      t.day.astype(str) + ' ' + t.hour.astype(str) + ':' +
+                      t.minute.astype(str) + ':' + t.second.astype(str))
+            fase = np.arange(ini, ini + n) / 1800.0
+            tint = -15 + 4 * np.sin(fase) + rng.normal(0, 0.3, n)
+            hint = 60 + 10 * np.cos(fase) + rng.normal(0, 1, n)
+            text = 22 + 3 * np.sin(fase / 24) + rng.normal(0, 0.3, n)
+            hext = 45 + 5 * np.sin(fase / 24) + rng.normal(0, 1, n)
+            puerta = (rng.random_sample(n) < 0.01).astype(int)
+            columnas = {'Tiempo': tiempo,
+                        'TInt': tint.round(2),
+                        'HInt': hint.round(2),
+                        'TExterio': text.round(2),
+                        'HExt': hext.round(2)}
+            for col in extra:
+                base = tint if col.startswith('T') else hint
+                columnas[col] = (base + rng.normal(0, 0.5, n)).round(2)
+            columnas['Puerta'] = puerta
+            bloque_df = pd.DataFrame(columnas)
+            bloque_df.to_csv(f, header=False, index=False,
+                             float_format='%.2f')
+    return ruta
+
+
+def cronometrar(funcion, *args, repeticiones: int = 3, **kwargs) -> float:
+    """Return the best wall time in seconds of ``repeticiones`` calls."""
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        t = time.perf_counter()
+        funcion(*args, **kwargs)
+        mejor = min(mejor, time.perf_counter() - t)
+    return mejor
+
+
+def _carga_anterior(ruta: str, ruta_pkl: str) -> pd.DataFrame:
+    # camino de graficar.py antes del cambio: csv -> pickle -> pickle -> read
+    df = pd.read_csv(ruta)
+    df.to_pickle(ruta_pkl)
+    df.to_pickle(ruta_pkl)
+    data = pd.read_pickle(ruta_pkl)
+    data = data.dropna()
+    data['Tiempo'] = pd.to_datetime(data['Tiempo'])
+    return data
+
+
+def _carga_actual(ruta: str) -> pd.DataFrame:
+    df = pd.read_csv(ruta)
+    data = df.dropna().copy()
+    data['Tiempo'] = pd.to_datetime(data['Tiempo'])
+    return data
+
+
+def bench_carga(ruta: str, repeticiones: int = 3):
+    """Compare the old CSV -> pickle -> pickle -> read path with a single load."""
+    ruta_pkl = ruta + '.pkl'
+    anterior = cronometrar(_carga_anterior, ruta, ruta_pkl,
+                           repeticiones=repeticiones)
+    tam_pkl = os.path.getsize(ruta_pkl)
+    os.remove(ruta_pkl)
+    actual = cronometrar(_carga_actual, ruta, repeticiones=repeticiones)
+    print(f'csv + 2x pickle + read: {anterior:8.3f} s '
+          f'({2 * tam_pkl / 1e6:.1f} MB escritos, {tam_pkl / 1e6:.1f} MB leidos)')
+    print(f'lectura unica:          {actual:8.3f} s (0 MB escritos)')
+    print(f'ahorro: {anterior - actual:.3f} s ({(1 - actual / anterior) * 100:.1f}%)')
+
+
+def medir_memoria(funcion, *args, **kwargs):
+    """Return (seconds, peak traced MB) of a single call.
+
+    Buffers allocated by pyarrow's own memory pool are not seen by
+    tracemalloc; they are added when pyarrow is importable.
+    """
+    try:
+        import pyarrow as pa
+        pool = pa.default_memory_pool()
+        base_pool = pool.max_memory() or 0
+    except ImportError:
+        pool = None
+    tracemalloc.start()
+    t = time.perf_counter()
+    funcion(*args, **kwargs)
+    segundos = time.perf_counter() - t
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if pool is not None:
+        pico += max(0, (pool.max_memory() or 0) - base_pool)
+    return segundos, pico / 1e6
+
+
+def _lectura_inferida(ruta: str) -> pd.DataFrame:
+    df = pd.read_csv(ruta)
+    df = df.dropna()
+    df['Tiempo'] = pd.to_datetime(df['Tiempo'])
+    return df
+
+
+def bench_lectura(ruta: str, repeticiones: int = 3):
+    """Compare dtype/date inference with the typed reader in lectura.py."""
+    casos = [('read_csv inferido', _lectura_inferida, {})]
+    for motor in motores:
+        casos.append((f'leer_log {motor}', leer_log, {'motor': motor}))
+    for nombre, funcion, kwargs in casos:
+        try:
+            tiempos = [medir_memoria(funcion, ruta, **kwargs)
+                       for _ in range(repeticiones)]
+        except ImportError as e:
+            print(f'{nombre:20s} omitido: {e}')
+            continue
+        segundos = min(t for t, _ in tiempos)
+        pico = max(m for _, m in tiempos)
+        print(f'{nombre:20s} {segundos:8.3f} s  pico {pico:9.1f} MB')
+
+
+def bench_excedencia(ruta: str, repeticiones: int = 3):
+    """Compare one mask scan per threshold with PerfilExcedencia on a 0.1 degC sweep."""
+    df = leer_log(ruta)
+    umbrales = np.round(np.arange(-25, 0, 0.1), 1)
+
+    def por_mascara():
+        return [int((df['TInt'] < u).sum()) for u in umbrales]
+
+    def por_perfil():
+        return PerfilExcedencia(df['Tiempo'], df['TInt']).muestras_bajo(umbrales)
+
+    assert list(por_perfil()) == por_mascara()
+    mascara = cronometrar(por_mascara, repeticiones=repeticiones)
+    perfil = cronometrar(por_perfil, repeticiones=repeticiones)
+    print(f'{len(umbrales)} umbrales sobre {len(df)} filas')
+    print(f'una mascara por umbral: {mascara:8.3f} s')
+    print(f'PerfilExcedencia:       {perfil:8.3f} s (incluye el ordenamiento)')
+
+
+def _html(source) -> str:
+    from bokeh.embed import file_html
+    from bokeh.plotting import figure
+    from bokeh.resources import CDN
+    p = figure(x_axis_type='datetime')
+    for col in ['TExterio', 'HExt', 'TInt', 'HInt', 'Puerta']:
+        p.line('Tiempo', col, source=source)
+    return file_html(p, CDN)
+
+
+def _cargar_documento(html: str):
+    # el navegador tiene que decodificar el documento embebido antes de
+    # dibujar; json.loads sobre el mismo texto sirve como aproximacion
+    ini = html.index('>', html.index('<script type="application/json"')) + 1
+    return json.loads(html[ini:html.index('</script>', ini)])
+
+
+def bench_html(ruta: str, repeticiones: int = 3):
+    """Compare ColumnDataSource(df) with columnar_source in the generated HTML.
+
+    Browser load time cannot be measured here; the time to decode the
+    embedded document with json.loads is reported as a proxy.
+    """
+    from bokeh.models import ColumnDataSource
+    df = leer_log(ruta)
+    columnas = ['Tiempo', 'TExterio', 'HExt', 'TInt', 'HInt', 'Puerta']
+    casos = [('ColumnDataSource(df)', lambda: ColumnDataSource(df)),
+             ('columnar_source', lambda: columnar_source(
+                 df, columnas, dtypes={'Puerta': 'uint8'}))]
+    for nombre, fuente in casos:
+        t = time.perf_counter()
+        html = _html(fuente())
+        generar = time.perf_counter() - t
+        decodificar = cronometrar(_cargar_documento, html,
+                                  repeticiones=repeticiones)
+        print(f'{nombre:22s} {len(html.encode()) / 1e6:9.1f} MB  '
+              f'generar {generar:7.2f} s  decodificar {decodificar:7.3f} s')
+
+
+def bench_binario(ruta: str, repeticiones: int = 3):
+    """Compare reading the CSV log with reading the same data in binary."""
+    ruta_bin = os.path.splitext(ruta)[0] + '.bin'
+    escribir_binario(ruta_bin, leer_log(ruta, limpiar=False))
+    casos = [(f'csv {motor}', leer_log, ruta, {'motor': motor, 'limpiar': False})
+             for motor in motores]
+    casos.append(('binario', leer_binario, ruta_bin, {}))
+    for nombre, funcion, archivo, kwargs in casos:
+        try:
+            segundos = cronometrar(funcion, archivo, repeticiones=repeticiones,
+                                   **kwargs)
+        except ImportError as e:
+            print(f'{nombre:12s} omitido: {e}')
+            continue
+        print(f'{nombre:12s} {os.path.getsize(archivo) / 1e6:8.1f} MB  '
+              f'{segundos:8.3f} s')
+
+
+def bench_rango(ruta: str, repeticiones: int = 3):
+    """Compare reading one day of the log with reading all of it."""
+    with tempfile.TemporaryDirectory() as carpeta:
+        t = time.perf_counter()
+        indice = indice_tiempo(ruta, carpeta)
+        construir = time.perf_counter() - t
+        dia = indice['tiempo'].iloc[len(indice) // 2].normalize()
+        hasta = dia + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+        completo = cronometrar(leer_log, ruta, repeticiones=repeticiones)
+        ventana = cronometrar(leer_log_rango, ruta, dia, hasta, carpeta=carpeta,
+                              repeticiones=repeticiones)
+        filas = len(leer_log_rango(ruta, dia, hasta, carpeta=carpeta))
+    print(f'indice ({len(indice)} entradas, una vez): {construir:8.3f} s')
+    print(f'archivo entero:                    {completo:8.3f} s')
+    print(f'{dia:%Y-%m-%d} ({filas} filas):           {ventana:8.3f} s')
+
+
+def bench_sensores(ruta: str, repeticiones: int = 3):
+    """Peak memory of leer_log as the number of sensors grows."""
+    filas = sum(1 for _ in open(ruta)) - 1
+    with tempfile.TemporaryDirectory() as carpeta:
+        for sensores in (2, 4, 8, 16):
+            archivo = generar_log(os.path.join(carpeta, f'log{sensores:04d}.txt'),
+                                  filas, sensores=sensores)
+            segundos, pico = medir_memoria(leer_log, archivo)
+            df = leer_log(archivo)
+            datos = df.memory_usage(index=False).sum() / 1e6
+            print(f'{sensores:2d} sensores: datos {datos:8.1f} MB  '
+                  f'pico {pico:8.1f} MB  {segundos:7.2f} s')
+
+
+def _union_externa(rutas):
+    # como se combinaba a mano: union externa por Tiempo y relleno hacia adelante
+    combinado = None
+    for i, ruta in enumerate(rutas):
+        df = leer_log(ruta)[['Tiempo', 'TInt']].rename(columns={'TInt': f'TInt {i}'})
+        combinado = df if combinado is None else combinado.merge(df, on='Tiempo', how='outer')
+    return combinado.sort_values('Tiempo').ffill()
+
+
+def bench_combinar(ruta: str, repeticiones: int = 3):
+    """Align 4 loggers whose clocks are a few seconds apart."""
+    filas = sum(1 for _ in open(ruta)) - 1
+    with tempfile.TemporaryDirectory() as carpeta:
+        rutas = [generar_log(os.path.join(carpeta, f'log{i:04d}.txt'), filas,
+                             inicio=pd.Timestamp('2023-01-01') + pd.Timedelta(seconds=7 * i),
+                             semilla=i) for i in range(4)]
+        union = cronometrar(_union_externa, rutas, repeticiones=repeticiones)
+        print(f'union externa ({len(_union_externa(rutas))} filas): {union:8.3f} s')
+        asof = cronometrar(combinar_logs, rutas, paso='1min',
+                           carpeta=os.path.join(carpeta, 'cache'),
+                           repeticiones=repeticiones)
+        print(f'merge_asof:                  {asof:8.3f} s')
+        filas_grilla = len(combinar_logs(rutas, paso='1min', carpeta=os.path.join(carpeta, 'cache')))
+    print(f'grilla de 1 min: {filas_grilla} filas')
+
+
+def _xrange_anterior(valores, parte):
+    # como lo calculaban los graficos de plots.py
+    xr = sorted(set(valores))
+    return xr[0], xr[int(len(xr) / parte)]
+
+
+def bench_xrange(ruta: str, repeticiones: int = 3):
+    """Default x range of the time plots over the Tiempo column."""
+    tiempo = leer_log(ruta)['Tiempo']
+    anterior = cronometrar(_xrange_anterior, tiempo, 10, repeticiones=1)
+    actual = cronometrar(default_xrange, tiempo, 10, repeticiones=repeticiones)
+    desordenado = tiempo.sample(frac=1, random_state=0)
+    sin_orden = cronometrar(default_xrange, desordenado, 10, repeticiones=repeticiones)
+    print(f'{len(tiempo)} filas')
+    print(f'sorted(set()):              {anterior:8.3f} s')
+    print(f'default_xrange (ordenado):  {actual:8.3f} s')
+    print(f'default_xrange (sin orden): {sin_orden:8.3f} s')
+
+
+BENCHMARKS = {
+    'carga': bench_carga,
+    'lectura': bench_lectura,
+    'excedencia': bench_excedencia,
+    'html': bench_html,
+    'binario': bench_binario,
+    'rango': bench_rango,
+    'sensores': bench_sensores,
+    'combinar': bench_combinar,
+    'xrange': bench_xrange,
+}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Mediciones de rendimiento')
+    parser.add_argument('prueba', choices=sorted(BENCHMARKS),
+                        help='Medicion a ejecutar')
+    parser.add_argument('-n', '--filas', type=int, default=1000000,
+                        help='Filas del log sintetico (default: 1000000)')
+    parser.add_argument('-r', '--repeticiones', type=int, default=3,
+                        help='Repeticiones por medicion (default: 3)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = generar_log(os.path.join(carpeta, 'log0000.txt'), args.filas)
+        BENCHMARKS[args.prueba](ruta, repeticiones=args.repeticiones)
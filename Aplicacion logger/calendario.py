@@ -0,0 +1,91 @@
+# calendario.py
+# Mapa de calor dia x hora del dia de un log largo
+
+import argparse
+import os
+from logging import getLogger, NullHandler
+
+import pandas as pd
+
+from lectura import leer_log, motores
+from plots import heatmap
+from remuestreo import remuestrear, remuestrear_log
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+horas = [str(h) for h in range(24)]
+
+
+def grilla_calendario(agregados: pd.DataFrame, columna: str,
+                      xvar: str = 'Tiempo') -> pd.DataFrame:
+    """One cell per day and hour of day from hourly aggregates.
+
+    :param agregados: result of :func:`remuestreo.remuestrear` with '1h'
+            buckets (about 24 x 365 rows for a year long log).
+    :param columna: aggregate to show, e.g. 'TInt_mean' or 'aperturas'.
+    :param xvar: datetime column.
+    :return: columns 'dia' ('YYYY-MM-DD'), 'hora' ('0' to '23'), 'valor'
+            and 'muestras'; hours without readings are left out.
+    """
+    tiempo = agregados[xvar]
+    grilla = pd.DataFrame({'dia': tiempo.dt.strftime('%Y-%m-%d'),
+                           'hora': tiempo.dt.hour.astype(str),
+                           'valor': agregados[columna].to_numpy(dtype='float64'),
+                           'muestras': agregados['muestras'].to_numpy()})
+    return grilla[grilla['valor'].notna()].reset_index(drop=True)
+
+
+def grafico_calendario(grilla: pd.DataFrame, titulo: str, etiqueta: str,
+                       ancho: int = 1200, temperatura: bool = True):
+    """Day x hour heatmap of a :func:`grilla_calendario` grid.
+
+    Days without readings are kept as blank columns, so gaps in the log
+    are visible. With more than two months only the first day of each
+    month is labelled.
+    """
+    dias = pd.date_range(grilla['dia'].min(), grilla['dia'].max(), freq='D').strftime('%Y-%m-%d').tolist()
+    p = heatmap(grilla, 'dia', 'hora', 'valor', width=min(ancho, 20 * len(dias) + 400), height=24 * 20 + 200,
+                hoover_format=[('Dia', '@dia'), ('Hora', '@hora h'), (etiqueta, '@valor{0.00}'), ('Muestras', '@muestras')],
+                title=titulo, xrange=dias, yrange=horas,
+                palette='RdYlBu' if temperatura else None, reverse=temperatura)
+    if len(dias) > 62:
+        p.xaxis.major_label_overrides = {dia: dia[:7] if dia.endswith('-01') else '' for dia in dias}
+    p.xaxis.axis_label = 'Dia'
+    p.yaxis.axis_label = 'Hora'
+    return p
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mapa de calor dia x hora de un archivo del logger')
+    parser.add_argument('archivo', type=str, help='Archivo de log (.txt o .bin)')
+    parser.add_argument('-o', '--salida', type=str, default=None, help='Archivo HTML de salida (default: Calendario <archivo>.html)')
+    parser.add_argument('-c', '--columna', type=str, default='TInt', help="Lectura a mostrar, o 'aperturas' para las aperturas de puerta por hora (default: TInt)")
+    parser.add_argument('--agregacion', choices=['min', 'mean', 'max'], default='mean', help='Valor de cada hora (default: mean)')
+    parser.add_argument('--motor', choices=motores, default='c', help="Motor de lectura del CSV (default: c)")
+    parser.add_argument('--sin_cache', action='store_true', help='No usar la cache de agregados')
+    parser.add_argument('--carpeta_cache', type=str, default='.cache_logs', help='Carpeta de la cache (default: .cache_logs)')
+    args = parser.parse_args()
+
+    # Solo los agregados por hora llegan al grafico; con la cache de
+    # --remuestreo 1h ni siquiera se lee el log
+    agregados = remuestrear(leer_log(args.archivo, motor=args.motor), '1h') if args.sin_cache \
+        else remuestrear_log(args.archivo, '1h', carpeta=args.carpeta_cache, motor=args.motor)
+    puerta = args.columna == 'aperturas'
+    columna = 'aperturas' if puerta else f'{args.columna}_{args.agregacion}'
+    if columna not in agregados:
+        parser.error(f'{args.archivo} no tiene la columna {args.columna}')
+    etiqueta = 'Aperturas' if puerta else f'{args.columna} ({args.agregacion})'
+
+    from bokeh.io import save
+    from bokeh.resources import CDN
+
+    p = grafico_calendario(grilla_calendario(agregados, columna), f'{args.archivo} - {etiqueta} por hora', etiqueta,
+                           temperatura=not puerta and args.columna.startswith('T'))
+    salida = args.salida or f'Calendario {os.path.splitext(os.path.basename(args.archivo))[0]}.html'
+    save(p, filename=salida, resources=CDN, title='DataLogger - calendario')
+    print(f'Grafico: {salida}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+# combinar.py
+# Combina los logs de varios loggers en una grilla de tiempo comun
+
+import argparse
+import glob
+import html
+import os
+from logging import getLogger, NullHandler
+from typing import Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from decimado import decimar
+from estadisticas import AcumuladorEstadisticas
+from lectura import leer_log, leer_log_rango, limites_log, motores
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+
+def nombres_logs(rutas: Sequence[str]) -> List[str]:
+    """Short unique name of each log: the file name, plus its folder if repeated.
+
+    Every card starts at log0000.txt, so logs of different loggers usually
+    share the file name and are told apart by the folder they were copied to.
+    """
+    nombres = [os.path.splitext(os.path.basename(ruta))[0] for ruta in rutas]
+    repetidos = {n for n in nombres if nombres.count(n) > 1}
+    return [os.path.basename(os.path.dirname(os.path.abspath(ruta))) + '/' + n
+            if n in repetidos else n for ruta, n in zip(rutas, nombres)]
+
+
+def grilla_comun(rutas: Sequence[str], paso: str,
+                 desfases: Sequence[pd.Timedelta] = None,
+                 desde=None, hasta=None) -> pd.DatetimeIndex:
+    """Time grid covering every log, from the ends of the files only.
+
+    :param rutas: log files.
+    :param paso: grid spacing, e.g. '10s' or '1min'.
+    :param desfases: correction added to the clock of each log.
+    :param desde: start of the grid instead of the earliest log start.
+    :param hasta: end of the grid instead of the latest log end.
+    :return: regular grid aligned to ``paso``.
+    """
+    desfases = desfases or [pd.Timedelta(0)] * len(rutas)
+    limites = [limites_log(ruta) for ruta in rutas]
+    inicio = pd.Timestamp(desde) if desde is not None else \
+        min(i + d for (i, _), d in zip(limites, desfases) if pd.notna(i))
+    fin = pd.Timestamp(hasta) if hasta is not None else \
+        max(f + d for (_, f), d in zip(limites, desfases) if pd.notna(f))
+    return pd.date_range(inicio.floor(paso), fin.ceil(paso), freq=paso)
+
+
+def alinear(df: pd.DataFrame, grilla: pd.DatetimeIndex, columnas: Sequence[str],
+            tolerancia: pd.Timedelta, desfase: pd.Timedelta = pd.Timedelta(0),
+            xvar: str = 'Tiempo') -> pd.DataFrame:
+    """Take, for every grid time, the nearest reading of one log.
+
+    Uses a sorted as-of merge, linear in rows + grid points: each grid time
+    gets the reading closest in time if it is within ``tolerancia``, NaN
+    otherwise (logger off, gap, or outside its span).
+
+    :param df: clean log (see :func:`lectura.limpiar_log`).
+    :param grilla: common time grid.
+    :param columnas: columns to keep.
+    :param tolerancia: largest distance between a grid time and a reading.
+    :param desfase: correction added to the log clock before aligning, for
+            an RTC that runs ahead (negative) or behind (positive).
+    :param xvar: name of the datetime column.
+    :return: frame indexed like ``grilla`` with ``columnas``.
+    """
+    datos = df[[xvar] + list(columnas)]
+    if desfase:
+        datos = datos.assign(**{xvar: datos[xvar] + desfase})
+    # merge_asof necesita las dos partes ordenadas; un RTC que se atraso
+    # deja filas fuera de orden
+    if not datos[xvar].is_monotonic_increasing:
+        datos = datos.sort_values(xvar, kind='mergesort')
+    alineado = pd.merge_asof(pd.DataFrame({xvar: grilla}), datos, on=xvar,
+                             direction='nearest', tolerance=pd.Timedelta(tolerancia))
+    return alineado.set_index(xvar)[list(columnas)]
+
+
+def _alinear_log(ruta: str, grilla: pd.DatetimeIndex, columnas: Sequence[str],
+                 tolerancia: pd.Timedelta, desfase: pd.Timedelta,
+                 motor: str, carpeta: str) -> np.ndarray:
+    # lee solo la ventana de la grilla y devuelve la matriz alineada; el log
+    # leido se descarta antes de pasar al siguiente
+    margen = pd.Timedelta(tolerancia) + abs(desfase)
+    df = leer_log_rango(ruta, grilla[0] - desfase - margen, grilla[-1] - desfase + margen,
+                        carpeta=carpeta, motor=motor) if len(grilla) else leer_log(ruta, motor=motor)
+    presentes = [col for col in columnas if col in df]
+    alineado = alinear(df, grilla, presentes, tolerancia, desfase)
+    matriz = np.full((len(grilla), len(columnas)), np.nan, dtype='float32')
+    for j, col in enumerate(columnas):
+        if col in presentes:
+            matriz[:, j] = alineado[col].to_numpy(dtype='float32')
+    return matriz
+
+
+def combinar_logs(rutas: Sequence[str], columnas: Sequence[str] = ('TInt',),
+                  paso: str = '1min', tolerancia: str = None,
+                  desfases: Dict[str, str] = None,
+                  motor: str = 'c', desde=None, hasta=None,
+                  carpeta: str = '.cache_logs') -> pd.DataFrame:
+    """Read several logs and align them on one time grid.
+
+    Each log is read in turn (only the window covering the grid) and aligned
+    with one as-of merge; only its (grid x columns) float32 matrix is kept.
+    Nothing is joined pairwise, so the cost is linear in the total number
+    of rows plus grid points.
+
+    :param rutas: log files, one or more per logger.
+    :param columnas: columns to take from every log.
+    :param paso: grid spacing. Default '1min'.
+    :param tolerancia: largest distance between a grid time and the reading
+            used for it. Default equal to paso.
+    :param desfases: clock correction per log name (see :func:`nombres_logs`),
+            e.g. ``{'camara2': '-45s'}`` for an RTC 45 s ahead.
+    :param motor: parser engine, see :func:`lectura.leer_log`.
+    :param desde: start of the grid. Default the earliest log start.
+    :param hasta: end of the grid. Default the latest log end.
+    :param carpeta: folder of the time indexes, see :func:`lectura.indice_tiempo`.
+    :return: frame with Tiempo and one column per (column, log), named
+            ``'<columna> <log>'``.
+    """
+    if motor not in motores:
+        raise ValueError(f"motor debe ser uno de {motores}, no '{motor}'")
+    nombres = nombres_logs(rutas)
+    desfases = desfases or {}
+    desconocidos = set(desfases) - set(nombres)
+    if desconocidos:
+        raise ValueError(f'desfases para logs desconocidos: {sorted(desconocidos)}; '
+                         f'los logs son {nombres}')
+    corr = [pd.Timedelta(desfases.get(nombre, 0)) for nombre in nombres]
+    tolerancia = pd.Timedelta(tolerancia or paso)
+    grilla = grilla_comun(rutas, paso, corr, desde, hasta)
+    columnas = list(columnas)
+    matrices = [_alinear_log(ruta, grilla, columnas, tolerancia, d, motor, carpeta)
+                for ruta, d in zip(rutas, corr)]
+    combinado = pd.DataFrame(np.hstack(matrices) if matrices else None,
+                             columns=[f'{col} {nombre}' for nombre in nombres for col in columnas])
+    combinado.insert(0, 'Tiempo', grilla)
+    return combinado
+
+
+def dispersion(combinado: pd.DataFrame, columna: str) -> pd.Series:
+    """Spread (max - min) between loggers of one column at every grid time."""
+    valores = combinado[[c for c in combinado if c.split(' ', 1)[0] == columna]].to_numpy()
+    with np.errstate(invalid='ignore'):
+        validos = (~np.isnan(valores)).sum(axis=1) >= 2
+        spread = np.full(len(valores), np.nan, dtype='float32')
+        if validos.any():
+            spread[validos] = (np.nanmax(valores[validos], axis=1) -
+                               np.nanmin(valores[validos], axis=1))
+    return pd.Series(spread, index=combinado.index, name=f'dispersion {columna}')
+
+
+def _tabla(resumen: pd.DataFrame) -> str:
+    filas = ''.join(f"<tr><td>{html.escape(str(col))}</td><td>{int(r['muestras'])}</td>"
+                    f"<td>{r['media']:.2f}</td><td>{r['desviacion']:.2f}</td>"
+                    f"<td>{r['minimo']:.2f}</td><td>{r['maximo']:.2f}</td></tr>"
+                    for col, r in resumen.iterrows())
+    return ("<table border='1' cellpadding='4'><tr><th>Serie</th><th>Puntos</th><th>Media</th>"
+            "<th>Desv.</th><th>Min</th><th>Max</th></tr>" + filas + "</table>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Combinar los logs de varios loggers en un solo grafico')
+    parser.add_argument('entradas', nargs='+', help='Archivos de log o patrones (ej. "camara*/log0000.txt")')
+    parser.add_argument('-o', '--salida', type=str, default='Combinado.html', help='Archivo HTML de salida (default: Combinado.html)')
+    parser.add_argument('-c', '--columnas', type=str, default='TInt', help='Columnas a comparar separadas por comas (default: TInt)')
+    parser.add_argument('--paso', type=str, default='1min', help="Separacion de la grilla comun (default: 1min)")
+    parser.add_argument('--tolerancia', type=str, default=None, help="Distancia maxima entre la grilla y una lectura (default: --paso)")
+    parser.add_argument('--desfase', action='append', default=[], help="Correccion del reloj de un log, ej. camara2/log0000=-45s (se puede repetir)")
+    parser.add_argument('--desde', type=str, default=None, help='Inicio de la grilla (default: el primer log)')
+    parser.add_argument('--hasta', type=str, default=None, help='Fin de la grilla (default: el ultimo log)')
+    parser.add_argument('--motor', choices=motores, default='c', help="Motor de lectura del CSV (default: c)")
+    parser.add_argument('--carpeta_cache', type=str, default='.cache_logs', help='Carpeta de los indices de tiempo (default: .cache_logs)')
+    args = parser.parse_args()
+
+    rutas = [ruta for entrada in args.entradas for ruta in (sorted(glob.glob(entrada)) or [entrada])]
+    columnas = args.columnas.split(',')
+    desfases = dict(d.split('=', 1) for d in args.desfase)
+    print(f'Combinando {len(rutas)} logs...')
+    combinado = combinar_logs(rutas, columnas, paso=args.paso, tolerancia=args.tolerancia,
+                              desfases=desfases, motor=args.motor,
+                              desde=args.desde, hasta=args.hasta, carpeta=args.carpeta_cache)
+    series = [c for c in combinado if c != 'Tiempo']
+    for col in columnas:
+        combinado[f'dispersion {col}'] = dispersion(combinado, col)
+
+    from bokeh.io import save
+    from bokeh.layouts import column
+    from bokeh.models import Div, HoverTool
+    from bokeh.palettes import Category10
+    from bokeh.plotting import figure
+    from bokeh.resources import CDN
+    from plots import columnar_source
+
+    estadisticas = AcumuladorEstadisticas(series + [f'dispersion {col}' for col in columnas],
+                                          columna_umbral=series[0], solo_completas=False)
+    estadisticas.agregar(combinado)
+    graficadas = decimar(combinado, series, ancho=1200)
+    source = columnar_source(graficadas, ['Tiempo'] + series)
+    p = figure(title=f'{len(rutas)} loggers - grilla de {args.paso}', plot_height=500, plot_width=1200,
+               x_axis_type='datetime')
+    for i, serie in enumerate(series):
+        p.line('Tiempo', serie, source=source, color=Category10[10][i % 10], legend_label=serie)
+    p.legend.click_policy = 'hide'
+    p.add_tools(HoverTool(tooltips=[('Fecha', '$data_x{%F %T}')] + [(s, '@{' + s + '}') for s in series],
+                          formatters={'$data_x': 'datetime'}))
+    save(column(p, Div(text=_tabla(estadisticas.resumen()), width=1200)),
+         filename=args.salida, resources=CDN, title='DataLogger - combinado')
+    print(f'Grafico: {args.salida}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,343 @@
+# decimado.py
+# Reduccion de series largas a la resolucion del grafico
+
+from logging import getLogger, NullHandler
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+metodos = ('minmax', 'lttb')
+
+# niveles de la piramide, de mas fino a mas grueso (None = datos crudos)
+niveles_piramide = (('crudo', None),
+                    ('1 min', '1min'),
+                    ('10 min', '10min'),
+                    ('1 h', '1h'),
+                    ('1 dia', '1D'))
+
+# filas de todos los niveles juntos que entran en el HTML: con 4 lecturas son
+# unos 500 mil valores, 3-4 MB
+max_filas_html = 100000
+
+
+def indices_minmax(y: np.ndarray, cubetas: int) -> np.ndarray:
+    """Positions of the minimum and maximum of y in each of ``cubetas`` buckets.
+
+    Buckets hold consecutive samples of (almost) equal size, so on a
+    regularly sampled log each one covers the same time span. NaN values
+    are never selected unless a bucket holds nothing else.
+
+    :param y: values of one series.
+    :param cubetas: number of buckets, usually the plot width in pixels.
+    :return: sorted unique positions, at most ``2 * cubetas``.
+    """
+    n = len(y)
+    if n <= 2 * cubetas:
+        return np.arange(n)
+    y = np.asarray(y, dtype='float64')
+    tam = int(np.ceil(n / cubetas))
+    cubetas = int(np.ceil(n / tam))
+    relleno = cubetas * tam - n
+    nan = np.isnan(y)
+    bajo = np.concatenate([np.where(nan, np.inf, y), np.full(relleno, np.inf)])
+    alto = np.concatenate([np.where(nan, -np.inf, y), np.full(relleno, -np.inf)])
+    base = np.arange(cubetas) * tam
+    imin = base + bajo.reshape(cubetas, tam).argmin(axis=1)
+    imax = base + alto.reshape(cubetas, tam).argmax(axis=1)
+    return np.unique(np.concatenate([imin, imax]).clip(max=n - 1))
+
+
+def indices_lttb(x: np.ndarray, y: np.ndarray, puntos: int) -> np.ndarray:
+    """Positions chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last samples are always kept. The samples in between are
+    split into ``puntos - 2`` buckets and, from each, the sample forming the
+    largest triangle with the previously chosen point and the mean of the
+    next bucket is kept. The loop runs once per bucket, not per sample.
+
+    :param x: x values (numeric or datetime64), sorted.
+    :param y: y values, same length as x, without NaN.
+    :param puntos: number of points to keep.
+    :return: sorted positions, ``puntos`` of them.
+    """
+    n = len(y)
+    if puntos >= n or puntos < 3:
+        return np.arange(n)
+    x = np.asarray(x)
+    x = (x.astype('int64') - x.astype('int64')[0]).astype('float64') \
+        if x.dtype.kind == 'M' else np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    bordes = np.linspace(1, n - 1, puntos - 1).astype('int64')
+    # mean of every bucket in one go; the last "next bucket" is the last point
+    tam = np.diff(bordes)
+    media_x = np.append(np.add.reduceat(x[:-1], bordes[:-1]) / tam, x[-1])
+    media_y = np.append(np.add.reduceat(y[:-1], bordes[:-1]) / tam, y[-1])
+    elegidos = np.empty(puntos, dtype='int64')
+    elegidos[0], elegidos[-1] = 0, n - 1
+    a = 0
+    for i in range(puntos - 2):
+        ini, fin = bordes[i], bordes[i + 1]
+        area = np.abs((x[a] - media_x[i + 1]) * (y[ini:fin] - y[a]) -
+                      (x[a] - x[ini:fin]) * (media_y[i + 1] - y[a]))
+        a = ini + int(area.argmax())
+        elegidos[i + 1] = a
+    return elegidos
+
+
+def decimar(df: pd.DataFrame, columnas: Iterable[str], xvar: str = 'Tiempo',
+            ancho: int = 1200, metodo: str = 'minmax') -> pd.DataFrame:
+    """Reduce a frame to the rows needed to draw its series at ``ancho`` pixels.
+
+    Each column picks its own rows (min/max per pixel bucket or LTTB) and
+    the union of all picks is returned, so every series can still share one
+    ColumnDataSource and hover shows the full row. The global minimum and
+    maximum of every column are always included.
+
+    :param df: input data sorted by xvar.
+    :param columnas: columns to be plotted.
+    :param xvar: x axis column.
+    :param ancho: plot width in pixels. Default 1200.
+    :param metodo: 'minmax' (default, exact envelope) or 'lttb' (visually
+            closer lines, extremes only guaranteed globally).
+    :return: subset of df rows, in the original order, with a 0..n-1 index.
+            df itself is returned if it is already small enough.
+    """
+    logger = getLogger(__name__)
+    if metodo not in metodos:
+        raise ValueError(f"metodo debe ser uno de {metodos}, no '{metodo}'")
+    columnas = list(columnas)
+    if len(df) <= 2 * ancho:
+        return df
+    elegidos = []
+    for col in columnas:
+        y = df[col].values.astype('float64')
+        validos = np.flatnonzero(~np.isnan(y))
+        if not len(validos):
+            continue
+        if metodo == 'lttb':
+            elegidos.append(validos[indices_lttb(df[xvar].values[validos],
+                                                 y[validos], 2 * ancho)])
+        else:
+            elegidos.append(indices_minmax(y, ancho))
+        elegidos.append([np.nanargmin(y), np.nanargmax(y)])
+    if not elegidos:
+        return df
+    filas = np.unique(np.concatenate(elegidos)).astype('int64')
+    logger.debug(f'decimado {metodo}: {len(df)} -> {len(filas)} filas')
+    return df.iloc[filas].reset_index(drop=True)
+
+
+def minmax_por_intervalo(df: pd.DataFrame, columnas: Iterable[str],
+                         intervalo: str, xvar: str = 'Tiempo') -> pd.DataFrame:
+    """Keep the rows holding the min and max of each column per time interval.
+
+    :param df: input data sorted by xvar, with a 0..n-1 index.
+    :param columnas: columns whose extremes are kept.
+    :param intervalo: interval length as a pandas Timedelta string, e.g. '10min'.
+    :param xvar: datetime column.
+    :return: subset of df rows in the original order, with a 0..n-1 index.
+    """
+    paso = pd.Timedelta(intervalo).value
+    cubeta = df[xvar].values.astype('datetime64[ns]').astype('int64') // paso
+    elegidos = []
+    for col in columnas:
+        serie = pd.Series(df[col].values, index=np.arange(len(df))).dropna()
+        grupos = serie.groupby(cubeta[serie.index.values], sort=False)
+        elegidos += [grupos.idxmin().values, grupos.idxmax().values]
+    filas = np.unique(np.concatenate(elegidos)).astype('int64') if elegidos \
+        else np.arange(0)
+    return df.iloc[filas].reset_index(drop=True)
+
+
+def actualizar_minmax(previo: pd.DataFrame, df: pd.DataFrame,
+                      columnas: Iterable[str], intervalo: str, desde: int,
+                      xvar: str = 'Tiempo') -> pd.DataFrame:
+    """Update a :func:`minmax_por_intervalo` result after rows were appended.
+
+    Only the interval holding row ``desde`` and the later ones are
+    recomputed; earlier intervals are taken from ``previo`` as they were.
+
+    :param previo: result of minmax_por_intervalo on ``df[:desde]``.
+    :param df: all rows, sorted by xvar, with a 0..n-1 index.
+    :param columnas: columns whose extremes are kept.
+    :param intervalo: interval length as a pandas Timedelta string.
+    :param desde: position of the first appended row.
+    :param xvar: datetime column.
+    :return: same as ``minmax_por_intervalo(df, columnas, intervalo)``.
+    """
+    if desde >= len(df):
+        return previo
+    paso = pd.Timedelta(intervalo).value
+    t = df[xvar].values.astype('datetime64[ns]').astype('int64')
+    primera = t[desde] // paso * paso
+    ini = int(np.searchsorted(t, primera))
+    t_previo = previo[xvar].values.astype('datetime64[ns]').astype('int64')
+    conservadas = previo.iloc[:int(np.searchsorted(t_previo, primera))]
+    cola = minmax_por_intervalo(df.iloc[ini:].reset_index(drop=True),
+                                columnas, intervalo, xvar=xvar)
+    return pd.concat([conservadas, cola], ignore_index=True)
+
+
+def piramide(df: pd.DataFrame, columnas: Iterable[str], xvar: str = 'Tiempo',
+             max_filas: int = 1000000, previa: Dict[str, pd.DataFrame] = None,
+             desde: int = None) -> List[Tuple[str, float, pd.DataFrame]]:
+    """Precompute min/max aggregates of df at the resolutions in niveles_piramide.
+
+    A level is dropped when it has more than ``max_filas`` rows (e.g. the raw
+    level of a year long log) or when it is not smaller than the finer level
+    already kept (short logs). The coarsest level is always kept.
+    ``max_filas`` only bounds memory and the levels kept for
+    :func:`actualizar_minmax`; :func:`niveles_html` chooses the levels that
+    fit in the page.
+
+    :param df: input data sorted by xvar, with a 0..n-1 index.
+    :param columnas: columns to be plotted.
+    :param xvar: datetime column.
+    :param max_filas: maximum rows of a level.
+    :param previa: levels computed before rows were appended, by level name
+            (see :func:`actualizar_minmax`). Default None, compute from scratch.
+    :param desde: position of the first appended row when previa is given.
+    :return: list of (name, interval in ms, rows) from finest to coarsest.
+            For the raw level the interval is the median sampling period.
+    """
+    logger = getLogger(__name__)
+    columnas = list(columnas)
+    niveles = []
+    for i, (nombre, intervalo) in enumerate(niveles_piramide):
+        ultimo = i == len(niveles_piramide) - 1
+        if intervalo is None:
+            t = df[xvar].values.astype('datetime64[ns]').astype('int64')
+            paso_ms = _paso_crudo(*np.unique(np.diff(t), return_counts=True))
+            nivel = df
+        else:
+            paso_ms = pd.Timedelta(intervalo).value / 1e6
+            if previa and nombre in previa and desde is not None:
+                nivel = actualizar_minmax(previa[nombre], df, columnas,
+                                          intervalo, desde, xvar=xvar)
+            else:
+                nivel = minmax_por_intervalo(df, columnas, intervalo, xvar=xvar)
+        if not _conservar(nivel, niveles, ultimo, max_filas):
+            continue
+        logger.debug(f'piramide {nombre}: {len(nivel)} filas')
+        niveles.append((nombre, paso_ms, nivel))
+    return niveles
+
+
+def niveles_html(niveles: List[Tuple[str, float, pd.DataFrame]],
+                 max_filas: int = max_filas_html) -> List[Tuple[str, float, pd.DataFrame]]:
+    """Levels of :func:`piramide` that fit together in ``max_filas`` rows.
+
+    Levels are taken from the coarsest one, which is always kept, towards
+    the finest, so the raw level of all but short logs is left out and the
+    HTML does not grow with the log.
+
+    :param niveles: levels from finest to coarsest.
+    :param max_filas: rows of all the levels together. Default max_filas_html.
+    :return: the kept levels, from finest to coarsest.
+    """
+    total = 0
+    elegidos = []
+    for nombre, paso, nivel in reversed(niveles):
+        total += len(nivel)
+        if elegidos and total > max_filas:
+            break
+        elegidos.append((nombre, paso, nivel))
+    return elegidos[::-1]
+
+
+def _paso_crudo(pasos: np.ndarray, cuentas: np.ndarray) -> float:
+    # median sampling period in ms from the distinct steps and their counts
+    if not len(pasos):
+        return 1.
+    acumulado = np.cumsum(cuentas)
+    total = acumulado[-1]
+    bajo = pasos[np.searchsorted(acumulado, (total - 1) // 2, side='right')]
+    alto = pasos[np.searchsorted(acumulado, total // 2, side='right')]
+    return float((bajo + alto) / 2) / 1e6
+
+
+def _conservar(nivel: pd.DataFrame, niveles: List, ultimo: bool,
+               max_filas: int) -> bool:
+    # a level is kept if it fits max_filas and is smaller than the finer one
+    return ultimo or not (len(nivel) > max_filas or
+                          (niveles and len(nivel) >= len(niveles[-1][2])))
+
+
+class AcumuladorPiramide:
+    """Build the same levels as :func:`piramide` from consecutive chunks.
+
+    Every chunk is reduced to its own min/max rows per interval; rows of
+    intervals cut by a chunk edge are reduced again when the level is
+    compacted or returned, which gives exactly the whole-data result. A level
+    is abandoned as soon as it cannot fit max_filas, so memory stays bounded
+    by max_filas per level plus one chunk.
+
+    :param columnas: columns to be plotted.
+    :param xvar: datetime column.
+    :param max_filas: maximum rows of a level, see :func:`piramide`.
+    """
+
+    def __init__(self, columnas: Iterable[str], xvar: str = 'Tiempo',
+                 max_filas: int = 1000000):
+        self.columnas = list(columnas)
+        self.xvar = xvar
+        self.max_filas = max_filas
+        self._partes = {nombre: [] for nombre, _ in niveles_piramide}
+        self._filas = {nombre: 0 for nombre, _ in niveles_piramide}
+        self._descartados = set()
+        self._pasos = {}
+        self._ultimo_t = None
+
+    def _compactar(self, nombre: str, intervalo: str):
+        nivel = pd.concat(self._partes[nombre], ignore_index=True)
+        if intervalo is not None:
+            nivel = minmax_por_intervalo(nivel, self.columnas, intervalo,
+                                         xvar=self.xvar)
+        self._partes[nombre] = [nivel]
+        self._filas[nombre] = len(nivel)
+
+    def agregar(self, parte: pd.DataFrame):
+        """Add the next chunk (in time order, without NaN rows)."""
+        if not len(parte):
+            return
+        parte = parte.reset_index(drop=True)
+        t = parte[self.xvar].values.astype('datetime64[ns]').astype('int64')
+        pasos = np.diff(t) if self._ultimo_t is None else \
+            np.diff(np.concatenate([[self._ultimo_t], t]))
+        for paso, cuenta in zip(*np.unique(pasos, return_counts=True)):
+            self._pasos[paso] = self._pasos.get(paso, 0) + int(cuenta)
+        self._ultimo_t = t[-1]
+        ultimo = niveles_piramide[-1][0]
+        for nombre, intervalo in niveles_piramide:
+            if nombre in self._descartados:
+                continue
+            nivel = parte if intervalo is None else minmax_por_intervalo(
+                parte, self.columnas, intervalo, xvar=self.xvar)
+            self._partes[nombre].append(nivel)
+            self._filas[nombre] += len(nivel)
+            if self._filas[nombre] > self.max_filas and nombre != ultimo:
+                self._compactar(nombre, intervalo)
+                if self._filas[nombre] > self.max_filas:
+                    self._descartados.add(nombre)
+                    self._partes[nombre] = []
+
+    def resultado(self) -> List[Tuple[str, float, pd.DataFrame]]:
+        """Levels as returned by :func:`piramide` on all the chunks together."""
+        pasos = np.array(sorted(self._pasos), dtype='int64')
+        cuentas = np.array([self._pasos[p] for p in pasos], dtype='int64')
+        niveles = []
+        for i, (nombre, intervalo) in enumerate(niveles_piramide):
+            ultimo = i == len(niveles_piramide) - 1
+            if nombre in self._descartados or not self._partes[nombre]:
+                continue
+            self._compactar(nombre, intervalo)
+            nivel = self._partes[nombre][0]
+            paso_ms = (_paso_crudo(pasos, cuentas) if intervalo is None
+                       else pd.Timedelta(intervalo).value / 1e6)
+            if _conservar(nivel, niveles, ultimo, self.max_filas):
+                niveles.append((nombre, paso_ms, nivel))
+        return niveles
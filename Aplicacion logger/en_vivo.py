@@ -0,0 +1,238 @@
+# en_vivo.py
+# Grafico en vivo de las lecturas que DHT22.ino envia por el puerto serie
+
+import argparse
+import asyncio
+import os
+import re
+import time
+from logging import getLogger, NullHandler
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from lectura import nombres_lecturas
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+# columnas en el orden en que el firmware las imprime por Serial
+columnas_serie = ('HExt', 'TExterio', 'HInt', 'TInt', 'Puerta')
+
+# "H Ext: 45.10% T Ext: 22.30 *C - H Int: 60.20% T Int: -15.40 *C - Puerta: 0",
+# con un grupo "H 3: ...% T 3: ... *C - " mas por cada sensor extra
+_patron_sensor = re.compile(r'H (\w+):\s*(\S+?)%\s*T \1:\s*(\S+)\s*\*C')
+_patron_puerta = re.compile(r'Puerta:\s*(\S+)')
+_columnas_sensor = {'Int': ('HInt', 'TInt'), 'Ext': ('HExt', 'TExterio')}
+
+
+def parsear_linea(linea: str, columnas=columnas_serie) -> Optional[Tuple[float, ...]]:
+    """Parse one reading printed by DHT22.ino over Serial.
+
+    :param linea: one line of the serial stream.
+    :param columnas: columns wanted; sensors missing from the line are NaN
+            and sensors not asked for are skipped.
+    :return: readings in the order of ``columnas``, or None for status
+            lines ("Iniciando programa...", SD errors) and garbled lines. A
+            failed sensor read prints ``nan`` and is kept as NaN.
+    """
+    puerta = _patron_puerta.search(linea)
+    sensores = _patron_sensor.findall(linea)
+    if puerta is None or not sensores:
+        return None
+    try:
+        valores = {'Puerta': float(puerta.group(1))}
+        for nombre, humedad, temperatura in sensores:
+            col_h, col_t = _columnas_sensor.get(nombre, (f'H{nombre}', f'T{nombre}'))
+            valores[col_h] = float(humedad)
+            valores[col_t] = float(temperatura)
+    except ValueError:
+        return None
+    return tuple(valores.get(col, np.nan) for col in columnas)
+
+
+class BufferCircular:
+    """Fixed-size ring buffer of the latest readings, in NumPy arrays.
+
+    Memory does not grow with the session: once full, each new reading
+    overwrites the oldest one. Rows are numbered from the start of the
+    session so a consumer can ask only for what it has not seen yet.
+
+    :param capacidad: number of readings kept.
+    :param columnas: reading columns.
+    """
+
+    def __init__(self, capacidad: int, columnas=columnas_serie):
+        if capacidad < 1:
+            raise ValueError(f'capacidad debe ser mayor a 0, no {capacidad}')
+        self.capacidad = capacidad
+        self.columnas = list(columnas)
+        # tiempo en ms desde epoch, como lo usa bokeh en el eje datetime
+        self.tiempo = np.zeros(capacidad, dtype='float64')
+        self.valores = np.full((capacidad, len(self.columnas)), np.nan,
+                               dtype='float32')
+        self.total = 0
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    def agregar(self, tiempo_ms: float, valores):
+        """Store one reading, overwriting the oldest when full."""
+        i = self.total % self.capacidad
+        self.tiempo[i] = tiempo_ms
+        self.valores[i] = valores
+        self.total += 1
+
+    def desde(self, fila: int = 0) -> Dict[str, np.ndarray]:
+        """Readings from row number ``fila`` (session count) on, in time order.
+
+        Rows already overwritten are skipped.
+
+        :param fila: first row wanted, e.g. the previous value of :attr:`total`.
+        :return: dictionary column -> array, with 'Tiempo' in ms.
+        """
+        fila = max(fila, self.total - self.capacidad, 0)
+        pos = np.arange(fila, self.total) % self.capacidad
+        datos = {'Tiempo': self.tiempo[pos]}
+        for j, col in enumerate(self.columnas):
+            datos[col] = self.valores[pos, j]
+        return datos
+
+
+def abrir_fuente(fuente: str, baudios: int = 9600):
+    """Open the serial port, pty or replay file the readings come from.
+
+    A regular file is read as a recorded session (file replay); anything
+    else (COM3, /dev/ttyACM0, /dev/pts/4) is opened with pyserial.
+
+    :return: object with ``readline()`` returning bytes, and ``close()``.
+    """
+    if os.path.isfile(fuente):
+        return open(fuente, 'rb')
+    try:
+        import serial
+    except ImportError:
+        raise ImportError('Leer el puerto serie requiere el paquete pyserial '
+                          '(pip install pyserial)')
+    return serial.Serial(fuente, baudios, timeout=1)
+
+
+async def ingerir(fuente: str, buffer: BufferCircular, baudios: int = 9600,
+                  pausa: float = None):
+    """Read readings from ``fuente`` into ``buffer`` until it ends.
+
+    ``readline`` blocks, so it runs in the default executor and the event
+    loop (and the Bokeh server on it) stays responsive. The buffer is only
+    written from the loop, so the document callbacks need no locks.
+
+    :param fuente: see :func:`abrir_fuente`.
+    :param buffer: where readings are stored, stamped with the arrival time
+            (the firmware does not send the RTC time over Serial).
+    :param baudios: serial speed, 9600 in DHT22.ino.
+    :param pausa: seconds to wait between replayed lines; None replays a
+            file as fast as possible. Not used for serial ports or ptys.
+    """
+    loop = asyncio.get_running_loop()
+    puerto = abrir_fuente(fuente, baudios)
+    repeticion = os.path.isfile(fuente)
+    logger = getLogger(__name__)
+    try:
+        while True:
+            linea = await loop.run_in_executor(None, puerto.readline)
+            if not linea:
+                if repeticion:
+                    break
+                continue  # timeout del puerto serie
+            valores = parsear_linea(linea.decode('ascii', errors='replace'),
+                                    buffer.columnas)
+            if valores is None:
+                logger.debug('linea ignorada: %r', linea)
+                continue
+            buffer.agregar(time.time() * 1000, valores)
+            if repeticion and pausa:
+                await asyncio.sleep(pausa)
+    finally:
+        puerto.close()
+
+
+def documento(doc, buffer: BufferCircular, rollover: int = None,
+              periodo_ms: int = 1000):
+    """Fill a Bokeh server document that follows ``buffer``.
+
+    Every ``periodo_ms`` only the readings added since the last update are
+    sent with ``ColumnDataSource.stream``; the browser keeps at most
+    ``rollover`` points.
+
+    :param doc: document of the Bokeh server session.
+    :param buffer: buffer filled by :func:`ingerir`.
+    :param rollover: points kept in the browser; default the buffer capacity.
+    :param periodo_ms: update period.
+    """
+    from bokeh.models import ColumnDataSource, FuncTickFormatter, HoverTool, Range1d
+    from bokeh.plotting import figure
+    from graficar import estilo, estilos
+
+    rollover = rollover or buffer.capacidad
+    source = ColumnDataSource(buffer.desde(max(buffer.total - rollover, 0)))
+    visto = [buffer.total]
+
+    us = figure(title="Medición en vivo", plot_height=500, plot_width=1200,
+                x_axis_type="datetime", min_border=10, y_range=Range1d())
+    us.extra_y_ranges = {"foo": Range1d(start=0, end=100)}
+    lineas = [col for col in estilos if col in buffer.columnas] + [col for col in buffer.columnas if col not in estilos]
+    for i, col in enumerate(lineas):
+        color, leyenda, _ = estilo(col, i)
+        us.line('Tiempo', col, color=color, y_range_name="foo", legend_label=leyenda, source=source)
+    us.xaxis.ticker.desired_num_ticks = 10
+    us.yaxis.ticker.desired_num_ticks = 10
+    us.yaxis.formatter = FuncTickFormatter(code="""return Math.floor(tick*100)""")
+    us.legend.location = "top_right"
+    us.legend.click_policy = "hide"
+    us.add_tools(HoverTool(tooltips=[('Fecha', '$data_x{%F %T}')] +
+                           [(estilo(col, i)[2], '@' + col) for i, col in enumerate(lineas)],
+                           formatters={'$data_x': 'datetime'}))
+
+    def actualizar():
+        if buffer.total > visto[0]:
+            source.stream(buffer.desde(visto[0]), rollover=rollover)
+            visto[0] = buffer.total
+
+    doc.add_periodic_callback(actualizar, periodo_ms)
+    doc.add_root(us)
+    doc.title = "DataLogger en vivo"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Graficar en vivo las lecturas del puerto serie')
+    parser.add_argument('puerto', type=str, help='Puerto serie (ej. COM3, /dev/ttyACM0), pty o archivo grabado para repetir')
+    parser.add_argument('-b', '--baudios', type=int, default=9600, help='Velocidad del puerto (default: 9600)')
+    parser.add_argument('--sensores', type=int, default=2, help='Sensores DHT22 conectados al logger (default: 2)')
+    parser.add_argument('--capacidad', type=int, default=43200, help='Lecturas guardadas en memoria (default: 43200, 24 h cada 2 s)')
+    parser.add_argument('--rollover', type=int, default=None, help='Puntos que conserva el navegador (default: --capacidad)')
+    parser.add_argument('--periodo', type=int, default=1000, help='Actualizacion del grafico en ms (default: 1000)')
+    parser.add_argument('--pausa', type=float, default=2.0, help='Segundos entre lineas al repetir un archivo (default: 2)')
+    parser.add_argument('--http', type=int, default=5006, help='Puerto del servidor Bokeh (default: 5006)')
+    args = parser.parse_args()
+
+    from bokeh.server.server import Server
+    from tornado.ioloop import IOLoop
+
+    buffer = BufferCircular(args.capacidad, nombres_lecturas(args.sensores) + ['Puerta'])
+    server = Server({'/': lambda doc: documento(doc, buffer, args.rollover, args.periodo)},
+                    io_loop=IOLoop.current(), port=args.http)
+    server.start()
+
+    async def leer():
+        try:
+            await ingerir(args.puerto, buffer, args.baudios, args.pausa)
+        finally:
+            print(f'Fin de {args.puerto}: {buffer.total} lecturas')
+
+    server.io_loop.add_callback(leer)
+    print(f'Leyendo {args.puerto}, grafico en http://localhost:{args.http}/')
+    server.io_loop.add_callback(server.show, '/')
+    server.io_loop.start()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,550 @@
+# estadisticas.py
+# Estadisticas de los datos del logger (ciclos bajo umbral, resumenes)
+
+from logging import getLogger, NullHandler
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+
+def _flotante(valores) -> np.ndarray:
+    # thresholds are compared in the precision of the readings, so that a
+    # float32 reading of -15.0 is not below the threshold -15
+    v = np.asarray(valores)
+    return v if v.dtype.kind == 'f' else v.astype('float64')
+
+
+def ciclos_bajo_umbral(tiempo: Union[pd.Series, np.ndarray],
+                       valores: Union[pd.Series, np.ndarray],
+                       umbrales: Iterable[float]) -> pd.DataFrame:
+    """Find every run of consecutive samples below each threshold.
+
+    All thresholds are evaluated together on a (thresholds x samples) boolean
+    matrix; run edges come from a single ``diff`` over it, so there is no
+    Python loop over samples or cycles. Positions are used throughout, so
+    the result does not depend on the index of the input (e.g. after
+    ``dropna``).
+
+    Every sample stands for the time until the next one, so a cycle lasts
+    from its first sample below until the first sample back above (a one
+    sample cycle is one sampling interval, not 0 s), or until the last
+    sample when the series ends below. :class:`PerfilExcedencia` credits
+    samples the same way, so both give the same time below a threshold.
+
+    :param tiempo: timestamps of the samples, sorted.
+    :param valores: readings, same length as tiempo. NaN counts as not below.
+    :param umbrales: thresholds; a sample is below when ``valor < umbral``.
+    :return: one row per cycle with columns umbral, inicio, fin (timestamp of
+            the first and last sample below), duracion (from inicio to the
+            first sample back above, or to fin at the end of the series),
+            muestras (samples in the cycle), posicion_inicio and posicion_fin
+            (positions of the first and one past the last sample).
+    """
+    t = np.asarray(tiempo, dtype='datetime64[ns]')
+    v = _flotante(valores)
+    u = np.asarray(list(umbrales), dtype='float64')
+    if not len(u) or not len(v):
+        return pd.DataFrame({'umbral': np.array([], dtype='float64'),
+                             'inicio': np.array([], dtype='datetime64[ns]'),
+                             'fin': np.array([], dtype='datetime64[ns]'),
+                             'duracion': np.array([], dtype='timedelta64[ns]'),
+                             'muestras': np.array([], dtype='int64'),
+                             'posicion_inicio': np.array([], dtype='int64'),
+                             'posicion_fin': np.array([], dtype='int64')})
+    with np.errstate(invalid='ignore'):
+        bajo = v[np.newaxis, :] < u.astype(v.dtype)[:, np.newaxis]
+    # pad with False on both sides so every run has a rising and falling edge
+    borde = np.zeros((len(u), 1), dtype='int8')
+    cambios = np.diff(np.hstack([borde, bajo.view('int8'), borde]), axis=1)
+    # nonzero walks row by row, so starts and ends pair up per threshold
+    fila, ini = np.nonzero(cambios == 1)
+    _, fin = np.nonzero(cambios == -1)
+    return pd.DataFrame({'umbral': u[fila],
+                         'inicio': t[ini],
+                         'fin': t[fin - 1],
+                         'duracion': t[np.minimum(fin, len(t) - 1)] - t[ini],
+                         'muestras': fin - ini,
+                         'posicion_inicio': ini,
+                         'posicion_fin': fin})
+
+
+def resumen_umbrales(ciclos: pd.DataFrame, umbrales: Iterable[float],
+                     total_muestras: int) -> pd.DataFrame:
+    """Summarise the output of :func:`ciclos_bajo_umbral` per threshold.
+
+    :param ciclos: cycles as returned by :func:`ciclos_bajo_umbral`.
+    :param umbrales: thresholds to report, including those without cycles.
+    :param total_muestras: number of samples the cycles were computed on.
+    :return: data frame indexed by umbral with columns ciclos (count),
+            tiempo_total (sum of durations), muestras (samples below) and
+            porcentaje (share of samples below, 0-100).
+    """
+    u = pd.unique(np.asarray(list(umbrales), dtype='float64'))
+    pos = pd.Index(u).get_indexer(ciclos['umbral'].values)
+    n = len(u)
+    cuenta = np.bincount(pos, minlength=n)
+    # integer sums: float weights in bincount lose ns precision past ~100 days
+    sumas = (pd.DataFrame({'muestras': ciclos['muestras'].values,
+                           'duracion': ciclos['duracion'].values.astype('int64')})
+             .groupby(pos).sum()
+             .reindex(range(n), fill_value=0))
+    muestras = sumas['muestras'].values
+    duracion = sumas['duracion'].values
+    porcentaje = (muestras / total_muestras * 100 if total_muestras
+                  else np.zeros(n))
+    return pd.DataFrame({'ciclos': cuenta,
+                         'tiempo_total': pd.to_timedelta(duracion, unit='ns'),
+                         'muestras': muestras,
+                         'porcentaje': porcentaje},
+                        index=pd.Index(u, name='umbral'))
+
+
+class AcumuladorCiclos:
+    """Below-threshold cycles of a series read in consecutive chunks.
+
+    Gives the same result as :func:`resumen_umbrales` over the whole series
+    while holding one chunk at a time: a cycle still open at the end of a
+    chunk is carried over and joined with the first cycle of the next one,
+    or closed at the first sample of the next chunk.
+
+    :param umbrales: thresholds; a sample is below when ``valor < umbral``.
+    """
+
+    def __init__(self, umbrales: Iterable[float]):
+        self.umbrales = pd.unique(np.asarray(list(umbrales), dtype='float64'))
+        n = len(self.umbrales)
+        self.ciclos = np.zeros(n, dtype='int64')
+        self.muestras = np.zeros(n, dtype='int64')
+        self.ns = np.zeros(n, dtype='int64')
+        self.total_muestras = 0
+        # (inicio, hasta, muestras) del ciclo que toca el final de la parte
+        # anterior; hasta es su ultima muestra mientras no llegue la siguiente
+        self._abiertos = [None] * n
+
+    def _cerrar(self, i, inicio, hasta, muestras):
+        self.ciclos[i] += 1
+        self.ns[i] += int(hasta - inicio)
+        self.muestras[i] += muestras
+
+    def agregar(self, tiempo: Union[pd.Series, np.ndarray],
+                valores: Union[pd.Series, np.ndarray]):
+        """Add the next chunk (in time order) of the series."""
+        n = len(valores)
+        if not n:
+            return
+        ciclos = ciclos_bajo_umbral(tiempo, valores, self.umbrales)
+        fila = pd.Index(self.umbrales).get_indexer(ciclos['umbral'].values)
+        inicio = ciclos['inicio'].values.astype('int64')
+        hasta = inicio + ciclos['duracion'].values.astype('int64')
+        primera = np.asarray(tiempo, dtype='datetime64[ns]')[:1].astype('int64')[0]
+        muestras = ciclos['muestras'].values
+        pos_ini = ciclos['posicion_inicio'].values
+        pos_fin = ciclos['posicion_fin'].values
+        # cycles are grouped by threshold, in threshold order
+        limites = np.searchsorted(fila, np.arange(len(self.umbrales) + 1))
+        for i in range(len(self.umbrales)):
+            a, b = limites[i], limites[i + 1]
+            abierto = self._abiertos[i]
+            if abierto is not None:
+                if b > a and pos_ini[a] == 0:
+                    inicio[a] = abierto[0]
+                    muestras[a] += abierto[2]
+                else:
+                    # la primera muestra de esta parte ya esta por encima
+                    self._cerrar(i, abierto[0], primera, abierto[2])
+                self._abiertos[i] = None
+            if b > a and pos_fin[b - 1] == n:
+                b -= 1
+                self._abiertos[i] = (inicio[b], hasta[b], int(muestras[b]))
+            self.ciclos[i] += b - a
+            self.ns[i] += int((hasta[a:b] - inicio[a:b]).sum())
+            self.muestras[i] += int(muestras[a:b].sum())
+        self.total_muestras += n
+
+    def resumen(self) -> pd.DataFrame:
+        """Same table as :func:`resumen_umbrales`, closing any open cycle."""
+        ciclos, muestras, ns = (self.ciclos.copy(), self.muestras.copy(),
+                                self.ns.copy())
+        for i, abierto in enumerate(self._abiertos):
+            if abierto is not None:
+                ciclos[i] += 1
+                ns[i] += int(abierto[1] - abierto[0])
+                muestras[i] += abierto[2]
+        porcentaje = (muestras / self.total_muestras * 100
+                      if self.total_muestras else np.zeros(len(ciclos)))
+        return pd.DataFrame({'ciclos': ciclos,
+                             'tiempo_total': pd.to_timedelta(ns, unit='ns'),
+                             'muestras': muestras,
+                             'porcentaje': porcentaje},
+                            index=pd.Index(self.umbrales, name='umbral'))
+
+
+class AcumuladorEstadisticas:
+    """Summary statistics of the log in a single pass, chunk by chunk.
+
+    Every chunk is scanned once for all columns together: count, NaN count,
+    mean and variance (Welford's update, merged per chunk with Chan's
+    formula so the loop stays in NumPy), minimum and maximum with the row
+    and timestamp where they occur, the time span and the below-threshold
+    cycles of one column. Feeding a whole frame once gives the same result
+    as feeding it in consecutive chunks.
+
+    Counts, means, variances, extremes, the span and the cycles use only
+    complete rows, the ones :func:`lectura.limpiar_log` keeps and the plot
+    shows. ``nan`` is the data-quality count apart from them: NaN readings
+    of each column over all the rows fed, including the dropped ones.
+    Ties in min/max keep the earliest row, as ``idxmin``/``idxmax`` do.
+
+    :param columnas: reading columns to summarise.
+    :param umbrales: thresholds for :class:`AcumuladorCiclos`.
+    :param columna_umbral: column the thresholds apply to.
+    :param xvar: name of the datetime column.
+    :param solo_completas: per-column figures from complete rows only.
+            False uses every non-NaN reading of each column, for frames
+            where NaN is expected (e.g. loggers aligned by combinar.py).
+    """
+
+    def __init__(self, columnas: Iterable[str] = ('TInt', 'HInt',
+                                                  'TExterio', 'HExt'),
+                 umbrales: Iterable[float] = (),
+                 columna_umbral: str = 'TInt', xvar: str = 'Tiempo',
+                 solo_completas: bool = True):
+        self.columnas = list(columnas)
+        self.columna_umbral = columna_umbral
+        self.xvar = xvar
+        self.solo_completas = solo_completas
+        k = len(self.columnas)
+        self.total_filas = 0
+        self.filas_completas = 0
+        self.muestras = np.zeros(k, dtype='int64')
+        self.nan = np.zeros(k, dtype='int64')
+        self.media = np.zeros(k)
+        self._m2 = np.zeros(k)
+        self.minimo = np.full(k, np.inf)
+        self.maximo = np.full(k, -np.inf)
+        self.filas_minimo = {col: None for col in self.columnas}
+        self.filas_maximo = {col: None for col in self.columnas}
+        self.inicio = self.fin = None
+        self.ciclos = AcumuladorCiclos(umbrales)
+
+    def agregar(self, parte: pd.DataFrame):
+        """Add the next chunk (in time order) of the raw log, before dropna."""
+        if not len(parte):
+            return
+        self.total_filas += len(parte)
+        completas = parte.notna().all(axis=1).to_numpy()
+        x = parte[self.columnas].to_numpy(dtype='float64')
+        self.nan += np.isnan(x).sum(axis=0)
+        # las mismas filas que limpiar_log deja para el grafico
+        filas = np.flatnonzero(completas) if self.solo_completas else np.arange(len(x))
+        x = x[filas]
+        validos = ~np.isnan(x)
+        n = validos.sum(axis=0)
+        hay = n > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            media = np.where(hay, np.where(validos, x, 0).sum(axis=0) / n, 0)
+            m2 = np.where(validos, x - media, 0)
+            m2 = (m2 * m2).sum(axis=0)
+        # Chan: combinar (muestras, media, m2) de lo acumulado y de la parte
+        total = self.muestras + n
+        delta = media - self.media
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.media = np.where(hay, self.media + delta * n / total, self.media)
+            self._m2 = np.where(hay, self._m2 + m2 + delta * delta * self.muestras * n / total,
+                                self._m2)
+        self.muestras = total
+
+        # extremos: la primera posicion gana en los empates
+        if len(x):
+            pos_min = np.where(validos, x, np.inf).argmin(axis=0)
+            pos_max = np.where(validos, x, -np.inf).argmax(axis=0)
+            columnas = np.arange(len(self.columnas))
+            for i in np.flatnonzero(hay & (x[pos_min, columnas] < self.minimo)):
+                self.minimo[i] = x[pos_min[i], i]
+                self.filas_minimo[self.columnas[i]] = parte.iloc[filas[pos_min[i]]]
+            for i in np.flatnonzero(hay & (x[pos_max, columnas] > self.maximo)):
+                self.maximo[i] = x[pos_max[i], i]
+                self.filas_maximo[self.columnas[i]] = parte.iloc[filas[pos_max[i]]]
+
+        if completas.any():
+            tiempo = parte[self.xvar].to_numpy()[completas]
+            self.filas_completas += len(tiempo)
+            if self.inicio is None:
+                self.inicio = pd.Timestamp(tiempo[0])
+            self.fin = pd.Timestamp(tiempo[-1])
+            self.ciclos.agregar(tiempo,
+                                parte[self.columna_umbral].to_numpy()[completas])
+
+    @property
+    def varianza(self) -> np.ndarray:
+        """Sample variance (ddof=1) of each column; NaN below two readings."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.muestras > 1,
+                            self._m2 / (self.muestras - 1), np.nan)
+
+    @property
+    def duracion(self) -> pd.Timedelta:
+        """Time between the first and the last complete row."""
+        if self.inicio is None:
+            return pd.Timedelta(0)
+        return self.fin - self.inicio
+
+    def resumen(self) -> pd.DataFrame:
+        """Per-column table of the statistics gathered so far.
+
+        :return: data frame indexed by column with muestras, nan, media,
+                varianza, desviacion, minimo, tiempo_minimo, maximo and
+                tiempo_maximo.
+        """
+        hay = self.muestras > 0
+
+        def tiempos(filas):
+            return pd.to_datetime([filas[col][self.xvar] if filas[col] is not None
+                                   else pd.NaT for col in self.columnas])
+
+        varianza = self.varianza
+        return pd.DataFrame({'muestras': self.muestras,
+                             'nan': self.nan,
+                             'media': np.where(hay, self.media, np.nan),
+                             'varianza': varianza,
+                             'desviacion': np.sqrt(varianza),
+                             'minimo': np.where(hay, self.minimo, np.nan),
+                             'tiempo_minimo': tiempos(self.filas_minimo),
+                             'maximo': np.where(hay, self.maximo, np.nan),
+                             'tiempo_maximo': tiempos(self.filas_maximo)},
+                            index=pd.Index(self.columnas, name='columna'))
+
+
+def bordes_lectura(columna: str, paso: float = None) -> np.ndarray:
+    """Fixed histogram edges of a reading column over the DHT22 range.
+
+    Temperatures (T...) cover -40 to 80 degC, humidities (H...) 0 to 100 %,
+    so histograms of any chunk, file or logger share their bins.
+
+    :param columna: reading column, e.g. 'TInt', 'H3'.
+    :param paso: bin width. Default 0.5 degC or 1 %.
+    """
+    inicio, fin, paso_default = (-40, 80, 0.5) if columna.startswith('T') else (0, 100, 1)
+    paso = paso or paso_default
+    return np.linspace(inicio, fin, int(round((fin - inicio) / paso)) + 1)
+
+
+class AcumuladorHistogramas:
+    """Histograms of several columns with fixed edges, chunk by chunk.
+
+    Counts with fixed edges add up, so a file can be fed in any number of
+    chunks and the accumulators of several files or worker processes can be
+    merged with :meth:`fusionar`; the result is the same as one
+    ``numpy.histogram`` over all the readings with those edges. Every chunk
+    is read once for all columns. Bins are closed on the left except the
+    last one, as in ``numpy.histogram``; readings outside the edges are
+    counted apart and NaN readings are skipped.
+
+    :param columnas: reading columns.
+    :param bordes: edges per column. Default :func:`bordes_lectura`.
+    """
+
+    def __init__(self, columnas: Iterable[str] = ('TInt', 'HInt',
+                                                  'TExterio', 'HExt'),
+                 bordes: Dict[str, Sequence[float]] = None):
+        bordes = bordes or {}
+        self.columnas = list(columnas)
+        self.bordes = {col: np.asarray(bordes[col], dtype='float64') if col in bordes
+                       else bordes_lectura(col) for col in self.columnas}
+        for col, b in self.bordes.items():
+            if len(b) < 2 or (np.diff(b) <= 0).any():
+                raise ValueError(f'los bordes de {col} deben ser crecientes')
+        # por columna: [debajo, cubetas..., encima]
+        self._conteos = {col: np.zeros(len(b) + 1, dtype='int64')
+                         for col, b in self.bordes.items()}
+        self.nan = {col: 0 for col in self.columnas}
+
+    def agregar(self, parte: pd.DataFrame):
+        """Add a chunk; order does not matter."""
+        if not len(parte):
+            return
+        x = parte[self.columnas].to_numpy(dtype='float64')
+        for j, col in enumerate(self.columnas):
+            b = self.bordes[col]
+            v = x[:, j]
+            v = v[~np.isnan(v)]
+            self.nan[col] += len(x) - len(v)
+            # 0 debajo, 1..n cubetas, n + 1 encima; el borde final va a la ultima cubeta
+            pos = np.searchsorted(b, v, side='right')
+            pos[v == b[-1]] = len(b) - 1
+            self._conteos[col] += np.bincount(pos, minlength=len(b) + 1)
+
+    def fusionar(self, otro: 'AcumuladorHistogramas') -> 'AcumuladorHistogramas':
+        """Add the counts of another accumulator (another file or process).
+
+        Columns only in ``otro`` are added, e.g. a logger with more sensors.
+        """
+        for col in otro.columnas:
+            if col not in self.bordes:
+                self.columnas.append(col)
+                self.bordes[col] = otro.bordes[col]
+                self._conteos[col] = np.zeros_like(otro._conteos[col])
+                self.nan[col] = 0
+            elif not np.array_equal(self.bordes[col], otro.bordes[col]):
+                raise ValueError(f'no se pueden fusionar histogramas de {col} con bordes distintos')
+            self._conteos[col] += otro._conteos[col]
+            self.nan[col] += otro.nan[col]
+        return self
+
+    def fuera_de_rango(self, columna: str) -> Tuple[int, int]:
+        """Readings below the first edge and above the last one."""
+        conteos = self._conteos[columna]
+        return int(conteos[0]), int(conteos[-1])
+
+    def histogramas(self, recortar: bool = True) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Counts and edges per column, as returned by ``numpy.histogram``.
+
+        :param recortar: drop the empty bins at both ends, so a fixed
+                -40 to 80 degC range does not squeeze the plot.
+        """
+        resultado = {}
+        for col in self.columnas:
+            conteos, bordes = self._conteos[col][1:-1], self.bordes[col]
+            llenas = np.flatnonzero(conteos)
+            if recortar and len(llenas):
+                a, b = llenas[0], llenas[-1] + 1
+                conteos, bordes = conteos[a:b], bordes[a:b + 1]
+            resultado[col] = (conteos.copy(), bordes.copy())
+        return resultado
+
+
+class PerfilExcedencia:
+    """Sorted view of one column answering time-below/above queries in O(log n).
+
+    The readings are sorted once together with the time each sample stands
+    for (the interval until the next sample, 0 for the last one). After that
+    any list of thresholds, e.g. a dense 0.1 degC sweep, costs one
+    ``searchsorted``. Without ``hueco_max`` the time below a threshold is
+    the total duration of :func:`ciclos_bajo_umbral` cycles.
+
+    :param tiempo: timestamps of the samples, sorted.
+    :param valores: readings, same length as tiempo. NaN samples are ignored.
+    :param hueco_max: intervals longer than this (logger off, card removed)
+            are not credited to the previous reading. Default None, no limit.
+    """
+
+    def __init__(self, tiempo: Union[pd.Series, np.ndarray],
+                 valores: Union[pd.Series, np.ndarray],
+                 hueco_max: pd.Timedelta = None):
+        t = np.asarray(tiempo, dtype='datetime64[ns]').astype('int64')
+        v = _flotante(valores)
+        dt = np.diff(t, append=t[-1:]) if len(t) else t
+        if hueco_max is not None:
+            dt = np.where(dt > pd.Timedelta(hueco_max).value, 0, dt)
+        validos = ~np.isnan(v)
+        orden = np.argsort(v[validos], kind='mergesort')
+        self.valores = v[validos][orden]
+        # una muestra abre un ciclo bajo u si valor < u <= anterior (NaN y el
+        # principio cuentan como +inf), asi que los ciclos bajo u son
+        # #(valor < u) - #(max(valor, anterior) < u)
+        anterior = np.concatenate([[np.inf], v[:-1]]).astype(v.dtype)
+        anterior[np.isnan(anterior)] = np.inf
+        self._picos = np.sort(np.maximum(v, anterior)[validos])
+        # acumulados con un cero inicial: acumulado[k] = suma de los k menores
+        self._muestras = np.arange(len(self.valores) + 1)
+        self._ns = np.concatenate([[0], np.cumsum(dt[validos][orden])])
+        self.total_muestras = len(self.valores)
+        self.nan = int((~validos).sum())
+
+    @property
+    def tiempo_total(self) -> pd.Timedelta:
+        """Time covered by the non-NaN samples."""
+        return pd.Timedelta(int(self._ns[-1]), unit='ns')
+
+    def _posicion(self, umbrales, lado):
+        return np.searchsorted(self.valores,
+                               np.asarray(umbrales, dtype=self.valores.dtype),
+                               side=lado)
+
+    def muestras_bajo(self, umbrales: Union[float, Sequence[float]]):
+        """Number of samples with ``valor < umbral`` for each threshold."""
+        return self._muestras[self._posicion(umbrales, 'left')]
+
+    def muestras_sobre(self, umbrales: Union[float, Sequence[float]]):
+        """Number of samples with ``valor > umbral`` for each threshold."""
+        return self.total_muestras - self._muestras[
+            self._posicion(umbrales, 'right')]
+
+    def tiempo_bajo(self, umbrales: Union[float, Sequence[float]]):
+        """Time with ``valor < umbral`` for each threshold, as timedelta64."""
+        return self._ns[self._posicion(umbrales, 'left')].astype(
+            'timedelta64[ns]')
+
+    def tiempo_sobre(self, umbrales: Union[float, Sequence[float]]):
+        """Time with ``valor > umbral`` for each threshold, as timedelta64."""
+        return (self._ns[-1] - self._ns[self._posicion(umbrales, 'right')]
+                ).astype('timedelta64[ns]')
+
+    def ciclos_bajo(self, umbrales: Union[float, Sequence[float]]):
+        """Number of :func:`ciclos_bajo_umbral` cycles for each threshold."""
+        return self.muestras_bajo(umbrales) - np.searchsorted(
+            self._picos, np.asarray(umbrales, dtype=self._picos.dtype), side='left')
+
+    def porcentaje_bajo(self, umbrales: Union[float, Sequence[float]]):
+        """Share of samples below each threshold, 0-100."""
+        if not self.total_muestras:
+            return np.zeros(np.shape(umbrales))
+        return self.muestras_bajo(umbrales) / self.total_muestras * 100
+
+    def perfil(self, umbrales: Sequence[float]) -> pd.DataFrame:
+        """Table of samples, time and share below each threshold.
+
+        :param umbrales: thresholds, e.g. ``numpy.arange(-20, 0, 0.1)``.
+        :return: data frame indexed by umbral.
+        """
+        umbrales = np.asarray(umbrales, dtype='float64')
+        return pd.DataFrame({'muestras': self.muestras_bajo(umbrales),
+                             'tiempo': self.tiempo_bajo(umbrales),
+                             'porcentaje': self.porcentaje_bajo(umbrales)},
+                            index=pd.Index(umbrales, name='umbral'))
+
+    def resumen(self, umbrales: Iterable[float]) -> pd.DataFrame:
+        """Same table as :func:`resumen_umbrales` over the whole series.
+
+        Cycles, samples, time and share below every threshold come from the
+        sorted arrays, without the (thresholds x samples) matrix of
+        :func:`ciclos_bajo_umbral`. The share is over all the samples,
+        NaN included, as in :func:`resumen_umbrales`.
+        """
+        u = pd.unique(np.asarray(list(umbrales), dtype='float64'))
+        muestras = self.muestras_bajo(u)
+        total = self.total_muestras + self.nan
+        return pd.DataFrame({'ciclos': self.ciclos_bajo(u),
+                             'tiempo_total': pd.to_timedelta(self.tiempo_bajo(u)),
+                             'muestras': muestras,
+                             'porcentaje': muestras / total * 100 if total else np.zeros(len(u))},
+                            index=pd.Index(u, name='umbral'))
+
+
+def perfiles_excedencia(df: pd.DataFrame,
+                        columnas: Iterable[str] = ('TInt', 'HInt',
+                                                   'TExterio', 'HExt'),
+                        xvar: str = 'Tiempo',
+                        hueco_max: pd.Timedelta = None
+                        ) -> Dict[str, PerfilExcedencia]:
+    """Build a :class:`PerfilExcedencia` for each reading column.
+
+    :param df: logger data with a datetime column.
+    :param columnas: reading columns to index.
+    :param xvar: name of the datetime column.
+    :param hueco_max: see :class:`PerfilExcedencia`.
+    :return: dictionary column name -> profile.
+    """
+    return {col: PerfilExcedencia(df[xvar], df[col], hueco_max=hueco_max)
+            for col in columnas}
+
+
+def formato_duracion(duracion: pd.Timedelta) -> str:
+    """Format a duration as HH:MM:SS with hours beyond 24 (e.g. 53:07:12)."""
+    segundos = int(pd.Timedelta(duracion).total_seconds())
+    horas, resto = divmod(segundos, 3600)
+    return f'{horas:02d}:{resto // 60:02d}:{resto % 60:02d}'
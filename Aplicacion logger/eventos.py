@@ -0,0 +1,126 @@
+# eventos.py
+# Aperturas de puerta: episodios, suba de TInt, recuperacion y costo termico
+
+from logging import getLogger, NullHandler
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from estadisticas import _flotante
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+
+def _vacio() -> pd.DataFrame:
+    return pd.DataFrame({'inicio': np.array([], dtype='datetime64[ns]'),
+                         'fin': np.array([], dtype='datetime64[ns]'),
+                         'duracion': np.array([], dtype='timedelta64[ns]'),
+                         'temperatura_inicial': np.array([], dtype='float64'),
+                         'pico': np.array([], dtype='float64'),
+                         'aumento': np.array([], dtype='float64'),
+                         'recuperacion': np.array([], dtype='timedelta64[ns]'),
+                         'costo': np.array([], dtype='float64'),
+                         'posicion_inicio': np.array([], dtype='int64'),
+                         'posicion_fin': np.array([], dtype='int64')})
+
+
+def episodios_puerta(tiempo: Union[pd.Series, np.ndarray],
+                     puerta: Union[pd.Series, np.ndarray],
+                     temperatura: Union[pd.Series, np.ndarray],
+                     consigna: float = None,
+                     tolerancia: float = 0.2) -> pd.DataFrame:
+    """Find every door opening and its effect on the inside temperature.
+
+    An episode runs from the first sample with the door open to the first
+    sample with it closed again, and its effect lasts until the next
+    opening. Within that span the peak temperature, the time from closing
+    the door until the temperature is back at the setpoint and the thermal
+    cost (degree-hours above the setpoint) are computed with array
+    operations only (``diff``, ``reduceat``, cumulative sums), so there is
+    no Python loop over samples or episodes.
+
+    :param tiempo: timestamps of the samples, sorted.
+    :param puerta: door state, same length as tiempo; > 0 is open, NaN closed.
+    :param temperatura: TInt, same length as tiempo.
+    :param consigna: setpoint. Default None, the temperature of the sample
+            before each opening.
+    :param tolerancia: the temperature is back at the setpoint when it is
+            at most ``consigna + tolerancia``, to ignore sensor noise.
+    :return: one row per opening with columns inicio, fin (first closed
+            sample, or the last sample if the log ends open), duracion,
+            temperatura_inicial, pico, aumento (pico - temperatura_inicial),
+            recuperacion (NaT if the door opened again or the log ended
+            first), costo (degree-hours above the setpoint until recovery),
+            posicion_inicio and posicion_fin.
+    """
+    t = np.asarray(tiempo, dtype='datetime64[ns]')
+    v = _flotante(temperatura).astype('float64')
+    n = len(t)
+    abierta = np.asarray(puerta, dtype='float64') > 0
+    if not n or not abierta.any():
+        return _vacio()
+    cambios = np.diff(np.concatenate([[0], abierta.view('int8'), [0]]))
+    ini = np.flatnonzero(cambios == 1)
+    fin = np.flatnonzero(cambios == -1)
+    # cada episodio afecta hasta la proxima apertura
+    siguiente = np.append(ini[1:], n)
+
+    inicial = v[np.maximum(ini - 1, 0)]
+    umbral = (inicial if consigna is None else np.full(len(ini), float(consigna))) + tolerancia
+    pico = np.fmax.reduceat(v, ini)
+
+    # umbral de cada muestra segun el episodio al que pertenece
+    por_muestra = np.full(n, np.inf)
+    por_muestra[ini[0]:] = np.repeat(umbral, siguiente - ini)
+    with np.errstate(invalid='ignore'):
+        bien = v <= por_muestra
+    # primera muestra en o despues de i que volvio al umbral
+    proxima = np.where(bien, np.arange(n), n)
+    proxima = np.minimum.accumulate(proxima[::-1])[::-1]
+    recupera = proxima[np.minimum(fin, n - 1)]
+    recuperado = (recupera < siguiente) & (fin < n)
+    recuperacion = np.where(recuperado, t[np.minimum(recupera, n - 1)] - t[np.minimum(fin, n - 1)],
+                            np.timedelta64('NaT'))
+
+    # costo: integral de (temperatura - umbral)+ con el paso hasta la muestra siguiente
+    horas = np.append(np.diff(t).astype('int64'), 0) / 3.6e12
+    with np.errstate(invalid='ignore'):
+        exceso = np.where(v > por_muestra, v - por_muestra, 0) * horas
+    acumulado = np.concatenate([[0], np.cumsum(np.nan_to_num(exceso))])
+    hasta = np.where(recuperado, recupera, siguiente)
+    ultimo = np.minimum(fin, n) - 1
+    return pd.DataFrame({'inicio': t[ini],
+                         'fin': t[np.where(fin < n, fin, ultimo)],
+                         'duracion': t[np.where(fin < n, fin, ultimo)] - t[ini],
+                         'temperatura_inicial': inicial,
+                         'pico': pico,
+                         'aumento': pico - inicial,
+                         'recuperacion': recuperacion,
+                         'costo': acumulado[hasta] - acumulado[ini],
+                         'posicion_inicio': ini,
+                         'posicion_fin': fin})
+
+
+def resumen_diario_puerta(episodios: pd.DataFrame) -> pd.DataFrame:
+    """Summarise :func:`episodios_puerta` per calendar day of the opening.
+
+    :return: data frame indexed by dia with columns aperturas, minutos_abierta,
+            aumento_medio, aumento_maximo, recuperacion_media (minutes, over
+            the recovered episodes), sin_recuperar and costo (degree-hours).
+    """
+    dia = episodios['inicio'].dt.floor('D').rename('dia')
+    datos = pd.DataFrame({'minutos_abierta': episodios['duracion'].dt.total_seconds() / 60,
+                          'aumento': episodios['aumento'],
+                          'recuperacion': episodios['recuperacion'].dt.total_seconds() / 60,
+                          'sin_recuperar': episodios['recuperacion'].isna(),
+                          'costo': episodios['costo']})
+    grupos = datos.groupby(dia)
+    return pd.DataFrame({'aperturas': grupos.size(),
+                         'minutos_abierta': grupos['minutos_abierta'].sum(),
+                         'aumento_medio': grupos['aumento'].mean(),
+                         'aumento_maximo': grupos['aumento'].max(),
+                         'recuperacion_media': grupos['recuperacion'].mean(),
+                         'sin_recuperar': grupos['sin_recuperar'].sum(),
+                         'costo': grupos['costo'].sum()})
@@ -6,175 +6,505 @@ import pandas as pd
 import numpy as np
 import datetime
 import argparse
-from tracemalloc import start
 from bokeh import events
 from bokeh.plotting import show, figure, output_file
 from bokeh.layouts import column, row
-from bokeh.models import CustomJS, Div, Range1d, HoverTool, TextInput,ColumnDataSource,NumeralTickFormatter,FuncTickFormatter, Span
-from pandas import read_pickle
+from bokeh.palettes import Category20
+from bokeh.models import CustomJS, Div, Range1d, HoverTool, TextInput,NumeralTickFormatter,FuncTickFormatter, Span
 from itertools import chain
+from decimado import AcumuladorPiramide, decimar, metodos, niveles_html, niveles_piramide, piramide
+from estadisticas import AcumuladorEstadisticas, AcumuladorHistogramas, PerfilExcedencia, formato_duracion
+from eventos import episodios_puerta, resumen_diario_puerta
+from lectura import guardar_agregados, guardar_objeto, leer_agregados, leer_objeto, leer_log, leer_log_cache, leer_log_incremental, leer_log_por_partes, leer_log_rango, lecturas_de, limpiar_log, motores, posicion_limpia, columnas_log
+from plots import columnar_source, plot_histogram, plot_table, plots_to_grid, time_bars
+from remuestreo import AcumuladorRemuestreo, remuestrear, remuestrear_log
+
+
+valores_minimos_default = [-10, -12.5, -15, -17.5]
+
+LOGO = """<img style='display:block; width:200px;height:70px;' id='base64image'
+      src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAmoAAADICAYAAABYmc2zAAABN2lDQ1BBZG9iZSBSR0IgKDE5OTgpAAAokZWPv0rDUBSHvxtFxaFWCOLgcCdRUGzVwYxJW4ogWKtDkq1JQ5ViEm6uf/oQjm4dXNx9AidHwUHxCXwDxamDQ4QMBYvf9J3fORzOAaNi152GUYbzWKt205Gu58vZF2aYAoBOmKV2q3UAECdxxBjf7wiA10277jTG+38yH6ZKAyNguxtlIYgK0L/SqQYxBMygn2oQD4CpTto1EE9AqZf7G1AKcv8ASsr1fBBfgNlzPR+MOcAMcl8BTB1da4Bakg7UWe9Uy6plWdLuJkEkjweZjs4zuR+HiUoT1dFRF8jvA2AxH2w3HblWtay99X/+PRHX82Vun0cIQCw9F1lBeKEuf1UYO5PrYsdwGQ7vYXpUZLs3cLcBC7dFtlqF8hY8Dn8AwMZP/fNTP8gAAAAJcEhZcwAACxMAAAsTAQCanBgAAATtaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/PiA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJBZG9iZSBYTVAgQ29yZSA2LjAtYzAwMiA3OS4xNjQ0ODgsIDIwMjAvMDcvMTAtMjI6MDY6NTMgICAgICAgICI+IDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+IDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIgeG1sbnM6ZGM9Imh0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvIiB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIiB4bXA6Q3JlYXRvclRvb2w9IkFkb2JlIFBob3Rvc2hvcCAyMi4wIChXaW5kb3dzKSIgeG1wOkNyZWF0ZURhdGU9IjIwMjAtMTEtMjRUMTA6MDA6MzMtMDM6MDAiIHhtcDpNb2RpZnlEYXRlPSIyMDIwLTExLTI2VDE2OjQ4OjE5LTAzOjAwIiB4bXA6TWV0YWRhdGFEYXRlPSIyMDIwLTExLTI2VDE2OjQ4OjE5LTAzOjAwIiBkYzpmb3JtYXQ9ImltYWdlL3BuZyIgcGhvdG9zaG9wOkNvbG9yTW9kZT0iMyIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDpiNGE4ZDM5MS04MThjLTIxNDctOWVmMC01MGVmMDg4NDViOTciIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6YjRhOGQzOTEtODE4Yy0yMTQ3LTllZjAtNTBlZjA4ODQ1Yjk3IiB4bXBNTTpPcmlnaW5hbERvY3VtZW50SUQ9InhtcC5kaWQ6YjRhOGQzOTEtODE4Yy0yMTQ3LTllZjAtNTBlZjA4ODQ1Yjk3Ij4gPHhtcE1NOkhpc3Rvcnk+IDxyZGY6U2VxPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0iY3JlYXRlZCIgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDpiNGE4ZDM5MS04MThjLTIxNDctOWVmMC01MGVmMDg4NDViOTciIHN0RXZ0OndoZW49IjIwMjAtMTEtMjRUMTA6MDA6MzMtMDM6MDAiIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkFkb2JlIFBob3Rvc2hvcCAyMi4wIChXaW5kb3dzKSIvPiA8L3JkZjpTZXE+IDwveG1wTU06SGlzdG9yeT4gPC9yZGY6RGVzY3JpcHRpb24+IDwvcmRmOlJERj4gPC94OnhtcG1ldGE+IDw/eHBhY2tldCBlbmQ9InIiPz7al7fnAABRkElEQVR4nO3dfVxU55kw/uswvIdhRqKioyJWpQ5C5EUR0UXwjTrQYTITQ6UuaWO7trvaNbU2v237PKlp0l2TNck25knsbmxjLYmJkIEIFlFRoqxvIIqColYEHaMSYBheBgY4vz+YQw6HM+/nzJmB6/v5zEfmzJn7vhgG5+K673PfBEmSgBBCCCGEPI+P0AEghBBCCCF2mKghhBBCCHkoX6EDGI8GYmIUI3cIYi5BEHNG7vv4SAmCiLH0XEIkWsJ2nBwcvDhyzo0bRjAah2gPn2J5yqhjBEmynYMQQgghD0bgHDX7mBYujCIIYh74+IQRAAkAAIRI9AwAhJq/Zk2wOGcwADQ2utrKFQDoMH9da/66w/w1AEAtQZIdgBBCCCFBYaJGMxAToxhJxHx8ZhMEMQsIYibh4zNd6NhG1NUB9Pe7q7d7ANDEcsNEDiGEEHKDCZeomRYtmkwMDiaBSLSYIIhIgiBiCJFIDgAhQsdm09dfAzQ1CR0F3Wn4Jnk7BQBNBEk2CRcOQgghNL6M60TNFBu7jABYTBDEHEIkWuE1CZkl7q2mueI0DA+j1sJw9a1WyGAQQgghbzVuEjXTwoVRhEiURPj4rDJXydwzZ8xddDqAhw+FjsJZehhO2k4BwCm8sAEhhBCyj9cmaqbY2GWEj89aHx+fVCCIaI+aR8a1wUGAa9cABgaEjoRLVwBAC5i4IYQQQhZ5TaJGT8wIkWgpePMQpqO8u5pmDz0MV9u0AKDFCxUQQgihYR6bqJkWLZpMDA1tJESiNMLHZ9m4rphZ09cHcOPGeKum2VIEmLQhhBBCnpWomRYujCJ8fb/nIxLlEj4+3xY6Ho/Q1DR8tefE9REA/BmHRxFCCE1EgidqptjYZT4i0Y8JH5/vTNiqmSV9fcNz0xDA8JpuvyVI8s9CB4IQQgi5iyCJmmnRosk+JPkrwtf3e5icWXHnDkBHh9BReBpM2BBCCE0Ybk/UBhYt+r8iP7+dMJEuBnAGN1tFjWf3AOAHOCSKEEJoPHNbomZatGiyyMendNytb8aXxsbhZA3Z8l8wXGHrEDoQhBBCiGs+7ujEFBu7TCQSXcUkzU4GAyZp9vtXAKglCSJO6EAQQgghrvGeqJliY5f5BgQcw7loDvCs/Ty9wWwAOEUShEroQBBCCCEu8ZqoUUka4Hw0+339tbfs5+lpJADwOUkQaQLHgRBCCHGGt0TNtGjRZJGfXwFgkma/wcHhXQiQK7Q4DIoQQmi84C1RE4lEZ3C400GPHmE1zXUSAPgzSRBSoQNBCCGEXMVLojYYF7cfdxZw0OAgwJMnQkcxXiwCgN8KHQRCCCHkKs6X5xiIiVGIAgNLOG10Ihj/G68LIZ4gyVqhg0AIIYScxWlFzbRo0WQff///4bLNCaGvD5M0frwjdAAIIYSQKzhN1HwI4g2cl+YETNL4shKX7EAIIeTNOBv6xCFPJ+HG63y7R5BkpNBBIIQQQs7grKLm4+f3W67amlDu3RM6gvFuNlbVEEIIeStOErWB2NhtuD2UE3CrKHfZLnQACCGEkDM4SdR8/Pz+jYt2Jhycm+YuK3ERXIQQQt7I5URtIDZ2G15A4ISODqymudd2oQNACCGEHOXragNYTXNSS4vQEUw0KpIgpARJdgjROUEQQnQ74SmVyn1DQ0NJOp1uTk1NjYTtnISEBH10dHRFb2/vbwoKCq67O0a67Ozs1yIiIlrpx0wmU3hra+syo9Eo0el0c27duhWakZFRefjw4TR3xLRt27btzGPujunnP/95jslkslgQoOIBAKBi6u7uDrh582ZgRkbG+bKysmQ+4kKIa2wXeLqUqA3Exm4TBQRgNc1RuPG6ECQAoAKAPwvReUZGxrmysrKlQvTtJEczS25XzmZw5MNWo9Es7Orq+rCqqiqpuLjY5vdRU1MjqampUYnF4uzMzMzjJSUl6xyIi9Ofa1FRkcttPPfcc6cOHz68koNwAADg3Xff5aQdV+J66623OIkBIW/k0tCnj5/fv3AVyISBG68L6QdCB4D4pVQq9x07dqyurKxsqcFgcCjZNBgMRElJydrU1NS7fMWHEEKOcrqiZl43jbP9PIn33uOqKc82MDB8Q7bV1gK5fTuXLa4kCSKSIMkmLhu1h6VqkEwmM+l0OpenIDiDyyGh7Ozs1wEASJKc0tXVtfzixYvRjiZKlqSmpjaFhIT83tZ5q1atulZcXLzQ1f4qKysjs7KyPj1y5Mjzts618frxWmW0xMbwoyAxAXhuXAh5Oqc/IAhf381cBgJLvWlUCHkxFXjQ1lILFiy4qdPpXE4unFFVVZXEVVtFRUW/YR5zdVgwKirKGB0dvVOr1e61dW5qaurdkydPRjrbF1NNTc2zXLWFEEKucGro07Ro0WQfX18118Eg5AYqoQOgCw0N/UCovg0GA6FUKvfx1X5ZWVlyVlbWZ848NyoqyhgbG7vYniQtIyPjXGVlZaQz/Vii0+l8s7OzX+OyTYQQcoZTiRoB8M9cB4KQm6wkCUIqdBAUrVa7VyaTCTYW3tHRYffEeWccOXLk+YyMjPOOPIdK0uy5AlOj0Sj5ukjDaDSu4aNdhBByhFOJmo9IlMt1IAi5kUroAOgWLFhwU6i+L1++PJvvPkJCQjaLxWK75iA5kqQBALS3t9ucu4YQQt7M4UTNtHBhFOHjw9lFBAgJIE3oAOgmTZr0K6H6NhgMRFZW1qd89lFQUHA9Pj7e5qa2YrGYjI6O3unIWmY3btzA/4sQQuOaw4maj0j0Ez4CQciNVEIHQFdQUFAcFRVlFKr/1tZWztbcsiQ0NPSirXNWrlx52J45aXRCXTGLEELu4nCiRvj6fo+PQBByI4mn7f05f/78L4Xq+9y5c1M1Gg2vV56KRKJGa48nJyc/tmc5DHcKCgo6KHQMCCHkUKJmHvbEnQjQeJAmdAB0gYGBDlWSuNbX1/cKn+0TBPGVpcfEYjE5Y8aMH/PZv6Pi4uI6Ha3uIYQQHxxK1LCahsYRldAB0I334U+RSNRs6bGUlJQLBQUFxc60y8cVs2KxmJw7d+4/ct0uQgg5w6FEDa/2RONInNABMHnA8KeSr/YHBgZYF9eVyWQDruyOEBsbW+18VGOJxWJy1apVv3c2cUQIIa7ZnaiZFi2ajFd7onHE4+apBQYGviRk/0ajcStfbZMkOYXteEJCwueutBsSErKZq6qaWCwmV69e/TO2XRYQQkgodidqBEl+h89AEBJAmtAB0BUUFFxPTk5+LFT/t27d+ge+2u7r61vEPBYXF9fp6gUEBQUF15OSkl6yd502S5KTkx+vW7cuFuelIYQ8jf2Jmo+PR+x9199sczkm5GEG9XoY1OuFDoNNmtABME2ePPm0UH03NjYG8jX8+ejRIznz2OzZs9/lom2tVrt33bp1qri4uE5HnxsXF9eZnZ39+rlz58IdWb8NIYTcxe41iAgfn2V8BmKvln/ZApM2boKw3E1u67O/vx/6+vrc1h8fAgICwN/f3+39Dur1cOe7GSD7/ZsQsoK3go2z4oQOgCkgIGAXAGwQqn/z8Cfn87Nqa2tD6fdlMtkAl0OM5jllkuzs7Nfa29u/f/v27Zlsa6zJZLKBiIiItqeffvpKYGDg3oKCguLa2lquwkAIIc7ZlaiZFi6M8g0K8phlOVq2boGQFf8A/hG8734DAAA9PT3Q0tJi17mDg4MwODjIc0SOmzVrFkydOtXt/T75YC/0Xqtze792mk0ShJQgyQ6hA6FQw5/nzp1z/w8LAC5fvpzOdZtKpXJfcfHo3C8hIeFznU7HdVdgTv4sJoA6nQ746BchhPhi19An4eOTwXcgjnq0+3W39SWVSsHHx/ZLRZKkRyZpAABPP/202/sc1Ouh9X2Pn/ITJ3QATEIOf+p0Ol+VSsXpRQXMjd9lMtmApy1uixBCnsq+RE0kSuM5Doe1ffxX6G++B3U11fDo4UPe+5NIJDbP8dQkTSqVgkgkcnu/Tz7YC4OdDk8bcrc0oQNgCggI2OXq5HhXdHZ2crpNHHPj9/j4+Aou20cIofHM3ooar9vLOKvt44Ogb2+H/P/5I+jb23ntKywszOrjJEnC0NAQrzE4S4hqGgCwVtNKCj6D5rt/FyAai+KEDoDJ3k3M+cLlRudZWVmfGgwGgrovFotJoZchQQghb2IzUfPk9dNa398LRHc39BmNUFfD6bqXYwQHB4Ovr+UpfQMDnC+QzgmCIKC9vR3u3r076mY08rsIflv+wTHVtLqaaqirqeG1XydECh0AG6lUekyovnU6nW92dvZrXLR1//79UdMm4uPj7+HVlQghZD+bFxMQg4NJ4OfnjlgcNtjZCf4lxQCTp8LFqrOwePkKCAwM5K0/sVgM7SyVu6GhISBJwUaqrLp9+zZcvXp1zPHf/IbfNT3Z5hCeOXGc1z6dNGZ9L09QXFy8RSwW/5hejXKn9vb274OVSfn20Gg0yoKCglFXe06ZMuVfXQoMIYQmGJsVNcLHZ407AnGWX0kx+PX1QZ/RCJfOnuG1L0tXTXrq3DQAgHv3xo6gxcfH85rQtuUfhP6W0Vs7Pv5KB/qODt76dIWn7VBAEXL4kzmvzBlPnjz5L/r9uLi4TtyaCSGEHGM7UROJnnFHIM4ienog8motAABcrDrL65Cev78/BAQEjDrmydW0np4e0LMsNBsdHc1rv2zVtLpqfoemXRQpdABshBz+NBgMhFKp3Ofs8zUazUJmshcREfGJ65EhhNDEYnsdNYLg91OdAzNu1sOtJUtHqmorVvNXBJRKpfDo0aOR+55cTbtz586YY4GBgSCXj1kknjNs1TQAgEdfPQSQzeStXxfFAYBW4BjGKC4u3iKTyV5kW7jVHZjLajiir6/vFfqwrUwmGyguLt7CTWTOUalUW0mSnMY8Pjg4GGUymSIAvtlB4c6dO2Jz/IIMPSP+aTSahQMDAxuNRuMavV4/p62tLbSxsZF1qEEsFpNz5841hIeHNwQFBR30tK3GVCrVVpPJpDQYDPM7OzvDaO9fVtT3ExYW1hISEnLWz8/vD540d5T62bA9Rv991ev1c4xGY2BtbW1oRkbG+bKysmT3RuoeVj8ATIsWTfb18/OYhW4tCTIYYMaNBniwQA51NdVuS9QGBwc9tpoGAKwLe8bHx/PaZ/vHB3ltnyeRQgdgyYIFC27qdDpBrrq+fPnybI1Gs9CZ/8AbGxu/S78fHx9f4exCsxkZGefKysqWOvVkGq1W62oTyMupVKqtvb29m+7evbuooKDA7vkfBoOBMO+usRQAlspksrcTEhI+F3I9QKVSue/x48eq69evT9FqtQ79QUH7fhaab/+UnJz8eOrUqVpX/6Di4ve1oKDAladbpNFoFhqNxrdv3br1D8ykXCaTDcybN+/+lClT/tXTpmhYTdQ8+UICpvmXzsGDBXLQd3RAXU01xCYk8tKPv78/BAcHQ3d3t0dX0x4+fAg9PT1jjickJPDWZ9eZL6Hr7Je8tc+jSKEDsCQ0NPQDAOBkT0xHGQwGoq+v7xUAcOjDKDs7+7WioqKR/wRxSQ4kpN7e3vBVq1Zdu3Hjxre1Wi0n1WmdTuer0+k2yGQy05IlS3ZzuR2aNRqNRtnV1fWrqqqqpOLiYruTszVr1tyZN2/eZ35+fo8AALq7u2POnj37/Zs3b478npp3Q/knmUz2otBJKB8yMjLOHTt2LMlSpdH8M40EgKJVq1ZdP3nyZIx7I7TM+ptWJFrspjhcRq+qnTlxnLdEDWC4qmYwGHhrnwts1Ytp06bB9On8FUjduVsEx+KEDsASrVa7VyaTvS3U8Gdra+tKR59jvmJ0xJIlS+pdGVaxNpzBVbUNjV+VlZWRfLWt0+l8i4qKfr1q1SoVnx/sGo1mYXt7+6GCggKHq+svvvjih/v37//R8eOjr7r/9a9//bvDhw/foCdrAN8koVFRUb3R0dE7HR3mtTH86PYhKJVKtbW+vv7NsrIyuyuoJ0+eXJiamnq3srJyDp+x2cvqxQQEQUS6KQ5OzL90DgBgpKrGF6lU6tHVNJPJBM3NY+eJYTXNItvbTghowYIFN4Xq+9y5c1M1Go3dHw4ajWYh84Nx0qRJv+I8MIQ8yMmTJxdGRUX1OvK7Yi+lUrnv2LFjdSdPnnS47YSEBP3+/ft/xPbY66+/fi8zM/MHlp7b2NgYqNVq383IyDjnaL+eQqVSbT1x4sQfLM09tKaysjIyKyvrUz7icpStRM1jSn/2CDIYIEx3HwD4XbNLJBKBVCrlrX1XPbSwpRafiZoXV9MAAIAkiDShY7DEPPwpGPPwp126uro+pN9PTk5+7GnzPdDE8txzz52G4YtCCAAgfv3rX0du27btpU2bNmm53KqtsbExsK6u7hJXyZpGo1mYnJz8qLi4+J+cXU8xKSnpfWuPv/XWW4dkMpnV1drLysqWpqam3uUjCeUTlaS5shZlTU3Ns1zG5CzriZpIxN/lgTyZf/E8AAxX1Rrr63nrx5MTNba10+RyOW9rp/U33/PmahpFKnQAlmi12r1RUVH8biVhBXN3AWvq6upGzTkIDw//b+4jQsh5r7/++r133333nYMHDz77s5/9bA7XydqDBw9OutqOSqXaWldXd8k8b8xpEomkxNY506ZN67Z1TmVlZSSXSSjfuEjSAIaHgV1ZpogrttZRC3FLFBwK0z0YqapdquJvAVyhNjq3paenB1pbW8cc53NJDm+vppnFCR2ANfPnzxcsE66trQ3VaDRKW+cplcp99Ll0MplswF2TrBFyxuuvv35vw4YN+7ls89y5c1NdGS50ZbiOaffu3TY/BGUy2V172uK6YsgXjUaj5CJJo/T19Qm+e43FRG0gJkbhzkC4RFXVmu/e5W0DcE8d/mSbmxYYGMjbsGd/8z1o+/ivvLTtZlKhA7AmMDBQ0HWbjEbjVlvnPH78WEW/n5CQ8DlvASHEEUtzuFxRVla21Jn9crmqBDkiMDBw7KroFjQ2NgY+efLkCJ/xuKquru4Ql68ftbaikGzuTOCN6FU1PueqeWKiZmnYky/jpJoG4OEVtYKCgmIhhz9v3br1D9Ye12g0SvowjVgsJgMCAnbxHxlCrktISLA7WbFXQ0PDDkfO57oSxJfKysrIzMxMwXZNsWbVqlXXuKhEehrLiZoXLc3BZuaNBgDgt6rmacOfra2trGunpaSk8NLfOKqmAXh4RQ1A2OHPxsbGQGvDn+3t7b+n33d1SQ6EvF1jY2OgI1cNcl0J4lNJSclalUpls8ruTmVlZUuduTLWG1hM1AiSlLoxDs7NuNkAQYZOAADel+rwFGzVNKlUytvaaU8+eI+XdgUi+DwEW4Qe/uzq6rK4zMbFixdHbTWHS3Igb/Ktb32rlo927b1q0BsrQU1NTR45nCIWi0mNRhOTnZ3NSXyBgYGCjWRQLFfUfHxmW3zMS1Bz1epqakDf3s5LH1OnunRRDqfYluXgq5o2qNdDe/5feGlbKCRBSIWOwZqCgoLiuLi4TqH6Z17RScnKyvqUXglITU1twiU5ELLvqkGVSrXVGytBtbW1oZ6yzhjdypUrD3NZzZdIJHZdbMEnyxU1gpjlzkD4QK+qnTnJz1y14OBg8Pf356VtRzQ3N4PJZBpznK/5aU8+2AuDnYLlDHyJEzoAW2bOnFkmVN86nc6XbbiDuXzHpEmTxs14OEKu6ujoWGftcU+tTNnDU9YZo8hksgFq6ytfX98LXLQZFBQk+AbWlitqBBHqxjh4446qmicMf7JtGTVnzhyYNGkS530N6vXQ+r6go3ATltAT9Ds7O39Cv69SqbaaN3cGAICoqCgjLsmB0DcuX75scXQqOzv7Nfrvj7fxlHXGKPQrzbm4AEsmkw04uoUWHyxX1Hx8vu3OQPgy42YD+PX1AQB/VbWnn36al3bt1dPTwzrsGR8fz0t/47SaBgCQJnQAthQUFFxPTk5+LFT/N27cGPX/Qltb26gr26Kior5wb0QIeTaDwUBYWqqDuS+uN2IuyyMUsVhMMjeSd/X/o8WLF3O6xp6zxuXyHEyRV2sBYLiqZjRyPy8wODgYgoKCOG/XXmxJWmBgIERHR7Oc7br2fMErwRPa5MmTTwvVN/0vaI1Gs5BeLWD7jxIhBDAwMJDEdtxatc1bOLofMF/i4+PHXE135MiR552tqqWmpjYVFxdvcT0y17EmaqaFC6PcHQifIq9eHqmqXTrLz24FkydP5qVde9y+fXvMMb62jGrLPwj9LWMX1R0n4oQOwB5CD39Sc26MRuPb9IsIUlJSOJkTgtB4YzAY5jOPKZXKfd6yHIctjuwHzJegoKBHbMdjY2NzHN0mLCoqyjhlypQsbiJzHWuiRhDEPHcHwiff/v6RqtrFqrO8VNWEmqem1+tZ107jayeCcbTALRup0AHYo6Cg4HpqamqTUP1TVYDLly+n04+HhIT8nv0ZCE1snZ2dYcxjnrA1EVc6OzuXCB2DJQUFBcXr1q1T2VtZW7Vq1fXGxsYgT1oHckIMfQJ8U1XrMxp5qar5+/sLMvzJtmWUVCqFOXPmcN7XOK+mAXhJogYAIJVKBVsZ3GAwEKtWrbpG39cTl+RAyLKenp4xSwN4wtZEXLl9+/ZMoWOwpqCgoLixsTEoKyvrM7Y5vjKZbCA1NbVJo9Fknzx5MkaIGK3xZT1KEHPdHAfvfPv7YcbNBmh6Jg4uVp2FxctXcD40OHnyZGhpaeG0TVvcuWXUOK+mAXjBoreU4uLiLWKx+MdCDZ0w133CJTkQsoxtMVu25I0HNof8Dh8+7HIn9D/aPJmlObQ6nY515QRPYWnok/tyjAeIvHoZAAD6jEZeditw99WfDx8+ZF07jY9FbvUlX4z3aprXYZs8K4S4uLhOXJIDIcd4204EtjizCT2yz4QZ+gQACDIYYIZ5D1A+hj9FIpFb56qxVdOmTZvGy9ppreNruyiLSIKIEzoGewk5/Ekn5CK8CCGrCHfd8I81/kyoRA0AYP6lcwAAoO/o4KWq5q5EzWQyuW3LqK4zX0LXWcH2A3c3qdAB2Ms8/OnQ1Uxco68EjhBCiHvsQ58i0Qp3B+Iu9KramRPcL4DrrkSN7SICAOBl7bQJMDfNay1ZsqReyP5jY2O5/2sHoXFG6D+okHebcBU1AIA55rlqfFTVRCKRW+aqsQ17xsfHc36BxASrpgF4yVpqlNDQ0A+E7D8kJGSzkP0j5A3mzp1rYB6TyWQDQsSCvM+ETNTEX7dCmO4+AHhnVa2npwf0ev2Y43xU01o/EHybM3eTCh2AI7Ra7V6h/sM3L8nhMWsNIeRNpk6dOnYBTIRYTMhEDeCbzdr1HR3QfPfvnLYtlUpBJBJx2ibdnTt3xhwLDAzkfFmO/uZ7oC89wmmbiHsLFiy4KUS/YWFhe4ToFyFvEx4e3sA8FhYW5t61nJDXsjRHbdwsxGdJmO6B11bV2NZ74WMD9gk6Ny1S6AAcJcTwZ1xcXKdWq51w5VaEnBEQEHCFeSwkJOSsELEg72Opohbi1igEQlXVmu/e5byqxtc8tYcPH7ply6j+5nvQ9vGEXMM0UugAHCXE8CcuyYGQ/fz8/P5gzzGE2EzYoU+A4apaaOsTAOC+qiYWi8Hfn/uFp9mqadOmTYPp06dz2s8EraZ5LXdefYlLciBkv6ioKCPbXE6h9+xF3mNCJ2oAMLJZe/Pdu/CIZV0yV3A9/GkymViX5cBqGnLnhujx8fEV7uoLIW8XFRX1haXHvHnrNY1Gs1AsFg9lZWV9KnQs492ET9Rm3GyAIEMnAABcquJ2twKuhz/ZFrgF4D5Ra/v4IKfteZmVQgfgjIKCguKoqCgj3/2IxWIyMDDwJb77QWg8EIvFZEBAwC5LjxcVFf0mLi6u050xcUGj0Sysq6u7ZDAYiCNHjmzAZI1fEz5RA/hmrlpdTQ3o29s5azc4OJjT4U9LG7BzuXbaoF4Pre/jHHFvNH/+fN4XvIuPj7+HS3IgZJ+UlJQLtn5f5s6d+4/etiDukydPjlB7lSYnJz/GqRD8GpOomWJjlwkRiJDoVbUzJ7mdq8ZVVa2npwdaW1vHHOd6SY4nH+yFwU6v+wMPAUBgYCDvGfaUKVP+le8+EBoPxGIxac+C0AUFBcWpqancLz0A/GyUnpqaereysjISYHj+3YwZM1Zx3QcabUyiRpAk9zt6ewG+qmqTJ0/mpB22uWmBgYGcDntiNc278T38GRcX11lQUFDMV/sIjSepqanH7a0+l5SUrPP0Cws0Gs3C5OTkR/QkLTY2djFW2PmHQ59m4XfvgF9fHwBwW1Xz9/eHoKAgl9uxNOzJpbb8v2A1DQBIgogTOgZnWZu47KqIiIhP+GobISEZjUYJl+3FxcV1lpSUrHPkOZWVlXO4/kOLJMkpXLSj0WiUdXV1l86dOzcVAJM0d8NEzcy3v3/kCtDG+nowGrn7fXG1qtba2sq6dlpKSopL7Y7p54P3OG3Pi0mFDsBZ1iYuu0Imkw0UFxdv4aNthISm0+nmcNWWTCYbmDt3rlP/OcfGxi7m8uKCrq6u5a62oVQq9x07dkxLzUnDJM39MFGjibx6Gfz6+qDPaIRLZ7m7AtTVZTrYqmlSqZTTtdPa8g9Cf8vY4VXkXQoKCq4nJyc/5rpdXJIDeauysrLUn/zkJ/9u6fGXX355RU1NDScVNbFYTCYlJb3kbBJTUFBwvba2VsLVMOiNGze+7exzqaHO4uLifzIYDATA8P6+mKS5HyZqNPSq2sWqs5xV1fz9/V1K1tiW5eC6moYL3I4fkydPPs1le7gkB/JmBoOB+OCDD/6/NWvW3H755ZdXUMe3bdu2/cUXX/yfv/zlL5z8ESIWi8nVq1f/jIut1SorK+dkZmaWu3o1qE6n883IyDjnyHM0Gs3CjIyMc8eOHaujhjoBADIzM8srKyvnYJLmfr5CB+BpIq9ehqZn4qAPAC6dPQMrVq/hpF2pVAodHR0OP6+5uRlMJtOY41zOT8Nq2vhiHv7cwFV7S5Ysqcf/nJG3O378+Nzjx4+PLGHz7rvvcta2TCYbSEpKeonL/W9LSkrWqVSqrU1NTa/X1taGOttOWVnZ0qysrE9tLaGh0WiUXV1dvzp27FgSVUEDGB7qjI6O3ol7+woHEzUG3/5+mHr37/BggRwuVp2FxctXcLJOmbMVNbYto+bMmQOTJnF3cS5W08YXaviT/tewKyZNmvQrLtpBSAgZGRnng4KCDtbX179JzbPiUnJy8uMZM2as4uOPGXNytDcrK+vTmpqaZ3U6nVOf2UeOHNkQFxennzlzZplIJGqkjpMkOaWrq2v5/fv35xYUFIx6bcRiMZmamnq8pKRkXWNj49hGkdvg0CeL+ZeGK8V9RiPcqufmd08kEjmcrPX09LAOe8bHx3MSEwBA15kvsZo2VqTQAbhq6tSpWi7aSU5Ofiz0khzmoRuS7VZWVraU5+5Z+42Li9Pbio3PoA4fPrzSUr8JCQkdnhbTtm3btj/33HOnhIgLYDjhiY2NXZyRkXGeqzZlMtmAUqn847lz58L5rjgfOXLkeZ1O55eVlfWZs1eG1tbWhh45cmRDUVHRr6lbcXHxP508eXIhPYEVi8VkRkbG+XXr1sU6euUqgHC/E+b/C1j75WM9OXfCRI1FkMEAM240AAC3m7U7uvgtW5IWGBgI0dHRXIWE1TR2kUIH4Kri4uItXKx2Hh4e/t9cxIPcZ2hoiLB9lns1NzdPNhgMnFezHFFQUHC9rKwsWaPRZKempjY5+/shk8kGsrKyPtPpdH7uvhL6yJEjzzc2NgapVKptq1atui6TyQa4ajs5OflxVlbWZwaDwaesrCwZpzt4DoIkR79XB2JiFKLAwBK3B3Lpkl3n3fnud6DrLO875UCvWAynNv0QAAAyNc9BbEIiJ+3W1tbC4OCgXeeWlZWNWZYjPj4eNBoNJ7F0nfkS7ii/w0lbtpzPVkObbCYAAOT+6McQMedbtp90+jSQaWn8BsZuF0GSv+WyQYLwuM9OhLyeRqNRDgwMJNGPGY3GNSaTKaStrW3WnTt3xCkpKRfKysqSWZ670GQy/ayjo2PdV199Nc3SsKhMJhuIiIhoe/rpp6/4+fkVe9pcLY1Go+zr69tkMpkiHj16JO/p6fG3NcQbFRVlDA4O7g8PD28IDAw8XlRU9Bt3xYusY+ZkADhHzSKqqvZggRzOnDjOWaImlUrh66+/tnmeXq9nXTuNy50IsJqGEPJm5mF55tD8qKSjrKzM0nOvA4DNiphOp2OdK+wpLLwGVuGcM++CQ59WzLxZDwAA+o4OqKup5qRNe+epsW0ZJZVKYc4cbtZl7DrzpVsqkwghhBByHiZqVoTpHkCY7j4ADK+rxgWpVAoikcjmeXxvGdX+8V84awshhBBC/MBEzQZqs/bHDx9C892/c9KmrYsKHj58yLp2GleL3PY334O2j//KSVsIIYQQ4g8majbQq2pcXQFqK1Fjq6ZNmzaNs7XTcG4aQggh5B0wUbMDVVVrvnuXk6pacHAw+Pv7sz5mMpl43TIKq2kIIYSQ98BEzQ5hugcQZOgEAO6qapYuKmC7iAAAOFs7DatpCCGEkPcYk6j5XrtWKkQgno5eVdO3t7vcXnh4OOtxtmHP+Ph4TraxGtTrsZqGEEIIeRGsqNlpxs2Gb6pqJ12vqvn7+0NQUNCoYz09PaDX68ecy1U17ckHHrVOI0IIIYRswETNAVRVra6mhpOq2uTJk0fdv3PnzphzAgMDOVmWY1Cvh9b3MVFDCCGEvAkmag7guqrGnKfGtvo1VxuwP/lgLwx2dnLSFkIIIYTcAxM1B0VerQUAbqpq/v7+IBaLAQCgra2Nty2jsJqGEEIIeSdLiVqXW6PwIjNv1INfXx8AcLNbAbWmWmho6JjHpk2bBtOnT3e5D33JF1hNQwghhLwQa6JGDg42uDsQb+Hb30+rqlWD0Wh0qb2nn34aEhMTISoqasxjXG3AjktyIIQQQt4Jhz6dEHn1Mvj19UGf0QiXzp7hpM1JkybBtGnTRh3jIlFryz8I/S3sa7OhcYvk45aTkxPj1u8CIYQQJmrOoFfVLladdbmqRqHvPiCXyzlZOw2raU7pEDoAFxHULT09/RbbCRERESb6edRNpVI9p1AoTpkfH6Wvr+/bPMbMq+zs7DckEskQAJCJiYltKpVKI3RM3ghfR4Tcz1KihhOabIi8ehkAgNOqGn29NC6W5MBqmtNqhQ5AKFqttqC0tDS9ubnZf+3atZeFjocLKpVKU1RUtFOv1xMAANXV1ZNqamo+Fjoub4OvI0LCsDRH7aq7A/E2vv39MOPG8FQ+Li4qABheM23ZsmUwZ84cToY9W3GBW+SC8vLyBEsVOW/S39+/lXmsubnZT61WbxcgHK+FryNCwsChTxfMv3QOAIaranU11Zy0mZmZCZs3b3a5na4zX0LvtToOIkIT2dSpU9USiYQEACBJcqnQ8SCE0ESDiZoLggyGkaoaV5u1cwXnpiEuHDp06Nry5ctPCx2HK/z9/ceUliMiIkyFhYXvCBCO18LXESFhsA99Dg15Vtbhwaiqmr6jg7Oqmqu6znwJXWe/FDoMNE6wfUB7E61WW5Cdnf0mdYFEYmJie0JCwkah4/I24+l1VCgUFQqFoiIlJeUBDF/VjJDH8hU6AG8XZDBA+N078GjOXDhz4jjEJiQKHRJW01zXJHQAnkSr1RYAAFFUVCR0KE4rKir6JQD8EgCguroaqqs9448qb+Ptr2N2dvYbRUVFO0tLS4UOBSG7sVfUSPK2uwPxZtRSHZ5QVeutu4rVNBcRJNkkdAxCSUxMbEtPT28UOg6EEELDWBM1v+vX8T9qB4TpHkCY7j4AgOCJGl7piVxx+/ZtqdAxIIQQ+gZeTMCR+RfPAwBA89270Hz374LE0N98D9o+/qsgfSPvl5mZqaXWyEIIIeQZLCZq5ODgRXcG4u3oVTWhrgDFuWmcuCJ0AELIycmJqaurUzj7fLVavd08ZDqy5dTu3bv3AwAwjzNvCoWiwtrj1Or35n8tnhcREdHPEprF87Ozs98AGJ5Ybu08AIDDhw9v3LRpUzN1TC6XdyuVyv32vDY5OTkxjInrY+JWKBQVbO3Zeu2YfVC7BlC3tWvX1jB3D1Cr1dvXrl1bw2xLoVBUWNlpwObraEl2dvYblvpjW4MtMzNTa60/eowKhaLC/HMnAYCUSCRD5p/nKNTPuKioaKed3x8r6nWWy+XdzOesXbu2xt73BBVTcnJyL7C8JmvXrq2x8H5GExBW1DhEzVUToqqG1TTOdAgdgLtlZmZq//d//7emubnZz9nnFxYWvl1RUTEfAEClUp0HAGLu3LnlmzZtau7r63uK+ZzExMR2MG9bVVpamg4ARHZ29pvW+qEuagAAQqFQnLIzPEKlUj1n7QRb/R87diz96tWruQcPHozYsWPHJgCAhoaG4OLi4h+aky+LFApFxaFDh+pKS0vTqqqqZOZYCAAgqJ0fmpub/UpLS9OKi4t/aE5oRlRUVERZiw1gOBGi+mBWRMvLy+MrKio+o5Ib6mdVXl4ez/I6pNHPZbD5OrJJSUl5UFRUtLO8vDx+/fr1DfDNVmXnS0tL0woLC99mvoYlJSUqW/2p1ertERER/aWlpWn0961erydKS0vTIiIi+unfhx3vMeZ2amNkZmZqqddZp9MFbd269WX691NeXh5fXFz8Q7lc3m1tEWCVSqVJTk7unTVr1pTly5f/iGpjx44dm7q7u+dZ+vmgictyRY0kr7kzkPEg/O7fIcgwvPvWxbPc7FZgL6ymIUeYP9xIACBLSkqynU3SlErl/pKSkmz6sblz574LAPDcc899/NRTT31WVVUlcz1i4bz99tvvvfrqq98FANizZ89fo6Oje6jHqqqqZJYuvli7dm1NaWlpGv1YQEDATerrp556aswvbXl5ebwj+2eq1ertp06d+oX5LmuSodfrie7u7l8zflasyQh1rr39WyOXy7vpP/ukpKSRiq1Wq02mFlKuqqqSJSYmttnbrlarPXzp0qU3Fi5cePuVV16ZAwAE/WcCMPz+fvz48R84+DYAYLiySX+fZ2Zm/m3v3r0jlUT699PQ0BB84sSJtywlazdv3jwwNDTUs2/fvpg9e/aM/HW9Z8+ev54+fXpWbm7uUa7iRuOD5Yra0FCH+8IYP6i5arca6kHf3u6WPgf1etCXfOGWviaAJqEDcAf6puxKpfJPcrm8x9ZzmHJycmJOnz79A+Zx+ofPvn37djA/RL1NRETEqA/O2bNn36Pfr6iomM825HXhwoU45rGurq7XbPXnyA4QhYWFb5uraFbnFlLVHvNdgvHvKG1tbZH29m9Jenp6Y0NDQzB1XyKRkLt27WqinzNjxoxe6uvq6upJbEOWbKKjo3vS09MPHT16NJpqMy4ubsyizPfv35/ibPx0CoWigqoWU8RicQPzPPr3o9friRMnTrzFTLqVSuX+hoaGYJlMZnFrtvz8fAW1Vh1CANYqagA1lh5Dls242TBSVTtz0j1z1Z58sBcGOzvd0tcE0CR0AO5WXFz8YkNDw1OOJmsGg+Fd5lAbVVWgYyY23iY0NLTY1jm3bt3KYR6TyWS9zGO+vr42r6gfGBiIsj86ALCRpLlwrlOys7PfYCY2EolkgHleSEiIkX7/7NmzK+1pPyQkxPjRRx/9I/2Yn5/f187EaktOTk4MW1x+fn6P2OKi39fr9YRer/93+rHe3t44AACtVrtUpVKde+GFF/7C1u/OnTvfcSVuNL5Yq6jZXYpGo1FVtbqaGt6raoN6PbS+j0tyINfJ5XKHhrzu3r2bxDzG9oHs7d58802bW2g1NDQEM4e65HL5r81z8QAAIDMzs8i8YOy41tnZqXLmeXq9nrBng3e5XO621WrZ/hixJCgoaMwfOhUVFfNzcnJiqPsDAwMh1NdarXbpRx99tAloFxMkJSV9nZubW7p48eI/NTc3+3PwLaBxwGKi5nvtGi7d7CR3VtWwmsa5U0IHIJTCwsJ3HBlyoQ9tIYC+vr40+v3CwsJ3qqurw8A8xGyeJC8ktyy9cufOnUjmMfqcSOp24cKFMOZ5RqMxm3mMSSwW13EQpl06Ojrsrm4GBwcb2I739vb+nPo6KCjI6sUnFy5cCMvPz1+/bNmyenuHgtH4Z+uqzy63RDEOzTRv1s53VQ2raYhLM2fOfMJ23FwVIKm5WI5MeJ8oSJKUWHosOzv7DYVCUUFfpkKr1R7moFuPW/eO7cIU+pxIazfz1ZlWBQUFnec0YCu4mOc2ODg4kpA6sm9uaWlpmiPLfaDxy2qiRg4OjpkwiewTefUy+PX1AQB/uxW05R/Eahr3moQOQEhVVVUzzEtCjEJVBQiCaHV/VN6Lvn6XefmM2S+88MJBACB27tyZJnB4yA3oCbxWqy3IzMy0e9PcBw8eqHgJCnkV64kaLtHhNN/+/pF11S5WnQWj0Wj9CU7AJTm4N5H3+bSmtbU1AwCAIIjzAKOXmRCCyWSyWL0SCkEQeurrnJycGLlc3k1fniM6OrrnwoULTzMnwo83zlxB7KksVZgd4evre5d+v6SkRHXs2LFV5vUGrcIt3RCAraFPXKLDJVRVrc9ohEtnz3Dadlv+Qehvaea0TQRefXUiX1QqlYa5FtqhQ4euCfmB3N3dHe6uvl555ZVIe84LCAg4RX1tMBjeZc7hY1tCYjyaOXOmoEk8l6RSqcv7XgcFBb1FfZ2YmNi2e/fu/evWravQarXJYB7y3bJly1u5ublHc3Nzj9KXs8Et3RCArYra0JAweyGNE3xW1bCaxosmoQPwRPQlBsy7AwCAcB/IOTk5MdevX5/urv66urqW2zpHIpGQhYWF71D3LSzpwMsSEp6GbSFfexZUTkxMbDNvH+UxxGLxNrYlZ9j09PSImcfS09NvHTp0aNTI1EcffTRmKZd9+/btyM/PV+Tn5yvq6+ufoha9HU/VSeQ864maSHTBXYGMVzNu1gMAcFpVw2oab5qEDsDTKJXK/cw1sShsH8h6vd6Xeez69evz7OlLJBLp7DmvpaWlzJ2VhocPH37f1jnLly8fVS1ji+/x48eJ9PudnZ1K16PzPFqttoDaHouOvkwFk1Kp3P/kyZMQoa+MzcnJiZFIJEPUMiGHDh26xvzZAgCYTKYxFd3e3t5RFVSJREJKJJJ/Y55XX18fbGn9NEpYWNgpgPFVnUTOs5qo+V250gp45adLggwGmDFyBSg3FxW0f3yQk3bQGE1CB+BJlErlftpq9sBcukOr1RYw99zU6/UEfahwy5Yte+zdnsrPz+84W/Wiv79/K8DwlZNyubz7qaeeeuTAXp8uO3PmzBr6/a+//nrUh7RcLu9hXq3IVgk5evSofMuWLXsAAHbu3Lnyyy+//Albf+3t7UtycnJibO0j6snKy8sT6GvIAYxepoIuOzv7jdOnT/8gPj7+Hb7jsvTHALUUxuPHjwslEskAvTpaWlqanp6ePmonAYPBIGe2cfPmzUn0+2lpaf9Jr0DTabXa7+/YscPiHwD3799XSyQSMiwsLM/qN4QmBJubsuOVn66bf+kcAADoOzpcTta6znwJXWe/5CIsNFat0AF4gszMTG1iYmIbPUmzpLS0NJ1ZPbl169b/AwB44YUX/nL06NFt9vZ76NChaytWrBizC4B5Qj5ZVFS0c+bMmTfLy8sT7G2TCzt37nxny5Yt11555ZXInTt3rqR/IMvl8p5vf/vbYz5MLS0evG/fvp8DAPnJJ5+cnD9//nsqleo5ZnJaVVUlO3ToUB0X86OEVF1dHZaSkjKSGNXW1m7Kzs4e2R9TrVZvT09Pbzx16tQv0tLS/tMdiwEXFha+w5ZEU++xioqK+XFxcWP+Eq6oqIii/3GQn5+/nkq6AQDWr19fT1VR5XJ5j1qtfsna95OQkHB7z549B3Nzc0vpf9js2LHj++vXr6+vrq5esnr16p8zh03RxESQpPXh98FnnnnLx9//Jd4DuXTJrvPufPc7XpmoXE1fCw8WyEEilcJPd77sdDve+v2fz1ZDm2wmAADk/ujHEDHnW7afdPo0kGlp/AY2WjpBkqf4aJgg3Don2K45NY5KTExsNy/gOoZSqdz/4MEDVXV19UgSs3v37j/V1NS89fjx40Lm8Km1trKzs9/o7OxU0Z+TkpKimzJlyl+pDz+FQlHB3PCcgXrBrb4W9Diys7PfKCoq2snWllqt3v7VV1/tpC6qkEgk5PLly09bW/dLrVZvb29v/2f695GYmNgeHh5+hf48lUqlefz48R+otuVyeU9UVNR7RUVFv4yPj2++fPnyLGvfgzn2N5mvmbVz79+//yP6z8oSlUr1nLkqZPfryNLfGyaTaQnz58X2WgAM/6FA3wDdkt27d/8JAODll1+2+QcF7fuAnJycmLa2tgPl5eXx9HPS09NvhYaGaq0lWDk5OTEGg+Hdu3fvJjEvFlm7du1lf3//ZmvDt4mJiW3U96xWq7cbDIY8ehyzZs0aio2NrRSLxdswSZuY2HIym4nawDPPbBL5+1sdT3eZwQDETfuG4r01UekVi+HUpuH/TzI1z0FsQqKNZ4zVdeZLuKP8DtehuYU3JGoESfKWTbk5UfMo6enpjY4kakKxlqi5PRiE0ITElpPZM/TJ/wUF9+/z3oXQggwGCNMNf59nTjh3MS1e6ckrXJoDIYSQx7GZqPldv94IfF5Q8PXXAD0T4wpkarN2fUcHNNbXO/Tc/uZ7XllJ9CJNQgeAEEIIMdlM1AB4vqBAZ9cV+eNCmO7BSFXtUpVjS3VgNY13p4QOACGEEGKyN1Hjdll9yuPHAP39vDTtqaiqWvPdu9B89+92Pae/+R60ffxXPsNCWFFDCCHkgexL1PjYoWBwEODhQ86b9XRhugcQ2jq8fZy9c9WwmuYWtUIHgBBCCDGNWUWc9aRr10rJxYu57fnRI4CBAYefNveLv426f+bEcThz8gRXUbkVVVWzdQXkrPf+CLPe++PIfaPRCO+/uRv6eNjofaIiSLJW6BgQQgghJrsqagAA5ODgRc56HRwEePKEs+a8mTML4F46ewaTNG5dEToAhBBCiI0jiRp389RaWpyqpo1HdTU1oG9vt32imdFohItVZ3mMaEI6JXQACCGEEBu7hj4BRuapub5DQV/f8JIcHJFMmgQRc+Zw1p4Qmu/+HWIn2bcA7q3661hN416t0AGMNyqVSqPVag8DAFRUVIx53LwqPrWyo6ALylK7HBQVFVk6hTSfd8raTgQIIcQHmzsT0JGLF7u+Nc2dOwAdHWyBuNz0RPDo4UPoM/YKHYZLpk6XQWBgoO0T3bczwRyCJJv47GAi70yAEELIPmw5md0VNQAAcnDwBCESrXY6AoOBNUlD9gufPl3oEMYbPd9JmidRq9XbjUZj9tmzZ1dSm0gDDG/pNG3atEpr+xQiZGbxr+q8vLysAwcOlLgzGFdt3Ljxdx9//PFvnHjeax9//PH/4SMmxBuvfO/aPUcNAGBoaKjSpd4m4HIcyOOdEjoAd1CpVJrExMS2wsLCt0tLS9MWLlz4MCcnJxaGhx2JadOmVdbV1SkiIiL6s7Oz30hPT28EnjZ3R9zauHHj70JDQ4cAgExJSXmSl5eXyXOXxMaNG1/juQ+3MSdbBHWbNWsW6wRqhUJRTz8PkzSv5JXvXccqagMDn4Cf3y6nejIYhm8IeZZTQgfAt+zs7DcqKip+QVXQUlJSdFVVVTPo51CVtMTExDb6xuTmuWYFbg0Y2S0vLy/zwIEDI9WgqqqqyS0tLVoA8BMuKoQQlxyqqPldv95IDg3ddKqnpiannoYQz7RCB8AntVq9vaioaCd9mHPKlCkWt7morq4Oi4iIMLknOuSqrq6u7cxjLS0tvps2bfqpAOEghHjgUKIGAEAODVU53MvXX0+4raKQV7g3nuen5eTkxFy6dOkN+jGJREIWFRX90trz4uPj3+E1MIQQQnZzOFEbGhz8b4d7mUAbryOvckroAPj0+PHjwubm5lFDYDKZzOYlw0VFRb9MTExsBwDw8fGZxVd8yHUhISHvMI/NmjVr4ODBg+8LEA5CiAcOJ2p+dXX/Sw4N2X9VgE6H1TTkqbRCB8AXlUqlqaiomM88PmnSpA57nh8eHn4FAGBwcFDGcWiIQwcOHCjZuHHja9QE+JSUlNb09HSVwGEhDqnV6nK1Wl2+evXqe4AX+ExIDl1MQCGHhv5G+Pj80OaJuFUU8lx6giS1QgfBF71e/+9sxwMCArrteb5YLN4GAHWcBoV4Yb768P8AAFRVVUFVleOzU5DnoZYNKSwsFDoUJDCnErUhk+k/fHx9bSdqTm68jpAbaIUOgE81NTXz2I77+vp22fP8Q4cOXQMAwspq/QghhNzA4aFPADuv/uzrw2oa8mRaoQPgi1qt3k6/ypPOz89P7+54EEIIOc+pRA0AYGhwMN/qCQ8fYjUNebJaoQPgi9FozBY6BoTQxJKXl5cZExPTBQCkWq0uFzqe8cTpRI0E+H8WH+R443WEODaul+UwmUwSvvvIycmJUSgUFXK5vBuGJziP3NauXVujVCr3W3oubdcDS7dRfUgkkiFm+yqVSkNvU61Wb1+7dm0Nsy2FQlHBPJfNxo0bf6dUKs8zn69Wq8vZ1iQzfxCxxq9QKK4DAGzatOmn1AdXaGjoUE5OjtUrMZ999tnC1atX32C2p1Qqz2/cuPF3LE+x+BpaOB8AADZv3rxArVaXx8XFPWJ77qxZs0xqtbrcVrzOcPR1Zpo1a1ZzSEjIINtzExISbspkMreuAbhhw4bPwMrPgb5LhFqtLp81a5aJeiw0NHSILaGh3ltWtrVi/X1hcvW1puTk5LzP1k5MTEyXWq0u37x58wIAgNbW1jeuXbv2FADA8ePHR7aa5PJ3hSCIzqioqEaZTGZga8/X13coKiqqcfr06fX2fn/2cvX1XLFixfmEhIRetucqlcrz5vcGO5Iknb4NLFpUMJSYSI65SaXkEIBDN4TGOHXK4feRnbd3SBfe987c3MlaIqRQKCpcbT8zM1NLtSeRSIa2bt06si6bSqU6Rz0ml8u71Wr1dkvtZGdnv2EhTmuPjfRLJWD0eGydy4Z2NR25fv36kf/g6d+L+Zwx2D6oFQrF9by8vExqWyf6jW17p+eff/51c4JBAgCZkpJygXosKysrh3b8CfWhSDG3Z3eixvzQNLcPAABsH0LmY2OY27eamDC58jqnpqZuDgkJGYyKivp63bp1v6KO79ix4/srV65sAQDSx8eH5CJRoydT9BuVVLCx9HPIy8vL3LRp008ttQkwnBi/+uqry5ltWnqN7fkeXHmtKZs3b16QkpLyhDo/IiKi/5VXXokEAMjNzS2lx2QhGRvF1d+VqKioUf+v+fr6PqYek8vld5nPNx8bw93v3by8vMyEhIRehUJxd8eOHd+njtPfu2B+HwAA6+eHUxcTUMiBgQ/B11c96qCTG6+T6emuhILGIyfeR3Y6xVfD4116enpjSUnJyLIfmZmZf9u7d+/IorparTZZIpEM6fV6oqGhIVin072lVquhsLDwHXv7UKvV2y9evLjjhRdeOPjRRx/9IwBAdHR0d319fTB1jl6vJ7q7u3+tVCozi4uLs3Nzc4/m5+crXnnllcg//elPjfT146hzAWDMVlgxMTFdJ06ceIq6n5SUpDh69OiY7+XEiRMRKSkpT6qqqqbYir+0tDQaAI6wPWbeSWBk4+dnn3228NNPP32Wur969eqbJ06cSKLuP/XUU2nU11VVVZODgoLKAGC2rRjYKJXK84WFhUn0Y9QyLAAAUqn0VWbcxcXFSeZtqlzarNrV1/nChQt/9Pf3H2xsbHy6sbFx5PiePXv+CgB/zc3NLf3kk0/WuxIjHw4cOHAkIiLCFBMTc+vFF19U7Nq1q4n5Xn7w4IHvF198cRgApnPRJ1fv6fPnz1+iKmQAACtWrDi+a9euJgCA/Px8BdUOAEBhYeEaAIBNmzb9c3Fx8XtLlixpOXHihM1Y7f1dkcvldxsaGiLpjw8ODgZSX9++fTuA+fyGhoZIPz8/nclkcmmJIVdfz8OHDxcFBAQM1tTUzCktLR05Tn/v5ufnW3/vulopGIyP142qponFfFVB8IY3Lm5N7q6mjZeKmvm5o9rbsmXLHuZ50dHRo4ZDLVW0LFXNkpKSvt65c+dK+rnMv+DpbdP/SgUY/VcudUtMTGxj+X6uM9uy9b0wh6osDX2FhoYObd68eQH9L3EAIOlDOhqN5o/M5z377LOF9PbZKg30YRZHKmpsbZnjd7gtR6oSrr7OixYtKgMAMjIy0urK6dOnTzd5WkUtOjq6+4UXXvgL/Vzme9lSJdCZihoX72kA9uFK5vcRERHRzzzHWlXKld8VtudFRkY2UA/6+fnp2M6RSqU3mHG4872bnJxcBACkXC5vsvS6AAy/ltYqak7PUaMMmUzfrNeEG68jz/dnoQMQUm9v7wzbZ42Vk5MTc/bs2ZXM435+fo+Yx0JCQoz0+3q9nrC0rhubefPmnX/zzTdPM/phnfSamZn5N/NfpiOCg4PHJGVMGzdu/J35r/kREolkzNVPzO+FPvfGmrS0tIsffvjhjenTp/8HtRjt6tWrmw8dOvRTAIAf/vCH8vLy8h8xn+fn59dAv9/Z2Tnm6l1nFyGOiIjoYR7z9fUd80HGNDAwsMDWOZZw8TrPnj1bCgDQ1NQ0PTIyUsdMGGh97e/v72e92lkoISEhRqoqTLH0XnYVl+9ptmNisXjUuorTpk0b82HPtvesLbZ+VwAAwsLCxiSyHR0dNn/WUqnU6b+SuXg929vb4wAAGhoaZsvl8qaUlJSTFvr6H2vvXZcTNdLH52MAGF6bCTdeR57vz0IHwLegoKAHXLdpMBjetbTkB0v/YxKCioqK+Tk5OTH2PH/69OkWN41nmjFjxm57z6XT6/Vq22eN1dnZSdgzcTgoKKgGAODgwYPvt7S0+AEAceLEiZEhy6+//novWxLm6+t7jn4/JSWllX4/NDSUDA4Otvv1oYuLi9tJb2/Dhg2HzYvl8oaL13lgYCCEOt7U1DT9o48+2gSMCmxubm7phg0b3mltbXVpOg/X5HJ5qe2zuMHVezovLy+T7b1pD6PR6PAfEbZ+V8zt3o+IiBhZrDsyMvJGR0eH039A2IOL19NkMgVRxxsaGmZXVVWlA+29O2nSpL7ExMTLGRkZ7z169Mjie9flRM3vypVWcnDwPG68jrzAR+P5ak+Kr68v6yRaV3R0dETZe25wcDBrWb23t/fn9jw/JCTkrL19MStv9qqrqxvz/ZjntY0aDrlw4UIY87yenh6b/4EHBASwzruhXL9+PcWeOOfNm/eDmJiYboDhJC0zM/P1Dz/80GYVjM3BgwffN8+fIQCA+OyzzzY4044juHidAwMDrQ55XrhwISw/P3/9smXL6j1tWQhmFYpPfL+n7WHvgtp0tn5XAAB6enq+1dzcHALm925TU5PcmfgcwcXrGRIS8pj5GF17e7t/dXV13KpVq64988wz1yyd53KiBgAw1NW1HzdeR17gt0IH4A5BQUFvcd3m/fv3bU6it2VwcHDMf2hsqAnLtkRERDg9H6mlpWXMX6/mYRfC1q2wsHCtrfZtTb5/8uTJmMnPltq5du1aCAAQnZ2dPlxVwDZu3Pg7tVpdnpycPDIH58CBAzY/MB3FxevMtvG8JYWFhWv4WFbEWUFBQaxXzfKBq/f0gQMHSkJDQ50aMgwICGh29DmOXqgilUpvREVFNdKv9DSZTJxciEHHxesZHh5ud8X/6tWrC81z2sbgJFHzvXUrH/r7rV7qi5DA/msiVNMAhrd/SkxMbGd7rLOzc7K97SQmJraZL0zgBEmSEq7aQs6hr9FVWFi4prOzc8aGDRsOAwCRl5eXJXR8bA4cOFBijtEuLS0tz/EZz0SwZs2aMZdsGgyGWPr9r776Sky/HxoaSoaGhvI2lE4tz9HR0fHtxsbG+WKxOPSFF144CADEzp070/jq1xXl5eV/SUxMtHvz3Zs3b36H7TgniZrZbzlsCyEu6WGCvT+nTZtW6crzVSqVprq6ehI1lDFz5kyX94PjY0jWWdRwolCmTJnS587+Nm/evCAmJqaLWkYBYPg1qK+vl/I5BMrV6/zZZ59tOHbs2CqVSmWzQnXt2rWnuejT23D5np40adI2Znsmk2nU60pfAgcAwJVheWsIgugMCwvrb2xsHFkWKDo6uufChQtPMy/U4BJXr2d1dfXyzz//fK1cLrdZzOro6PBnO85ZokaQ5J8B4Iqt8xASwA8IkuwQOgh3KikpUbENDT558iSE7Xwm6ipNam9QqVTqcmWNjyFZZ33rW9+yuNSCO8yfP5+1f5IkI6w9b9WqVZdXrVp12dH+2tvb36WviQUAEBUV9b+OtuMoLl7nlJSUJ7t3796/bt26Cq1Wmwzm4aUtW7a8lZubezQ3N/dodHT0yAUszk6E93Zcvqc//PDDG0uXLl1MP3bmzJk11FI45iVGAGC4krZx48bX+LowZf78+V+1tbWNSgrj4uKcmpvqCC7fu88+++xx8zpwBAAQq1ev/iQxMbE2MTGxNigoaGTJD0tLOXFZUQMA2M5xewi56r8IktQKHYQQFi9e/EvmMb1eb/OqOJVKpamoqJhPPyYWi7dJJBK75q309PSImcfS09NvHTp0yOJkWXczL+46CtucFKbo6OiONWvWHHW1/7CwsF1sx20tvXHjxo0YsVhc42h/bMstiESiDkfbcRQXr/Pt27dDdu3alcc8Z9++fTvy8/MV+fn5ivr6+qdyc3OPAghfLRWKs6/1Sy+9dOv555//lHm8vb39XWq5DIDhCtqePXsOAgCZn5+/PiYmplutVh/ncu4kG3oljcLXEid0zr6eOTk5LW+//fabAAC3bt0K2bVr1wvMc06cOLGxuro6vrq6Or63t1eUmJhYCwBAT9roOE3UCJI8BQD/xWWbCLngCkGS24UOQiiFhYXvZGZmjpqcqtfrCWvbOgEA3Lx58wD1NUEQeoDheW/Lly8f81esyWQKZx7r7e0Npt+XSCSkRCL5NwfD59WBAwdKlErlBeZx5hZNdEuXLi168OCB+Pjx4y6vgJ+fn//Fd77znWrmcaPRmGzpOcuWLTtlNBqJoqKizY72x1Zl6u7uHrVGVF9fH+dz1Jx5ndevX3+go6PjKfrr3NPTI0pLSyuz1ldYWNgpAOGrpe7y2muvzW5vb29/7bXXNADOvdbx8fF/+8Mf/jD3008/fZ46lpeXlzlr1iyTSCTqoJbLYLtdu3YtxJ4La/jw+PHjRPr9zs5OJdd9OPN6PvPMM+Wff/75jJdeemkndaynp8dn5cqVx6z1NXXq1FMAAJGRkS1sj3NdUQPzByMOgSKh3QOANKGDEFpJSYmKmawZjcZstnNzcnJiEhMT2xoaGoLZHi8tLU1PT0+/RT9mMBjGXCZ/8+bNSfT7aWlp/6nVasds3yS04uLipcx1yrq6uv6V7dxly5Z92NDQ8N2MjIz/4Kr/v/3tb4tXr159k36su7ubdUHi1NTUV69fv56anp6+35m+2KpMpaWl0dQVknl5eZkXLlz4Adtz29rakmgrxzvMkdf5+eeff72iomJTQkLCH5iPnTp1at3KlStZK5EAAPfv31eHhoaSU6ZMGVPB8EYikYh1KQVqCZKqqqrSZ555JuQ3v/nNyO+Wo+/p2trajMTExIP0462trW+0tLT48nlhgCPYFrs9evSonNoVZefOnSu//PLLn7A919fXN5wgiM558+bZXASbjSOv57x5845ev359TWxs7CfMxyorK9d+73vf+xdL/TQ1NT1LEATMmzfvWdYT+NguZwhAOgTQ4QHbBeFtYt46hgDihNgqyhO2kGKTnZ39Bn3LF+ZWUgqFokIikQylpKQ8UKvV281bpZBKpXI/sy3mVlL0baTMGxaTAK5tys5kXo1+1Hnm72cMtu2m2LaQotC3rgkPDx+gb5m0cuXKXUuWLGmaPXv24PPPP/8687mWtsWx1Bcb87ZRI8+lb8oOAJCamnouKiqKtX97t30yL8DJFicJAKRMJhtcu3btu5Y2yAYYvTWOqxtbM1/nTZs2/XT16tU3QkNDh5jf59SpU3sBgAwNDe0BAHLJkiU11ObgAMObW69fv75+xowZg/YsRmwLl1tIMbdCAxj7Xra2mXxMTEwXW7vUzdJSJK68py39/G3dlErleWuvv7O/K8HBwX+31m9oaOiQVCq9YWkbKQAgzVeMAgD3711rr+eUKVN6zf1/BQBkbm5uKdt7VyQSkenp6a8AAPvnB18fTEMAcUOYrOHN/TePS9I8IVGjZGZmatn2AlUoFBXmxAkAAMwJGkk/RpeTkxOjUCgq5HJ5N7OttWvX1mRmZmotxWBtL1L67fDhwxt/8YtfnLH33E2bNjXbcy7bvqPUumLMc2fMmNGdmpp6jnk+27lsN2r/PnsolcoTCQkJbfTni8XiQbb+zaz2nZKSMupK3U2bNv2UuXdhSkrKE+YisXl5eZn0D6aYmJguRuLnUL90ll7nlJSUJ0qlknUX76lTp/YmJCTUAgCsWrXq/9LXz4Lhn9GgWq0utzYkZY2VPTWt3jZu3Pg7K8nHqNvu3bv37969ez/bYz4+PiM3kiTJV199dTkV2+bNmxcolcrzzOcoFIrrbHuwMr8vR97TNA6/FvQbM3nk4nclODj473K5/CH9/IiIiC56AgYwvOenuXpGAgAZFhbWz9jvk/P3rrXXc8qUKb0JCQlXAIZ//5g/S7b3LtvnB8HnhwhJEHEAcAoAJLx1gtA3rsDwFZ61QgfCRBAT8kI0hJCXiYmJ6WJeIeyIWbNmDZjntiEnsOVknM9RozN/YKbB8HwhhPh0GgDSPDFJQwghb7Fw4ULWTe/t1dLS4svFEDT6Bq+JGsBIshYHeIEB4s8ugiTTJtpaaQghxLVDhw79dOPGja+50obJZHqGq3iQGxI1AACCJDsIkowDAItX7CDkhCsAEE+Q5G+FDgQhhMYLvV6vBgDYunXry2DH3pYAQCgUiu8FBgYOAQD4+Pi0srWLnOTuSdVDAGlDALUeMOkcb9576xgC+K3QFwh448UECCFkDTXhPTo62uGFg+Vy+Q0AINeuXbuE+8gmBrbPD7dU1OgIkjxlrq69BMN7MCJkLz0MV2UjsYqGEELcysvLyywuLk5y9vl6vT5cIpGYysvLL3IZ10Tn9kSNQpDkOwAQCcMfvJiwIWuuwHBiH0mQ5G9xLhpCCHHPz8/vDvV1fX19MH3NL1tiY2Pf0+l00oULF/4nL8FNZEIPCZmHQ6VDAD8YwiFRvH1zaxoCeGcIIFLo9ycOfSKEJgr6GnpJSUl27am5dOnSL/z9/ck5c+Yc5ze68Y/t84PXddScYV577QcAoAKA2ULGgtzuCgD8GQBOjbdlNnAdNYSQt1AoFNdLS0ujAQAiIiJMK1asOD5//vx/3rVrVxP9PLlcfmNoaEgGABAeHv5SZWXlhwKEO66w5WQel6jRmZO2NNoNF84dX+7B8ILIpwBAO56HNDFRQwh5k7y8vMyBgYF/uX379tILFy6EMR9ftmyZLiUl5cuLFy+WY4LGHa9L1JhIgoiE4TXZ6DesunkPemJ2iiDJJiGDQQghhDydVyVqbEiCkMJwwpYGmLx5Ej0A1MJwUlYLALWYmCGEEEKO8fpEzRKSINJg+KrSSBhO4iIBEzi+3AOAJsCkDCGEEOLUuE3ULDHPe5PCcPImheEKnBQAFgkTkVe5AsMJWa353yaCJE8JFw5CCCE0vk24RM0a2jAqwHAiB/BNIieF8Z/MUZWxMTeskCGEEELuh4maE2hVOYBvEjnm11LwnMTuCgB0mL+uNX/dYf4aYHiosgMQQggh5FEwUXMTRrWOwnaMEmm+samFbxIv1mM4JIkQQgh5P0zUEEIIIYQ8lGB7fSKEEEIIIev+f+RCfwjJhqC+AAAAAElFTkSuQmCC' />"""
+
+
+def crear_parser(parser=None):
+    # Crear el objeto ArgumentParser
+    parser = parser or argparse.ArgumentParser(description='Graficar datos de un archivo')
+    parser.add_argument('-ex', '--datos_extendidos', nargs='?', choices=['s', 'n', '1', '0'], const='s', default=None, help="Mostrar estadisticas: 's'/'1' o 'n'/'0' (default: se pregunta)")
+    parser.add_argument('--umbrales', type=str, default=None, help='Valores minimos de TInt separados por comas (default: ' + ','.join(map(str, valores_minimos_default)) + ')')
+    parser.add_argument('--motor', choices=motores, default='c', help="Motor de lectura del CSV: 'c' o 'pyarrow' (default: c)")
+    parser.add_argument('--decimado', choices=metodos + ('no',), default='minmax', help="Reduccion de puntos al ancho del grafico: 'minmax', 'lttb' o 'no' (default: minmax)")
+    parser.add_argument('--incremental', action='store_true', help='Leer solo las lineas agregadas desde la ultima ejecucion (archivos que siguen creciendo)')
+    parser.add_argument('--partes', type=int, default=None, help='Leer el archivo de a N filas, para archivos mas grandes que la memoria (ignora la cache)')
+    parser.add_argument('--desde', type=str, default=None, help="Graficar desde esta fecha (ej. '2023-01-05' o '2023-01-05 08:00'); solo se lee esa parte del archivo")
+    parser.add_argument('--hasta', type=str, default=None, help="Graficar hasta esta fecha inclusive (ej. '2023-01-05 23:59:59')")
+    parser.add_argument('--remuestreo', type=str, default=None, help="Graficar min/media/max y aperturas de puerta por intervalo (ej. '1h', '1D') en lugar de cada lectura")
+    parser.add_argument('--puerta', action='store_true', help='Marcar cada apertura de puerta con la suba de TInt, el tiempo de recuperacion y un resumen por dia (no con --partes)')
+    parser.add_argument('--consigna', type=float, default=None, help='Temperatura a la que TInt debe volver despues de una apertura (default: la TInt antes de abrir)')
+    parser.add_argument('--histogramas', action='store_true', help='Agregar los histogramas de todas las lecturas del archivo (bordes fijos: 0.5 ºC y 1 % de humedad)')
+    parser.add_argument('--sin_cache', action='store_true', help='No usar la cache de archivos ya leidos')
+    parser.add_argument('--carpeta_cache', type=str, default='.cache_logs', help='Carpeta de la cache de archivos ya leidos (default: .cache_logs)')
+    parser.add_argument('--cache_mb', type=int, default=1024, help='Tamaño maximo de la cache en MB (default: 1024)')
+    return parser
+
+
+def valores_desde_args(args):
+    # (datos_extendidos, valores_minimos) segun -ex/--umbrales, o None si hay que preguntar
+    if args.datos_extendidos is None:
+        return None
+    if args.datos_extendidos in ('n', '0'):
+        return 0, []
+    if args.umbrales:
+        return 1, list(map(float, args.umbrales.split(",")))
+    return 1, list(valores_minimos_default)
+
+
+def preguntar_valores_minimos():
+    datos_extendidos = input("¿Mostrar estadisticas: (s/n) ")
+    while datos_extendidos != "s" and datos_extendidos != "n":
+        datos_extendidos = input("Por favor ingrese solo 's' o 'n': ")
+    if datos_extendidos == "s":
+        datos_extendidos = 1
+        datos_default = input("¿Usar valores por defecto?: (s/n) ")
+        while datos_default != "s" and datos_default != "n":
+            datos_default = input("Por favor ingrese solo 's' o 'n': ")
+
+        if datos_default == "s":
+            datos_default = 1
+
+    if datos_extendidos == 1:
+        if datos_default == 1:
+            valores_minimos=list(valores_minimos_default)
+        else:
+            valores_minimos=list(map(float, input("Introduce los valores minimos separados por comas: ").split(",")))
+    else:
+        valores_minimos=[]
+    return datos_extendidos, valores_minimos
+
+
+def leer_datos(fn_in, args):
+    # Se lee el archivo una sola vez y se trabaja en memoria; si el archivo no
+    # cambio desde la ultima vez se toma ya procesado de la cache
+    # Con --incremental solo se procesan las lineas nuevas del archivo
+    # Con --desde/--hasta solo se lee la ventana pedida (indice de tiempo)
+    desde = None
+    if args.desde or args.hasta:
+        df = leer_log_rango(fn_in, args.desde, args.hasta, carpeta=args.carpeta_cache, motor=args.motor, limpiar=False)
+    elif args.incremental:
+        df, desde = leer_log_incremental(fn_in, carpeta=args.carpeta_cache, motor=args.motor, limpiar=False)
+    elif args.sin_cache:
+        df = leer_log(fn_in, motor=args.motor, limpiar=False)
+    else:
+        df = leer_log_cache(fn_in, carpeta=args.carpeta_cache, max_bytes=args.cache_mb * 2**20, motor=args.motor, limpiar=False)
+    return df, desde
+
+
+ancho_grafico = 1200
+
+# color, leyenda y etiqueta del tooltip de las series conocidas, en el orden
+# en que se dibujan; los sensores extra (T3, H3, ...) toman colores de la paleta
+estilos = {'Puerta': ('red', 'Puerta', 'Puerta'),
+           'HExt': ('aqua', 'Hum Ext', 'Hº Ext'),
+           'TInt': ('purple', 'Temp Int', 'Tº Int'),
+           'HInt': ('violet', 'Hum Int', 'Hº Int'),
+           'TExterio': ('blue', 'Temp Ext', 'Tº Ext')}
+orden_tooltips = ['TExterio', 'HExt', 'TInt', 'HInt']
+
+
+def columnas_grafico(columnas):
+    # todas las lecturas del archivo y la puerta, segun la cabecera
+    return lecturas_de(columnas) + [col for col in ['Puerta'] if col in columnas]
+
+
+def estilo(col, i):
+    if col in estilos:
+        return estilos[col]
+    tipo, sensor = ('Temp', 'Tº') if col.startswith('T') else ('Hum', 'Hº')
+    return Category20[20][i % 20], f'{tipo} {col[1:]}', f'{sensor} {col[1:]}'
+
+
+def retomar(fn_in, args, nombre, filas, opciones):
+    # Lo que guardo la ultima corrida con --incremental, si cubre las mismas
+    # filas y se calculo con las mismas opciones; si no None
+    guardado = leer_objeto(fn_in, nombre, filas, carpeta=args.carpeta_cache)
+    if guardado is not None and guardado[0] == opciones:
+        return guardado[1]
+    return None
+
+
+def calcular(fn_in, args, valores_minimos, df, desde=None):
+    # Todo lo que el grafico necesita, con el archivo entero en memoria.
+    # desde: fila (del archivo crudo) hasta la que llego la ultima corrida
+    # con --incremental; lo calculado hasta ahi se retoma de la cache
+    num_filas = len(df.index)
+    incremental = desde is not None
+
+    # Read data
+    data_cds = limpiar_log(df)
+    if data_cds.empty:
+        if args.desde or args.hasta:
+            raise ValueError(f'{fn_in} no tiene lecturas completas entre {args.desde or "el inicio"} y {args.hasta or "el final"}')
+        raise ValueError(f'{fn_in} no tiene lecturas completas')
+
+    # Solo se envian al navegador los puntos que se pueden dibujar en 1200 px
+    # (min/max por pixel de cada serie), el resto del calculo usa data_cds
+    columnas = columnas_grafico(df.columns)
+    agregados = None
+    if args.remuestreo:
+        # Con --remuestreo se grafica la media de cada intervalo con la banda min/max;
+        # los agregados del archivo entero quedan en la cache por (archivo, intervalo)
+        ventana = args.desde or args.hasta or args.sin_cache
+        agregados = remuestrear(data_cds, args.remuestreo) if ventana else remuestrear_log(fn_in, args.remuestreo, df=data_cds, carpeta=args.carpeta_cache, max_bytes=args.cache_mb * 2**20, motor=args.motor)
+        datos_grafico = grafico_remuestreo(agregados, columnas)
+    else:
+        datos_grafico = data_cds if args.decimado == 'no' else decimar(data_cds, columnas, ancho=ancho_grafico, metodo=args.decimado)
+
+    # Piramide de resoluciones para el zoom
+    niveles = None
+    limpio = posicion_limpia(df, desde) if incremental else None
+    if args.decimado != 'no' and agregados is None:
+        intervalos = {nombre: intervalo for nombre, intervalo in niveles_piramide if intervalo}
+        previa = None
+        if incremental:
+            previa = {nombre: leer_agregados(fn_in, 'nivel_' + intervalo, limpio, carpeta=args.carpeta_cache) for nombre, intervalo in intervalos.items()}
+            previa = {nombre: nivel for nombre, nivel in previa.items() if nivel is not None}
+        niveles = piramide(data_cds, columnas, previa=previa, desde=limpio)
+        if incremental:
+            for nombre, _, nivel in niveles:
+                if nombre in intervalos:
+                    guardar_agregados(fn_in, 'nivel_' + intervalos[nombre], nivel, len(data_cds), carpeta=args.carpeta_cache)
+
+    # Extremos, promedios y tiempo de operacion en una sola pasada sobre el archivo
+    lecturas = lecturas_de(df.columns)
+    umbrales = list(map(float, valores_minimos))
+    if incremental:
+        # Con --incremental los acumuladores guardados solo reciben las filas
+        # nuevas, y los ciclos bajo valores minimos salen de los mismos
+        estadisticas = retomar(fn_in, args, 'estadisticas', desde, (lecturas, umbrales))
+        if estadisticas is None:
+            estadisticas = AcumuladorEstadisticas(lecturas, umbrales=umbrales)
+            estadisticas.agregar(df)
+        else:
+            estadisticas.agregar(df.iloc[desde:])
+        guardar_objeto(fn_in, 'estadisticas', ((lecturas, umbrales), estadisticas), num_filas, carpeta=args.carpeta_cache)
+        resumen = None
+    else:
+        estadisticas = AcumuladorEstadisticas(lecturas)
+        estadisticas.agregar(df)
+        # Tiempo, porcentaje y ciclos con TInt menor a valores minimos: TInt se
+        # ordena una vez y cada valor minimo es una busqueda binaria
+        resumen = PerfilExcedencia(data_cds['Tiempo'], data_cds['TInt']).resumen(umbrales)
+
+    # Histogramas de todas las lecturas con bordes fijos, sobre las mismas
+    # filas completas que el grafico y las estadisticas
+    histogramas = None
+    if args.histogramas:
+        histogramas = retomar(fn_in, args, 'histogramas', limpio, lecturas) if incremental else None
+        if histogramas is None:
+            histogramas = AcumuladorHistogramas(lecturas)
+            histogramas.agregar(data_cds)
+        else:
+            histogramas.agregar(data_cds.iloc[limpio:])
+        if incremental:
+            guardar_objeto(fn_in, 'histogramas', (lecturas, histogramas), len(data_cds), carpeta=args.carpeta_cache)
+
+    # Aperturas de puerta y su efecto en TInt
+    episodios = None
+    if args.puerta and 'Puerta' in data_cds and 'TInt' in data_cds:
+        episodios = episodios_incrementales(fn_in, args, data_cds, limpio) if incremental else \
+            episodios_puerta(data_cds['Tiempo'], data_cds['Puerta'], data_cds['TInt'], consigna=args.consigna)
+
+    return resultado_calculo(num_filas, columnas, datos_grafico, niveles, estadisticas, agregados, episodios, histogramas, resumen)
+
+
+def episodios_incrementales(fn_in, args, data_cds, limpio):
+    # Cada apertura afecta a TInt hasta la siguiente, asi que solo la ultima
+    # guardada puede cambiar con las filas nuevas: se recalcula desde la
+    # muestra anterior a ella (o a las filas nuevas si no hubo aperturas)
+    previos = retomar(fn_in, args, 'episodios', limpio, args.consigna)
+    inicio = 0
+    if previos is not None:
+        inicio = max(int(previos['posicion_inicio'].iloc[-1]) if len(previos) else limpio, 1) - 1
+        previos = previos.iloc[:-1]
+    parte = data_cds.iloc[inicio:]
+    episodios = episodios_puerta(parte['Tiempo'], parte['Puerta'], parte['TInt'], consigna=args.consigna)
+    episodios[['posicion_inicio', 'posicion_fin']] += inicio
+    if previos is not None:
+        episodios = pd.concat([previos, episodios], ignore_index=True)
+    guardar_objeto(fn_in, 'episodios', (args.consigna, episodios), len(data_cds), carpeta=args.carpeta_cache)
+    return episodios
+
+
+def grafico_remuestreo(agregados, columnas):
+    # la media de cada intervalo con el nombre de la lectura y la fraccion de tiempo con la puerta abierta como Puerta
+    nombres = {f'{col}_mean': col for col in lecturas_de(columnas)}
+    nombres['Puerta_abierta'] = 'Puerta'
+    return agregados.rename(columns=nombres)
+
+
+def calcular_en_partes(fn_in, args, valores_minimos):
+    # Igual que calcular() pero leyendo el archivo de a --partes filas: la
+    # memoria depende del tamaño de la parte y no del archivo
+    columnas = columnas_grafico(columnas_log(fn_in))
+    estadisticas = AcumuladorEstadisticas(lecturas_de(columnas), umbrales=map(float, valores_minimos))
+    piramide_partes = AcumuladorPiramide(columnas)
+    remuestreo = AcumuladorRemuestreo(args.remuestreo, lecturas_de(columnas)) if args.remuestreo else None
+    histogramas = AcumuladorHistogramas(lecturas_de(columnas)) if args.histogramas else None
+    for parte in leer_log_por_partes(fn_in, filas=args.partes, motor=args.motor):
+        estadisticas.agregar(parte)
+        limpia = limpiar_log(parte)
+        if not limpia.empty:
+            if histogramas is not None:
+                histogramas.agregar(limpia)
+            piramide_partes.agregar(limpia)
+            if remuestreo is not None:
+                remuestreo.agregar(limpia)
+    if estadisticas.inicio is None:
+        raise ValueError(f'{fn_in} no tiene lecturas completas')
+    if remuestreo is not None:
+        agregados = remuestreo.resultado()
+        return resultado_calculo(estadisticas.total_filas, columnas, grafico_remuestreo(agregados, columnas), None, estadisticas, agregados, histogramas=histogramas)
+
+    # La vista general sale del nivel mas fino que se pudo conservar
+    niveles = piramide_partes.resultado()
+    datos_grafico = niveles[0][2] if args.decimado == 'no' else decimar(niveles[0][2], columnas, ancho=ancho_grafico, metodo=args.decimado)
+
+    return resultado_calculo(estadisticas.total_filas, columnas, datos_grafico, None if args.decimado == 'no' else niveles, estadisticas, histogramas=histogramas)
+
+
+def resultado_calculo(num_filas, columnas, datos_grafico, niveles, estadisticas, agregados=None, episodios=None, histogramas=None, resumen=None):
+    return dict(num_filas=num_filas, columnas_grafico=columnas, datos_grafico=datos_grafico, niveles=niveles, agregados=agregados, episodios=episodios, histogramas=histogramas,
+                inicio=estadisticas.inicio, fin=estadisticas.fin,
+                fila_timin=estadisticas.filas_minimo.get('TInt'),
+                fila_temin=estadisticas.filas_minimo.get('TExterio'),
+                fila_temax=estadisticas.filas_maximo.get('TExterio'),
+                resumen=estadisticas.ciclos.resumen() if resumen is None else resumen,
+                columnas=estadisticas.resumen())
+
+
+def grafico_histogramas(histogramas, titulo=None):
+    # un histograma por lectura, de a dos por fila
+    graficos = [plot_histogram({col: conteos}, title=(titulo + ' - ' if titulo else '') + col, width=ancho_grafico // 2 - 20, height=300)
+                for col, conteos in histogramas.histogramas().items()]
+    return plots_to_grid(graficos, n_columns=2)
+
+
+def en_partes(args):
+    # --desde/--hasta ya limitan la memoria a la ventana, no hace falta leer de a partes
+    return args.partes and not (args.desde or args.hasta)
+
+
+def calcular_datos(fn_in, args, valores_minimos, df=None, desde=None):
+    if en_partes(args):
+        return calcular_en_partes(fn_in, args, valores_minimos)
+    if df is None:
+        df, desde = leer_datos(fn_in, args)
+    return calcular(fn_in, args, valores_minimos, df, desde=desde)
+
+
+def construir_grafico(fn_in, namedemo, args, datos_extendidos, valores_minimos, df=None, desde=None, resultado=None):
+    r = resultado or calcular_datos(fn_in, args, valores_minimos, df=df, desde=desde)
+    num_filas = r['num_filas']
+    datos_grafico = r['datos_grafico']
+    niveles = r['niveles']
+    inicio = r['inicio']
+    fin = r['fin']
+    columnas = r['columnas_grafico']
+
+    # Solo las columnas graficadas, como arrays binarios (float32, ms y uint8)
+    agregados = r.get('agregados')
+    tipos_grafico = {'Puerta': 'uint8'} if agregados is None else {}
+    bandas = [] if agregados is None else [col for col in lecturas_de(columnas) if col + '_min' in datos_grafico and col + '_max' in datos_grafico]
+    source = columnar_source(datos_grafico, ['Tiempo'] + columnas + [col + sufijo for col in bandas for sufijo in ('_min', '_max')], dtypes=tipos_grafico)
+
+    titulo = "Evolución medición - " + str(num_filas) + " valores."
+    if agregados is not None:
+        titulo += " Media, mínimo y máximo cada " + args.remuestreo + "."
+
+    us = figure(title=titulo, plot_height=500, plot_width=ancho_grafico, x_axis_type="datetime", min_border = 10,y_range = Range1d(),
+                x_range=Range1d(start=inicio, end=fin))
+    start = 0
+    end = 100
+    #us.extra_y_ranges = {"foo": Range1d(start=start - 4.55 + 0.0045455, end=end - 4.55 + 0.0045455)}
+    us.extra_y_ranges = {"foo": Range1d(start=start,end=end)}
+    # una linea por columna del archivo: primero las conocidas y luego los sensores extra
+    lineas = [col for col in estilos if col in columnas] + [col for col in columnas if col not in estilos]
+    for i, col in enumerate(lineas):
+        color, leyenda, _ = estilo(col, i)
+        us.line('Tiempo', col, color=color, y_range_name="foo", legend_label=leyenda, source=source)
+        if col in bandas:
+            us.varea(x='Tiempo', y1=col + '_min', y2=col + '_max', fill_color=color, fill_alpha=0.2, y_range_name="foo", legend_label=leyenda, source=source)
+
+    # Una franja por apertura de puerta, de alto completo, con su efecto en el tooltip
+    episodios = r.get('episodios')
+    if episodios is not None and len(episodios):
+        us.extra_y_ranges["puerta"] = Range1d(start=0, end=1)
+        franjas = columnar_source(pd.DataFrame({'inicio': episodios['inicio'], 'fin': episodios['fin'],
+                                                'segundos': episodios['duracion'].dt.total_seconds(), 'aumento': episodios['aumento'],
+                                                'recuperacion': episodios['recuperacion'].dt.total_seconds() / 60, 'costo': episodios['costo']}))
+        quad = us.quad(left='inicio', right='fin', bottom=0, top=1, y_range_name="puerta", source=franjas, fill_color='red', fill_alpha=0.15, line_color=None, legend_label='Aperturas')
+        us.add_tools(HoverTool(renderers=[quad], tooltips=[('Apertura', '@inicio{%F %T}'), ('Duración', '@segundos s'), ('Suba TInt', '@aumento{0.00}'),
+                                                           ('Recuperación', '@recuperacion{0.0} min'), ('Costo', '@costo{0.000} ºC·h')],
+                               formatters={'@inicio': 'datetime'}))
+
+    us.xaxis.ticker.desired_num_ticks = 10
+    us.yaxis.ticker.desired_num_ticks = 10
+    us.yaxis.ticker.num_minor_ticks = 2
+    us.yaxis.formatter = FuncTickFormatter(code="""return Math.floor(tick*100)""")
+    us.legend.location = "top_right"
+    us.legend.click_policy="hide"
+    tooltips = [col for col in orden_tooltips if col in columnas] + [col for col in columnas if col not in estilos] + [col for col in ['Puerta'] if col in columnas]
+    us.add_tools(HoverTool(tooltips=
+        [('Fecha',  '$data_x{%F %T}')] + [(estilo(col, lineas.index(col))[2], '@' + col) for col in tooltips],
+        formatters={
+            '$data_x': 'datetime',
+        }
+    ))
+
+    # Piramide de resoluciones: al hacer zoom se cambia a los datos min/max del
+    # nivel mas fino que entra en pantalla (todo queda dentro del HTML, solo
+    # los niveles que entran en max_filas_html)
+    nivel_div = Div(text="Resolucion: vista general", width=ancho_grafico, height=20)
+    if niveles is not None:
+        niveles = niveles_html(niveles)
+        callback = CustomJS(
+            args=dict(source=source, xr=us.x_range, div=nivel_div,
+                      niveles=[columnar_source(nivel, ['Tiempo'] + columnas, dtypes=tipos_grafico) for _, _, nivel in niveles],
+                      estado={},
+                      nombres=[nombre for nombre, _, _ in niveles],
+                      pasos=[paso for _, paso, _ in niveles],
+                      total=float((fin - inicio).total_seconds() * 1000),
+                      limite=2 * ancho_grafico),
+            code="""
+            // estado es un objeto JS del callback, no una propiedad de un modelo:
+            // guarda la vista general (los datos iniciales de source, sin otra
+            // copia en el HTML) y el timer, y nunca se serializa ni sincroniza
+            if (estado.general === undefined) estado.general = source.data
+            clearTimeout(estado.timer)
+            estado.timer = setTimeout(function () {
+                const span = xr.end - xr.start
+                let k = -1
+                if (span < 0.99 * total) {
+                    for (let i = 0; i < niveles.length; i++) {
+                        if (span / pasos[i] <= limite) { k = i; break }
+                    }
+                }
+                if (k < 0) {
+                    source.data = estado.general
+                    div.text = "Resolucion: vista general"
+                    return
+                }
+                const datos = niveles[k].data
+                const t = datos['Tiempo']
+                function buscar(x) {
+                    let lo = 0, hi = t.length
+                    while (lo < hi) { const m = (lo + hi) >> 1; if (t[m] < x) lo = m + 1; else hi = m }
+                    return lo
+                }
+                const ini = Math.max(buscar(xr.start - span) - 1, 0)
+                const fin = Math.min(buscar(xr.end + span) + 1, t.length)
+                const nuevo = {}
+                for (const col in datos) nuevo[col] = datos[col].slice(ini, fin)
+                source.data = nuevo
+                div.text = "Resolucion: " + nombres[k]
+            }, 150)
+            """)
+        us.x_range.js_on_change('start', callback)
+        us.x_range.js_on_change('end', callback)
+
+
+    header = Div(text=LOGO, width=412, height=100)
+
+    fila_timin = r['fila_timin']
+    fila_temin = r['fila_temin']
+    fila_temax = r['fila_temax']
+    tiempo_transcurrido = fin - inicio
+    columnas = r['columnas']
+    promedios = " | ".join(col + ": " + str(round(columnas.loc[col, 'media'], 2)) + " ± " + str(round(columnas.loc[col, 'desviacion'], 2)) + " (" + str(columnas.loc[col, 'nan']) + " sin dato)" for col in columnas.index)
+    extremos = [(texto, fila) for texto, fila in [("La TInt mínima: ", fila_timin), (" La TExt mínima: ", fila_temin), ("La TExt maxima: ", fila_temax)] if fila is not None]
+    footer_info = Div(text="<br>".join(texto + str(fila) for texto, fila in extremos) + "<br><br>Tiempo de operacion: " + str(tiempo_transcurrido) + "hs (" + str(inicio) + " | " + str(fin) +")<br>Promedios: " + promedios + "<br><br>", width=1200, height=120)
+
+    # Tiempo total de los ciclos con TInt menor a valores minimos
+    resumen = r['resumen']
+    footers = []
+
+    for valor_minimo in valores_minimos:
+        fila = resumen.loc[float(valor_minimo)]
+        if fila['ciclos'] == 0:
+            footer = Div(text="No hay ciclos con TInt menor a "+str(valor_minimo)+"<br>", width=1200, height=100)
+        else:
+            porcentaje_minimo = round(fila['porcentaje'], 2)
+            tiempo_minimo = fila['tiempo_total'].total_seconds()
+            tiempo_minimo_str = formato_duracion(fila['tiempo_total'])
+            footer = Div(text="Tiempo total con TInt menor a " + str(valor_minimo) + ": " + tiempo_minimo_str + "hs - " + str(porcentaje_minimo) + "% (" + str(tiempo_minimo) + "s) en " + str(fila['ciclos']) + " ciclos.", width=1200, height=100)
+
+        footers.append(footer)
+
+    for valor_minimo in valores_minimos:
+        us.add_layout(Span(location=float(valor_minimo), dimension='width', line_color='green', line_dash='dashed', y_range_name="foo"))
+
+    div = Div(width=400, height=us.height, height_policy="fixed")
+
+    # Aperturas de puerta por intervalo, con el mismo eje de tiempo que el grafico principal
+    graficos = [row(us)]
+    if agregados is not None and 'aperturas' in agregados:
+        barras = time_bars(agregados, 'aperturas', xvar='Tiempo', xrange=us.x_range, width=ancho_grafico, height=250,
+                           bar_width=0.8 * pd.Timedelta(args.remuestreo).total_seconds() * 1000,
+                           title="Aperturas de puerta cada " + args.remuestreo, hoover_tips=[('Fecha', '@Tiempo{%F %T}'), ('Aperturas', '@y')])
+        barras.select_one(HoverTool).formatters = {'@Tiempo': 'datetime'}
+        graficos.append(row(barras))
+
+    # Resumen de las aperturas y tabla por dia
+    aperturas = []
+    if episodios is not None:
+        diario = resumen_diario_puerta(episodios)
+        recuperados = episodios['recuperacion'].dropna()
+        texto = ("Aperturas de puerta: " + str(len(episodios)) + " - abierta " + formato_duracion(episodios['duracion'].sum()) + "hs"
+                 + " - suba media de TInt " + str(round(episodios['aumento'].mean(), 2))
+                 + " - recuperación media " + (formato_duracion(recuperados.mean()) + "hs" if len(recuperados) else "-")
+                 + " (" + str(len(episodios) - len(recuperados)) + " sin recuperar) - costo " + str(round(episodios['costo'].sum(), 3)) + " ºC·h")
+        aperturas = [Div(text=texto, width=1200, height=40), plot_table(diario, width=ancho_grafico, height=300, title="Aperturas por dia")]
+
+    # Histogramas de todo el archivo, no solo de lo graficado
+    histogramas = []
+    if r.get('histogramas') is not None:
+        histogramas = [grafico_histogramas(r['histogramas'])]
+
+    if datos_extendidos == 1:
+        layout = column(row(header), *graficos, row(nivel_div), *aperturas, *histogramas, row(footer_info), *footers)
+    else:
+        layout = column(row(header), *graficos, row(nivel_div), *aperturas, *histogramas)
 
+    #layout = column(row(header), row(us, text_input), row(footer))
+    return layout
 
 
-# Crear el objeto ArgumentParser
-parser = argparse.ArgumentParser(description='Graficar datos de un archivo')
-parser.add_argument('archivo', type=str, help='Nombre del archivo a procesar (con extensión)')
-parser.add_argument('nombre_grafico', type=str, help='Nombre del archivo de salida (sin extensión)')
-parser.add_argument('-ex', '--datos_extendidos', nargs='?', default=[1], help='Devuelve valores extendidos o no (default: 1 activado')
-
-args = parser.parse_args()
-
-
-fn_in = args.archivo
-namedemo = args.nombre_grafico
-fn_out = (args.nombre_grafico+".pkl")
-
-df=pd.read_csv(fn_in)
-df.to_pickle(fn_out)
-num_filas = len(df.index)
-
-NAME_DEMO = ("Logger " + namedemo)
-
-print(f'Graficando {NAME_DEMO}...')
-
-datos_extendidos = input("¿Mostrar estadisticas: (s/n) ")
-while datos_extendidos != "s" and datos_extendidos != "n":
-    datos_extendidos = input("Por favor ingrese solo 's' o 'n': ")
-if datos_extendidos == "s":
-    datos_extendidos = 1
-    datos_default = input("¿Usar valores por defecto?: (s/n) ")
-    while datos_default != "s" and datos_default != "n":
-        datos_default = input("Por favor ingrese solo 's' o 'n': ")
-
-    if datos_default == "s":
-        datos_default = 1
-
-if datos_extendidos == 1:
-    if datos_default == 1:
-        valores_minimos=[-10, -12.5, -15, -17.5]
-    else:
-        valores_minimos=list(map(float, input("Introduce los valores minimos separados por comas: ").split(",")))
-else:
-    valores_minimos=[]
-    
-
-
-# Read data
-variables = ['Tiempo','TInt','HInt','TExterio','HExt','Puerta']
-
-
-pklpath_cds = df.to_pickle(fn_out)
-data_cds = read_pickle(fn_out) 
-
-data_cds = data_cds.dropna()
-
-data_cds['Tiempo'] = pd.to_datetime(data_cds['Tiempo'])
-#print(type(data_cds['Tiempo']))
-#print(data_cds.columns)
-
-x = obj=data_cds['Tiempo']
-y = obj=data_cds['TExterio']
-y2 = obj=data_cds['HExt']
-y3 = obj=data_cds['TInt']
-y4 = obj=data_cds['HInt']
-y5 = obj=data_cds['Puerta']
-
-source = ColumnDataSource(data_cds)
-
-titulo = "Evolución medición - " + str(num_filas) + " valores."
-
-us = figure(title=titulo, plot_height=500, plot_width=1200, x_axis_type="datetime", min_border = 10,y_range = Range1d())
-start = 0
-end = 100
-#us.extra_y_ranges = {"foo": Range1d(start=start - 4.55 + 0.0045455, end=end - 4.55 + 0.0045455)}
-us.extra_y_ranges = {"foo": Range1d(start=start,end=end)}
-us.line('Tiempo', 'Puerta', color="red", y_range_name="foo", legend_label="Puerta", source=source)
-us.line('Tiempo', 'HExt', color="aqua", y_range_name="foo", legend_label="Hum Ext", source=source)
-us.line('Tiempo', 'TInt', color="purple", y_range_name="foo", legend_label="Temp Int", source=source)
-us.line('Tiempo', 'HInt', color="violet", y_range_name="foo", legend_label="Hum Int", source=source)
-us.line('Tiempo', 'TExterio', color="blue", y_range_name="foo", legend_label="Temp Ext", source=source)
-
-us.xaxis.ticker.desired_num_ticks = 10
-us.yaxis.ticker.desired_num_ticks = 10
-us.yaxis.ticker.num_minor_ticks = 2
-us.yaxis.formatter = FuncTickFormatter(code="""return Math.floor(tick*100)""")
-us.legend.location = "top_right"
-us.legend.click_policy="hide"
-us.add_tools(HoverTool(tooltips=
-    [
-        ('Fecha',  '$data_x{%F %T}'),
-        ('Tº Ext', '@TExterio'),
-        ('Hº Ext', '@HExt'),
-        ('Tº Int', '@TInt'),
-        ('Hº Int', '@HInt'),
-        ('Puerta', '@Puerta')
-    ],
-    formatters={
-        '$data_x': 'datetime',
-    }
-))
-
-
-header = Div(text="""<img style='display:block; width:200px;height:70px;' id='base64image'
-      src='data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAmoAAADICAYAAABYmc2zAAABN2lDQ1BBZG9iZSBSR0IgKDE5OTgpAAAokZWPv0rDUBSHvxtFxaFWCOLgcCdRUGzVwYxJW4ogWKtDkq1JQ5ViEm6uf/oQjm4dXNx9AidHwUHxCXwDxamDQ4QMBYvf9J3fORzOAaNi152GUYbzWKt205Gu58vZF2aYAoBOmKV2q3UAECdxxBjf7wiA10277jTG+38yH6ZKAyNguxtlIYgK0L/SqQYxBMygn2oQD4CpTto1EE9AqZf7G1AKcv8ASsr1fBBfgNlzPR+MOcAMcl8BTB1da4Bakg7UWe9Uy6plWdLuJkEkjweZjs4zuR+HiUoT1dFRF8jvA2AxH2w3HblWtay99X/+PRHX82Vun0cIQCw9F1lBeKEuf1UYO5PrYsdwGQ7vYXpUZLs3cLcBC7dFtlqF8hY8Dn8AwMZP/fNTP8gAAAAJcEhZcwAACxMAAAsTAQCanBgAAATtaVRYdFhNTDpjb20uYWRvYmUueG1wAAAAAAA8P3hwYWNrZXQgYmVnaW49Iu+7vyIgaWQ9Ilc1TTBNcENlaGlIenJlU3pOVGN6a2M5ZCI/PiA8eDp4bXBtZXRhIHhtbG5zOng9ImFkb2JlOm5zOm1ldGEvIiB4OnhtcHRrPSJBZG9iZSBYTVAgQ29yZSA2LjAtYzAwMiA3OS4xNjQ0ODgsIDIwMjAvMDcvMTAtMjI6MDY6NTMgICAgICAgICI+IDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+IDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PSIiIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIgeG1sbnM6ZGM9Imh0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvIiB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIiB4bWxuczpzdEV2dD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wL3NUeXBlL1Jlc291cmNlRXZlbnQjIiB4bXA6Q3JlYXRvclRvb2w9IkFkb2JlIFBob3Rvc2hvcCAyMi4wIChXaW5kb3dzKSIgeG1wOkNyZWF0ZURhdGU9IjIwMjAtMTEtMjRUMTA6MDA6MzMtMDM6MDAiIHhtcDpNb2RpZnlEYXRlPSIyMDIwLTExLTI2VDE2OjQ4OjE5LTAzOjAwIiB4bXA6TWV0YWRhdGFEYXRlPSIyMDIwLTExLTI2VDE2OjQ4OjE5LTAzOjAwIiBkYzpmb3JtYXQ9ImltYWdlL3BuZyIgcGhvdG9zaG9wOkNvbG9yTW9kZT0iMyIgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDpiNGE4ZDM5MS04MThjLTIxNDctOWVmMC01MGVmMDg4NDViOTciIHhtcE1NOkRvY3VtZW50SUQ9InhtcC5kaWQ6YjRhOGQzOTEtODE4Yy0yMTQ3LTllZjAtNTBlZjA4ODQ1Yjk3IiB4bXBNTTpPcmlnaW5hbERvY3VtZW50SUQ9InhtcC5kaWQ6YjRhOGQzOTEtODE4Yy0yMTQ3LTllZjAtNTBlZjA4ODQ1Yjk3Ij4gPHhtcE1NOkhpc3Rvcnk+IDxyZGY6U2VxPiA8cmRmOmxpIHN0RXZ0OmFjdGlvbj0iY3JlYXRlZCIgc3RFdnQ6aW5zdGFuY2VJRD0ieG1wLmlpZDpiNGE4ZDM5MS04MThjLTIxNDctOWVmMC01MGVmMDg4NDViOTciIHN0RXZ0OndoZW49IjIwMjAtMTEtMjRUMTA6MDA6MzMtMDM6MDAiIHN0RXZ0OnNvZnR3YXJlQWdlbnQ9IkFkb2JlIFBob3Rvc2hvcCAyMi4wIChXaW5kb3dzKSIvPiA8L3JkZjpTZXE+IDwveG1wTU06SGlzdG9yeT4gPC9yZGY6RGVzY3JpcHRpb24+IDwvcmRmOlJERj4gPC94OnhtcG1ldGE+IDw/eHBhY2tldCBlbmQ9InIiPz7al7fnAABRkElEQVR4nO3dfVxU55kw/uswvIdhRqKioyJWpQ5C5EUR0UXwjTrQYTITQ6UuaWO7trvaNbU2v237PKlp0l2TNck25knsbmxjLYmJkIEIFlFRoqxvIIqColYEHaMSYBheBgY4vz+YQw6HM+/nzJmB6/v5zEfmzJn7vhgG5+K673PfBEmSgBBCCCGEPI+P0AEghBBCCCF2mKghhBBCCHkoX6EDGI8GYmIUI3cIYi5BEHNG7vv4SAmCiLH0XEIkWsJ2nBwcvDhyzo0bRjAah2gPn2J5yqhjBEmynYMQQgghD0bgHDX7mBYujCIIYh74+IQRAAkAAIRI9AwAhJq/Zk2wOGcwADQ2utrKFQDoMH9da/66w/w1AEAtQZIdgBBCCCFBYaJGMxAToxhJxHx8ZhMEMQsIYibh4zNd6NhG1NUB9Pe7q7d7ANDEcsNEDiGEEHKDCZeomRYtmkwMDiaBSLSYIIhIgiBiCJFIDgAhQsdm09dfAzQ1CR0F3Wn4Jnk7BQBNBEk2CRcOQgghNL6M60TNFBu7jABYTBDEHEIkWuE1CZkl7q2mueI0DA+j1sJw9a1WyGAQQgghbzVuEjXTwoVRhEiURPj4rDJXydwzZ8xddDqAhw+FjsJZehhO2k4BwCm8sAEhhBCyj9cmaqbY2GWEj89aHx+fVCCIaI+aR8a1wUGAa9cABgaEjoRLVwBAC5i4IYQQQhZ5TaJGT8wIkWgpePMQpqO8u5pmDz0MV9u0AKDFCxUQQgihYR6bqJkWLZpMDA1tJESiNMLHZ9m4rphZ09cHcOPGeKum2VIEmLQhhBBCnpWomRYujCJ8fb/nIxLlEj4+3xY6Ho/Q1DR8tefE9REA/BmHRxFCCE1EgidqptjYZT4i0Y8JH5/vTNiqmSV9fcNz0xDA8JpuvyVI8s9CB4IQQgi5iyCJmmnRosk+JPkrwtf3e5icWXHnDkBHh9BReBpM2BBCCE0Ybk/UBhYt+r8iP7+dMJEuBnAGN1tFjWf3AOAHOCSKEEJoPHNbomZatGiyyMendNytb8aXxsbhZA3Z8l8wXGHrEDoQhBBCiGs+7ujEFBu7TCQSXcUkzU4GAyZp9vtXAKglCSJO6EAQQgghrvGeqJliY5f5BgQcw7loDvCs/Ty9wWwAOEUShEroQBBCCCEu8ZqoUUka4Hw0+339tbfs5+lpJADwOUkQaQLHgRBCCHGGt0TNtGjRZJGfXwFgkma/wcHhXQiQK7Q4DIoQQmi84C1RE4lEZ3C400GPHmE1zXUSAPgzSRBSoQNBCCGEXMVLojYYF7cfdxZw0OAgwJMnQkcxXiwCgN8KHQRCCCHkKs6X5xiIiVGIAgNLOG10Ihj/G68LIZ4gyVqhg0AIIYScxWlFzbRo0WQff///4bLNCaGvD5M0frwjdAAIIYSQKzhN1HwI4g2cl+YETNL4shKX7EAIIeTNOBv6xCFPJ+HG63y7R5BkpNBBIIQQQs7grKLm4+f3W67amlDu3RM6gvFuNlbVEEIIeStOErWB2NhtuD2UE3CrKHfZLnQACCGEkDM4SdR8/Pz+jYt2Jhycm+YuK3ERXIQQQt7I5URtIDZ2G15A4ISODqymudd2oQNACCGEHOXragNYTXNSS4vQEUw0KpIgpARJdgjROUEQQnQ74SmVyn1DQ0NJOp1uTk1NjYTtnISEBH10dHRFb2/vbwoKCq67O0a67Ozs1yIiIlrpx0wmU3hra+syo9Eo0el0c27duhWakZFRefjw4TR3xLRt27btzGPujunnP/95jslkslgQoOIBAKBi6u7uDrh582ZgRkbG+bKysmQ+4kKIa2wXeLqUqA3Exm4TBQRgNc1RuPG6ECQAoAKAPwvReUZGxrmysrKlQvTtJEczS25XzmZw5MNWo9Es7Orq+rCqqiqpuLjY5vdRU1MjqampUYnF4uzMzMzjJSUl6xyIi9Ofa1FRkcttPPfcc6cOHz68koNwAADg3Xff5aQdV+J66623OIkBIW/k0tCnj5/fv3AVyISBG68L6QdCB4D4pVQq9x07dqyurKxsqcFgcCjZNBgMRElJydrU1NS7fMWHEEKOcrqiZl43jbP9PIn33uOqKc82MDB8Q7bV1gK5fTuXLa4kCSKSIMkmLhu1h6VqkEwmM+l0OpenIDiDyyGh7Ozs1wEASJKc0tXVtfzixYvRjiZKlqSmpjaFhIT83tZ5q1atulZcXLzQ1f4qKysjs7KyPj1y5Mjzts618frxWmW0xMbwoyAxAXhuXAh5Oqc/IAhf381cBgJLvWlUCHkxFXjQ1lILFiy4qdPpXE4unFFVVZXEVVtFRUW/YR5zdVgwKirKGB0dvVOr1e61dW5qaurdkydPRjrbF1NNTc2zXLWFEEKucGro07Ro0WQfX18118Eg5AYqoQOgCw0N/UCovg0GA6FUKvfx1X5ZWVlyVlbWZ848NyoqyhgbG7vYniQtIyPjXGVlZaQz/Vii0+l8s7OzX+OyTYQQcoZTiRoB8M9cB4KQm6wkCUIqdBAUrVa7VyaTCTYW3tHRYffEeWccOXLk+YyMjPOOPIdK0uy5AlOj0Sj5ukjDaDSu4aNdhBByhFOJmo9IlMt1IAi5kUroAOgWLFhwU6i+L1++PJvvPkJCQjaLxWK75iA5kqQBALS3t9ucu4YQQt7M4UTNtHBhFOHjw9lFBAgJIE3oAOgmTZr0K6H6NhgMRFZW1qd89lFQUHA9Pj7e5qa2YrGYjI6O3unIWmY3btzA/4sQQuOaw4maj0j0Ez4CQciNVEIHQFdQUFAcFRVlFKr/1tZWztbcsiQ0NPSirXNWrlx52J45aXRCXTGLEELu4nCiRvj6fo+PQBByI4mn7f05f/78L4Xq+9y5c1M1Gg2vV56KRKJGa48nJyc/tmc5DHcKCgo6KHQMCCHkUKJmHvbEnQjQeJAmdAB0gYGBDlWSuNbX1/cKn+0TBPGVpcfEYjE5Y8aMH/PZv6Pi4uI6Ha3uIYQQHxxK1LCahsYRldAB0I334U+RSNRs6bGUlJQLBQUFxc60y8cVs2KxmJw7d+4/ct0uQgg5w6FEDa/2RONInNABMHnA8KeSr/YHBgZYF9eVyWQDruyOEBsbW+18VGOJxWJy1apVv3c2cUQIIa7ZnaiZFi2ajFd7onHE4+apBQYGviRk/0ajcStfbZMkOYXteEJCwueutBsSErKZq6qaWCwmV69e/TO2XRYQQkgodidqBEl+h89AEBJAmtAB0BUUFFxPTk5+LFT/t27d+ge+2u7r61vEPBYXF9fp6gUEBQUF15OSkl6yd502S5KTkx+vW7cuFuelIYQ8jf2Jmo+PR+x9199sczkm5GEG9XoY1OuFDoNNmtABME2ePPm0UH03NjYG8jX8+ejRIznz2OzZs9/lom2tVrt33bp1qri4uE5HnxsXF9eZnZ39+rlz58IdWb8NIYTcxe41iAgfn2V8BmKvln/ZApM2boKw3E1u67O/vx/6+vrc1h8fAgICwN/f3+39Dur1cOe7GSD7/ZsQsoK3go2z4oQOgCkgIGAXAGwQqn/z8Cfn87Nqa2tD6fdlMtkAl0OM5jllkuzs7Nfa29u/f/v27Zlsa6zJZLKBiIiItqeffvpKYGDg3oKCguLa2lquwkAIIc7ZlaiZFi6M8g0K8phlOVq2boGQFf8A/hG8734DAAA9PT3Q0tJi17mDg4MwODjIc0SOmzVrFkydOtXt/T75YC/0Xqtze792mk0ShJQgyQ6hA6FQw5/nzp1z/w8LAC5fvpzOdZtKpXJfcfHo3C8hIeFznU7HdVdgTv4sJoA6nQ746BchhPhi19An4eOTwXcgjnq0+3W39SWVSsHHx/ZLRZKkRyZpAABPP/202/sc1Ouh9X2Pn/ITJ3QATEIOf+p0Ol+VSsXpRQXMjd9lMtmApy1uixBCnsq+RE0kSuM5Doe1ffxX6G++B3U11fDo4UPe+5NIJDbP8dQkTSqVgkgkcnu/Tz7YC4OdDk8bcrc0oQNgCggI2OXq5HhXdHZ2crpNHHPj9/j4+Aou20cIofHM3ooar9vLOKvt44Ogb2+H/P/5I+jb23ntKywszOrjJEnC0NAQrzE4S4hqGgCwVtNKCj6D5rt/FyAai+KEDoDJ3k3M+cLlRudZWVmfGgwGgrovFotJoZchQQghb2IzUfPk9dNa398LRHc39BmNUFfD6bqXYwQHB4Ovr+UpfQMDnC+QzgmCIKC9vR3u3r076mY08rsIflv+wTHVtLqaaqirqeG1XydECh0AG6lUekyovnU6nW92dvZrXLR1//79UdMm4uPj7+HVlQghZD+bFxMQg4NJ4OfnjlgcNtjZCf4lxQCTp8LFqrOwePkKCAwM5K0/sVgM7SyVu6GhISBJwUaqrLp9+zZcvXp1zPHf/IbfNT3Z5hCeOXGc1z6dNGZ9L09QXFy8RSwW/5hejXKn9vb274OVSfn20Gg0yoKCglFXe06ZMuVfXQoMIYQmGJsVNcLHZ407AnGWX0kx+PX1QZ/RCJfOnuG1L0tXTXrq3DQAgHv3xo6gxcfH85rQtuUfhP6W0Vs7Pv5KB/qODt76dIWn7VBAEXL4kzmvzBlPnjz5L/r9uLi4TtyaCSGEHGM7UROJnnFHIM4ienog8motAABcrDrL65Cev78/BAQEjDrmydW0np4e0LMsNBsdHc1rv2zVtLpqfoemXRQpdABshBz+NBgMhFKp3Ofs8zUazUJmshcREfGJ65EhhNDEYnsdNYLg91OdAzNu1sOtJUtHqmorVvNXBJRKpfDo0aOR+55cTbtz586YY4GBgSCXj1kknjNs1TQAgEdfPQSQzeStXxfFAYBW4BjGKC4u3iKTyV5kW7jVHZjLajiir6/vFfqwrUwmGyguLt7CTWTOUalUW0mSnMY8Pjg4GGUymSIAvtlB4c6dO2Jz/IIMPSP+aTSahQMDAxuNRuMavV4/p62tLbSxsZF1qEEsFpNz5841hIeHNwQFBR30tK3GVCrVVpPJpDQYDPM7OzvDaO9fVtT3ExYW1hISEnLWz8/vD540d5T62bA9Rv991ev1c4xGY2BtbW1oRkbG+bKysmT3RuoeVj8ATIsWTfb18/OYhW4tCTIYYMaNBniwQA51NdVuS9QGBwc9tpoGAKwLe8bHx/PaZ/vHB3ltnyeRQgdgyYIFC27qdDpBrrq+fPnybI1Gs9CZ/8AbGxu/S78fHx9f4exCsxkZGefKysqWOvVkGq1W62oTyMupVKqtvb29m+7evbuooKDA7vkfBoOBMO+usRQAlspksrcTEhI+F3I9QKVSue/x48eq69evT9FqtQ79QUH7fhaab/+UnJz8eOrUqVpX/6Di4ve1oKDAladbpNFoFhqNxrdv3br1D8ykXCaTDcybN+/+lClT/tXTpmhYTdQ8+UICpvmXzsGDBXLQd3RAXU01xCYk8tKPv78/BAcHQ3d3t0dX0x4+fAg9PT1jjickJPDWZ9eZL6Hr7Je8tc+jSKEDsCQ0NPQDAOBkT0xHGQwGoq+v7xUAcOjDKDs7+7WioqKR/wRxSQ4kpN7e3vBVq1Zdu3Hjxre1Wi0n1WmdTuer0+k2yGQy05IlS3ZzuR2aNRqNRtnV1fWrqqqqpOLiYruTszVr1tyZN2/eZ35+fo8AALq7u2POnj37/Zs3b478npp3Q/knmUz2otBJKB8yMjLOHTt2LMlSpdH8M40EgKJVq1ZdP3nyZIx7I7TM+ptWJFrspjhcRq+qnTlxnLdEDWC4qmYwGHhrnwts1Ytp06bB9On8FUjduVsEx+KEDsASrVa7VyaTvS3U8Gdra+tKR59jvmJ0xJIlS+pdGVaxNpzBVbUNjV+VlZWRfLWt0+l8i4qKfr1q1SoVnx/sGo1mYXt7+6GCggKHq+svvvjih/v37//R8eOjr7r/9a9//bvDhw/foCdrAN8koVFRUb3R0dE7HR3mtTH86PYhKJVKtbW+vv7NsrIyuyuoJ0+eXJiamnq3srJyDp+x2cvqxQQEQUS6KQ5OzL90DgBgpKrGF6lU6tHVNJPJBM3NY+eJYTXNItvbTghowYIFN4Xq+9y5c1M1Go3dHw4ajWYh84Nx0qRJv+I8MIQ8yMmTJxdGRUX1OvK7Yi+lUrnv2LFjdSdPnnS47YSEBP3+/ft/xPbY66+/fi8zM/MHlp7b2NgYqNVq383IyDjnaL+eQqVSbT1x4sQfLM09tKaysjIyKyvrUz7icpStRM1jSn/2CDIYIEx3HwD4XbNLJBKBVCrlrX1XPbSwpRafiZoXV9MAAIAkiDShY7DEPPwpGPPwp126uro+pN9PTk5+7GnzPdDE8txzz52G4YtCCAAgfv3rX0du27btpU2bNmm53KqtsbExsK6u7hJXyZpGo1mYnJz8qLi4+J+cXU8xKSnpfWuPv/XWW4dkMpnV1drLysqWpqam3uUjCeUTlaS5shZlTU3Ns1zG5CzriZpIxN/lgTyZf/E8AAxX1Rrr63nrx5MTNba10+RyOW9rp/U33/PmahpFKnQAlmi12r1RUVH8biVhBXN3AWvq6upGzTkIDw//b+4jQsh5r7/++r133333nYMHDz77s5/9bA7XydqDBw9OutqOSqXaWldXd8k8b8xpEomkxNY506ZN67Z1TmVlZSSXSSjfuEjSAIaHgV1ZpogrttZRC3FLFBwK0z0YqapdquJvAVyhNjq3paenB1pbW8cc53NJDm+vppnFCR2ANfPnzxcsE66trQ3VaDRKW+cplcp99Ll0MplswF2TrBFyxuuvv35vw4YN+7ls89y5c1NdGS50ZbiOaffu3TY/BGUy2V172uK6YsgXjUaj5CJJo/T19Qm+e43FRG0gJkbhzkC4RFXVmu/e5W0DcE8d/mSbmxYYGMjbsGd/8z1o+/ivvLTtZlKhA7AmMDBQ0HWbjEbjVlvnPH78WEW/n5CQ8DlvASHEEUtzuFxRVla21Jn9crmqBDkiMDBw7KroFjQ2NgY+efLkCJ/xuKquru4Ql68ftbaikGzuTOCN6FU1PueqeWKiZmnYky/jpJoG4OEVtYKCgmIhhz9v3br1D9Ye12g0SvowjVgsJgMCAnbxHxlCrktISLA7WbFXQ0PDDkfO57oSxJfKysrIzMxMwXZNsWbVqlXXuKhEehrLiZoXLc3BZuaNBgDgt6rmacOfra2trGunpaSk8NLfOKqmAXh4RQ1A2OHPxsbGQGvDn+3t7b+n33d1SQ6EvF1jY2OgI1cNcl0J4lNJSclalUpls8ruTmVlZUuduTLWG1hM1AiSlLoxDs7NuNkAQYZOAADel+rwFGzVNKlUytvaaU8+eI+XdgUi+DwEW4Qe/uzq6rK4zMbFixdHbTWHS3Igb/Ktb32rlo927b1q0BsrQU1NTR45nCIWi0mNRhOTnZ3NSXyBgYGCjWRQLFfUfHxmW3zMS1Bz1epqakDf3s5LH1OnunRRDqfYluXgq5o2qNdDe/5feGlbKCRBSIWOwZqCgoLiuLi4TqH6Z17RScnKyvqUXglITU1twiU5ELLvqkGVSrXVGytBtbW1oZ6yzhjdypUrD3NZzZdIJHZdbMEnyxU1gpjlzkD4QK+qnTnJz1y14OBg8Pf356VtRzQ3N4PJZBpznK/5aU8+2AuDnYLlDHyJEzoAW2bOnFkmVN86nc6XbbiDuXzHpEmTxs14OEKu6ujoWGftcU+tTNnDU9YZo8hksgFq6ytfX98LXLQZFBQk+AbWlitqBBHqxjh4446qmicMf7JtGTVnzhyYNGkS530N6vXQ+r6go3ATltAT9Ds7O39Cv69SqbaaN3cGAICoqCgjLsmB0DcuX75scXQqOzv7Nfrvj7fxlHXGKPQrzbm4AEsmkw04uoUWHyxX1Hx8vu3OQPgy42YD+PX1AQB/VbWnn36al3bt1dPTwzrsGR8fz0t/47SaBgCQJnQAthQUFFxPTk5+LFT/N27cGPX/Qltb26gr26Kior5wb0QIeTaDwUBYWqqDuS+uN2IuyyMUsVhMMjeSd/X/o8WLF3O6xp6zxuXyHEyRV2sBYLiqZjRyPy8wODgYgoKCOG/XXmxJWmBgIERHR7Oc7br2fMErwRPa5MmTTwvVN/0vaI1Gs5BeLWD7jxIhBDAwMJDEdtxatc1bOLofMF/i4+PHXE135MiR552tqqWmpjYVFxdvcT0y17EmaqaFC6PcHQifIq9eHqmqXTrLz24FkydP5qVde9y+fXvMMb62jGrLPwj9LWMX1R0n4oQOwB5CD39Sc26MRuPb9IsIUlJSOJkTgtB4YzAY5jOPKZXKfd6yHIctjuwHzJegoKBHbMdjY2NzHN0mLCoqyjhlypQsbiJzHWuiRhDEPHcHwiff/v6RqtrFqrO8VNWEmqem1+tZ107jayeCcbTALRup0AHYo6Cg4HpqamqTUP1TVYDLly+n04+HhIT8nv0ZCE1snZ2dYcxjnrA1EVc6OzuXCB2DJQUFBcXr1q1T2VtZW7Vq1fXGxsYgT1oHckIMfQJ8U1XrMxp5qar5+/sLMvzJtmWUVCqFOXPmcN7XOK+mAXhJogYAIJVKBVsZ3GAwEKtWrbpG39cTl+RAyLKenp4xSwN4wtZEXLl9+/ZMoWOwpqCgoLixsTEoKyvrM7Y5vjKZbCA1NbVJo9Fknzx5MkaIGK3xZT1KEHPdHAfvfPv7YcbNBmh6Jg4uVp2FxctXcD40OHnyZGhpaeG0TVvcuWXUOK+mAXjBoreU4uLiLWKx+MdCDZ0w133CJTkQsoxtMVu25I0HNof8Dh8+7HIn9D/aPJmlObQ6nY515QRPYWnok/tyjAeIvHoZAAD6jEZeditw99WfDx8+ZF07jY9FbvUlX4z3aprXYZs8K4S4uLhOXJIDIcd4204EtjizCT2yz4QZ+gQACDIYYIZ5D1A+hj9FIpFb56qxVdOmTZvGy9ppreNruyiLSIKIEzoGewk5/Ekn5CK8CCGrCHfd8I81/kyoRA0AYP6lcwAAoO/o4KWq5q5EzWQyuW3LqK4zX0LXWcH2A3c3qdAB2Ms8/OnQ1Uxco68EjhBCiHvsQ58i0Qp3B+Iu9KramRPcL4DrrkSN7SICAOBl7bQJMDfNay1ZsqReyP5jY2O5/2sHoXFG6D+okHebcBU1AIA55rlqfFTVRCKRW+aqsQ17xsfHc36BxASrpgF4yVpqlNDQ0A+E7D8kJGSzkP0j5A3mzp1rYB6TyWQDQsSCvM+ETNTEX7dCmO4+AHhnVa2npwf0ev2Y43xU01o/EHybM3eTCh2AI7Ra7V6h/sM3L8nhMWsNIeRNpk6dOnYBTIRYTMhEDeCbzdr1HR3QfPfvnLYtlUpBJBJx2ibdnTt3xhwLDAzkfFmO/uZ7oC89wmmbiHsLFiy4KUS/YWFhe4ToFyFvEx4e3sA8FhYW5t61nJDXsjRHbdwsxGdJmO6B11bV2NZ74WMD9gk6Ny1S6AAcJcTwZ1xcXKdWq51w5VaEnBEQEHCFeSwkJOSsELEg72Opohbi1igEQlXVmu/e5byqxtc8tYcPH7ply6j+5nvQ9vGEXMM0UugAHCXE8CcuyYGQ/fz8/P5gzzGE2EzYoU+A4apaaOsTAOC+qiYWi8Hfn/uFp9mqadOmTYPp06dz2s8EraZ5LXdefYlLciBkv6ioKCPbXE6h9+xF3mNCJ2oAMLJZe/Pdu/CIZV0yV3A9/GkymViX5cBqGnLnhujx8fEV7uoLIW8XFRX1haXHvHnrNY1Gs1AsFg9lZWV9KnQs492ET9Rm3GyAIEMnAABcquJ2twKuhz/ZFrgF4D5Ra/v4IKfteZmVQgfgjIKCguKoqCgj3/2IxWIyMDDwJb77QWg8EIvFZEBAwC5LjxcVFf0mLi6u050xcUGj0Sysq6u7ZDAYiCNHjmzAZI1fEz5RA/hmrlpdTQ3o29s5azc4OJjT4U9LG7BzuXbaoF4Pre/jHHFvNH/+fN4XvIuPj7+HS3IgZJ+UlJQLtn5f5s6d+4/etiDukydPjlB7lSYnJz/GqRD8GpOomWJjlwkRiJDoVbUzJ7mdq8ZVVa2npwdaW1vHHOd6SY4nH+yFwU6v+wMPAUBgYCDvGfaUKVP+le8+EBoPxGIxac+C0AUFBcWpqancLz0A/GyUnpqaereysjISYHj+3YwZM1Zx3QcabUyiRpAk9zt6ewG+qmqTJ0/mpB22uWmBgYGcDntiNc278T38GRcX11lQUFDMV/sIjSepqanH7a0+l5SUrPP0Cws0Gs3C5OTkR/QkLTY2djFW2PmHQ59m4XfvgF9fHwBwW1Xz9/eHoKAgl9uxNOzJpbb8v2A1DQBIgogTOgZnWZu47KqIiIhP+GobISEZjUYJl+3FxcV1lpSUrHPkOZWVlXO4/kOLJMkpXLSj0WiUdXV1l86dOzcVAJM0d8NEzcy3v3/kCtDG+nowGrn7fXG1qtba2sq6dlpKSopL7Y7p54P3OG3Pi0mFDsBZ1iYuu0Imkw0UFxdv4aNthISm0+nmcNWWTCYbmDt3rlP/OcfGxi7m8uKCrq6u5a62oVQq9x07dkxLzUnDJM39MFGjibx6Gfz6+qDPaIRLZ7m7AtTVZTrYqmlSqZTTtdPa8g9Cf8vY4VXkXQoKCq4nJyc/5rpdXJIDeauysrLUn/zkJ/9u6fGXX355RU1NDScVNbFYTCYlJb3kbBJTUFBwvba2VsLVMOiNGze+7exzqaHO4uLifzIYDATA8P6+mKS5HyZqNPSq2sWqs5xV1fz9/V1K1tiW5eC6moYL3I4fkydPPs1le7gkB/JmBoOB+OCDD/6/NWvW3H755ZdXUMe3bdu2/cUXX/yfv/zlL5z8ESIWi8nVq1f/jIut1SorK+dkZmaWu3o1qE6n883IyDjnyHM0Gs3CjIyMc8eOHaujhjoBADIzM8srKyvnYJLmfr5CB+BpIq9ehqZn4qAPAC6dPQMrVq/hpF2pVAodHR0OP6+5uRlMJtOY41zOT8Nq2vhiHv7cwFV7S5Ysqcf/nJG3O378+Nzjx4+PLGHz7rvvcta2TCYbSEpKeonL/W9LSkrWqVSqrU1NTa/X1taGOttOWVnZ0qysrE9tLaGh0WiUXV1dvzp27FgSVUEDGB7qjI6O3ol7+woHEzUG3/5+mHr37/BggRwuVp2FxctXcLJOmbMVNbYto+bMmQOTJnF3cS5W08YXaviT/tewKyZNmvQrLtpBSAgZGRnng4KCDtbX179JzbPiUnJy8uMZM2as4uOPGXNytDcrK+vTmpqaZ3U6nVOf2UeOHNkQFxennzlzZplIJGqkjpMkOaWrq2v5/fv35xYUFIx6bcRiMZmamnq8pKRkXWNj49hGkdvg0CeL+ZeGK8V9RiPcqufmd08kEjmcrPX09LAOe8bHx3MSEwBA15kvsZo2VqTQAbhq6tSpWi7aSU5Ofiz0khzmoRuS7VZWVraU5+5Z+42Li9Pbio3PoA4fPrzSUr8JCQkdnhbTtm3btj/33HOnhIgLYDjhiY2NXZyRkXGeqzZlMtmAUqn847lz58L5rjgfOXLkeZ1O55eVlfWZs1eG1tbWhh45cmRDUVHRr6lbcXHxP508eXIhPYEVi8VkRkbG+XXr1sU6euUqgHC/E+b/C1j75WM9OXfCRI1FkMEAM240AAC3m7U7uvgtW5IWGBgI0dHRXIWE1TR2kUIH4Kri4uItXKx2Hh4e/t9cxIPcZ2hoiLB9lns1NzdPNhgMnFezHFFQUHC9rKwsWaPRZKempjY5+/shk8kGsrKyPtPpdH7uvhL6yJEjzzc2NgapVKptq1atui6TyQa4ajs5OflxVlbWZwaDwaesrCwZpzt4DoIkR79XB2JiFKLAwBK3B3Lpkl3n3fnud6DrLO875UCvWAynNv0QAAAyNc9BbEIiJ+3W1tbC4OCgXeeWlZWNWZYjPj4eNBoNJ7F0nfkS7ii/w0lbtpzPVkObbCYAAOT+6McQMedbtp90+jSQaWn8BsZuF0GSv+WyQYLwuM9OhLyeRqNRDgwMJNGPGY3GNSaTKaStrW3WnTt3xCkpKRfKysqSWZ670GQy/ayjo2PdV199Nc3SsKhMJhuIiIhoe/rpp6/4+fkVe9pcLY1Go+zr69tkMpkiHj16JO/p6fG3NcQbFRVlDA4O7g8PD28IDAw8XlRU9Bt3xYusY+ZkADhHzSKqqvZggRzOnDjOWaImlUrh66+/tnmeXq9nXTuNy50IsJqGEPJm5mF55tD8qKSjrKzM0nOvA4DNiphOp2OdK+wpLLwGVuGcM++CQ59WzLxZDwAA+o4OqKup5qRNe+epsW0ZJZVKYc4cbtZl7DrzpVsqkwghhBByHiZqVoTpHkCY7j4ADK+rxgWpVAoikcjmeXxvGdX+8V84awshhBBC/MBEzQZqs/bHDx9C892/c9KmrYsKHj58yLp2GleL3PY334O2j//KSVsIIYQQ4g8majbQq2pcXQFqK1Fjq6ZNmzaNs7XTcG4aQggh5B0wUbMDVVVrvnuXk6pacHAw+Pv7sz5mMpl43TIKq2kIIYSQ98BEzQ5hugcQZOgEAO6qapYuKmC7iAAAOFs7DatpCCGEkPcYk6j5XrtWKkQgno5eVdO3t7vcXnh4OOtxtmHP+Ph4TraxGtTrsZqGEEIIeRGsqNlpxs2Gb6pqJ12vqvn7+0NQUNCoYz09PaDX68ecy1U17ckHHrVOI0IIIYRswETNAVRVra6mhpOq2uTJk0fdv3PnzphzAgMDOVmWY1Cvh9b3MVFDCCGEvAkmag7guqrGnKfGtvo1VxuwP/lgLwx2dnLSFkIIIYTcAxM1B0VerQUAbqpq/v7+IBaLAQCgra2Nty2jsJqGEEIIeSdLiVqXW6PwIjNv1INfXx8AcLNbAbWmWmho6JjHpk2bBtOnT3e5D33JF1hNQwghhLwQa6JGDg42uDsQb+Hb30+rqlWD0Wh0qb2nn34aEhMTISoqasxjXG3AjktyIIQQQt4Jhz6dEHn1Mvj19UGf0QiXzp7hpM1JkybBtGnTRh3jIlFryz8I/S3sa7OhcYvk45aTkxPj1u8CIYQQJmrOoFfVLladdbmqRqHvPiCXyzlZOw2raU7pEDoAFxHULT09/RbbCRERESb6edRNpVI9p1AoTpkfH6Wvr+/bPMbMq+zs7DckEskQAJCJiYltKpVKI3RM3ghfR4Tcz1KihhOabIi8ehkAgNOqGn29NC6W5MBqmtNqhQ5AKFqttqC0tDS9ubnZf+3atZeFjocLKpVKU1RUtFOv1xMAANXV1ZNqamo+Fjoub4OvI0LCsDRH7aq7A/E2vv39MOPG8FQ+Li4qABheM23ZsmUwZ84cToY9W3GBW+SC8vLyBEsVOW/S39+/lXmsubnZT61WbxcgHK+FryNCwsChTxfMv3QOAIaranU11Zy0mZmZCZs3b3a5na4zX0LvtToOIkIT2dSpU9USiYQEACBJcqnQ8SCE0ESDiZoLggyGkaoaV5u1cwXnpiEuHDp06Nry5ctPCx2HK/z9/ceUliMiIkyFhYXvCBCO18LXESFhsA99Dg15Vtbhwaiqmr6jg7Oqmqu6znwJXWe/FDoMNE6wfUB7E61WW5Cdnf0mdYFEYmJie0JCwkah4/I24+l1VCgUFQqFoiIlJeUBDF/VjJDH8hU6AG8XZDBA+N078GjOXDhz4jjEJiQKHRJW01zXJHQAnkSr1RYAAFFUVCR0KE4rKir6JQD8EgCguroaqqs9448qb+Ptr2N2dvYbRUVFO0tLS4UOBSG7sVfUSPK2uwPxZtRSHZ5QVeutu4rVNBcRJNkkdAxCSUxMbEtPT28UOg6EEELDWBM1v+vX8T9qB4TpHkCY7j4AgOCJGl7piVxx+/ZtqdAxIIQQ+gZeTMCR+RfPAwBA89270Hz374LE0N98D9o+/qsgfSPvl5mZqaXWyEIIIeQZLCZq5ODgRXcG4u3oVTWhrgDFuWmcuCJ0AELIycmJqaurUzj7fLVavd08ZDqy5dTu3bv3AwAwjzNvCoWiwtrj1Or35n8tnhcREdHPEprF87Ozs98AGJ5Ybu08AIDDhw9v3LRpUzN1TC6XdyuVyv32vDY5OTkxjInrY+JWKBQVbO3Zeu2YfVC7BlC3tWvX1jB3D1Cr1dvXrl1bw2xLoVBUWNlpwObraEl2dvYblvpjW4MtMzNTa60/eowKhaLC/HMnAYCUSCRD5p/nKNTPuKioaKed3x8r6nWWy+XdzOesXbu2xt73BBVTcnJyL7C8JmvXrq2x8H5GExBW1DhEzVUToqqG1TTOdAgdgLtlZmZq//d//7emubnZz9nnFxYWvl1RUTEfAEClUp0HAGLu3LnlmzZtau7r63uK+ZzExMR2MG9bVVpamg4ARHZ29pvW+qEuagAAQqFQnLIzPEKlUj1n7QRb/R87diz96tWruQcPHozYsWPHJgCAhoaG4OLi4h+aky+LFApFxaFDh+pKS0vTqqqqZOZYCAAgqJ0fmpub/UpLS9OKi4t/aE5oRlRUVERZiw1gOBGi+mBWRMvLy+MrKio+o5Ib6mdVXl4ez/I6pNHPZbD5OrJJSUl5UFRUtLO8vDx+/fr1DfDNVmXnS0tL0woLC99mvoYlJSUqW/2p1ertERER/aWlpWn0961erydKS0vTIiIi+unfhx3vMeZ2amNkZmZqqddZp9MFbd269WX691NeXh5fXFz8Q7lc3m1tEWCVSqVJTk7unTVr1pTly5f/iGpjx44dm7q7u+dZ+vmgictyRY0kr7kzkPEg/O7fIcgwvPvWxbPc7FZgL6ymIUeYP9xIACBLSkqynU3SlErl/pKSkmz6sblz574LAPDcc899/NRTT31WVVUlcz1i4bz99tvvvfrqq98FANizZ89fo6Oje6jHqqqqZJYuvli7dm1NaWlpGv1YQEDATerrp556aswvbXl5ebwj+2eq1ertp06d+oX5LmuSodfrie7u7l8zflasyQh1rr39WyOXy7vpP/ukpKSRiq1Wq02mFlKuqqqSJSYmttnbrlarPXzp0qU3Fi5cePuVV16ZAwAE/WcCMPz+fvz48R84+DYAYLiySX+fZ2Zm/m3v3r0jlUT699PQ0BB84sSJtywlazdv3jwwNDTUs2/fvpg9e/aM/HW9Z8+ev54+fXpWbm7uUa7iRuOD5Yra0FCH+8IYP6i5arca6kHf3u6WPgf1etCXfOGWviaAJqEDcAf6puxKpfJPcrm8x9ZzmHJycmJOnz79A+Zx+ofPvn37djA/RL1NRETEqA/O2bNn36Pfr6iomM825HXhwoU45rGurq7XbPXnyA4QhYWFb5uraFbnFlLVHvNdgvHvKG1tbZH29m9Jenp6Y0NDQzB1XyKRkLt27WqinzNjxoxe6uvq6upJbEOWbKKjo3vS09MPHT16NJpqMy4ubsyizPfv35/ibPx0CoWigqoWU8RicQPzPPr3o9friRMnTrzFTLqVSuX+hoaGYJlMZnFrtvz8fAW1Vh1CANYqagA1lh5Dls242TBSVTtz0j1z1Z58sBcGOzvd0tcE0CR0AO5WXFz8YkNDw1OOJmsGg+Fd5lAbVVWgYyY23iY0NLTY1jm3bt3KYR6TyWS9zGO+vr42r6gfGBiIsj86ALCRpLlwrlOys7PfYCY2EolkgHleSEiIkX7/7NmzK+1pPyQkxPjRRx/9I/2Yn5/f187EaktOTk4MW1x+fn6P2OKi39fr9YRer/93+rHe3t44AACtVrtUpVKde+GFF/7C1u/OnTvfcSVuNL5Yq6jZXYpGo1FVtbqaGt6raoN6PbS+j0tyINfJ5XKHhrzu3r2bxDzG9oHs7d58802bW2g1NDQEM4e65HL5r81z8QAAIDMzs8i8YOy41tnZqXLmeXq9nrBng3e5XO621WrZ/hixJCgoaMwfOhUVFfNzcnJiqPsDAwMh1NdarXbpRx99tAloFxMkJSV9nZubW7p48eI/NTc3+3PwLaBxwGKi5nvtGi7d7CR3VtWwmsa5U0IHIJTCwsJ3HBlyoQ9tIYC+vr40+v3CwsJ3qqurw8A8xGyeJC8ktyy9cufOnUjmMfqcSOp24cKFMOZ5RqMxm3mMSSwW13EQpl06Ojrsrm4GBwcb2I739vb+nPo6KCjI6sUnFy5cCMvPz1+/bNmyenuHgtH4Z+uqzy63RDEOzTRv1s53VQ2raYhLM2fOfMJ23FwVIKm5WI5MeJ8oSJKUWHosOzv7DYVCUUFfpkKr1R7moFuPW/eO7cIU+pxIazfz1ZlWBQUFnec0YCu4mOc2ODg4kpA6sm9uaWlpmiPLfaDxy2qiRg4OjpkwiewTefUy+PX1AQB/uxW05R/Eahr3moQOQEhVVVUzzEtCjEJVBQiCaHV/VN6Lvn6XefmM2S+88MJBACB27tyZJnB4yA3oCbxWqy3IzMy0e9PcBw8eqHgJCnkV64kaLtHhNN/+/pF11S5WnQWj0Wj9CU7AJTm4N5H3+bSmtbU1AwCAIIjzAKOXmRCCyWSyWL0SCkEQeurrnJycGLlc3k1fniM6OrrnwoULTzMnwo83zlxB7KksVZgd4evre5d+v6SkRHXs2LFV5vUGrcIt3RCAraFPXKLDJVRVrc9ohEtnz3Dadlv+Qehvaea0TQRefXUiX1QqlYa5FtqhQ4euCfmB3N3dHe6uvl555ZVIe84LCAg4RX1tMBjeZc7hY1tCYjyaOXOmoEk8l6RSqcv7XgcFBb1FfZ2YmNi2e/fu/evWravQarXJYB7y3bJly1u5ublHc3Nzj9KXs8Et3RCArYra0JAweyGNE3xW1bCaxosmoQPwRPQlBsy7AwCAcB/IOTk5MdevX5/urv66urqW2zpHIpGQhYWF71D3LSzpwMsSEp6GbSFfexZUTkxMbDNvH+UxxGLxNrYlZ9j09PSImcfS09NvHTp0aNTI1EcffTRmKZd9+/btyM/PV+Tn5yvq6+ufoha9HU/VSeQ864maSHTBXYGMVzNu1gMAcFpVw2oab5qEDsDTKJXK/cw1sShsH8h6vd6Xeez69evz7OlLJBLp7DmvpaWlzJ2VhocPH37f1jnLly8fVS1ji+/x48eJ9PudnZ1K16PzPFqttoDaHouOvkwFk1Kp3P/kyZMQoa+MzcnJiZFIJEPUMiGHDh26xvzZAgCYTKYxFd3e3t5RFVSJREJKJJJ/Y55XX18fbGn9NEpYWNgpgPFVnUTOs5qo+V250gp45adLggwGmDFyBSg3FxW0f3yQk3bQGE1CB+BJlErlftpq9sBcukOr1RYw99zU6/UEfahwy5Yte+zdnsrPz+84W/Wiv79/K8DwlZNyubz7qaeeeuTAXp8uO3PmzBr6/a+//nrUh7RcLu9hXq3IVgk5evSofMuWLXsAAHbu3Lnyyy+//Albf+3t7UtycnJibO0j6snKy8sT6GvIAYxepoIuOzv7jdOnT/8gPj7+Hb7jsvTHALUUxuPHjwslEskAvTpaWlqanp6ePmonAYPBIGe2cfPmzUn0+2lpaf9Jr0DTabXa7+/YscPiHwD3799XSyQSMiwsLM/qN4QmBJubsuOVn66bf+kcAADoOzpcTta6znwJXWe/5CIsNFat0AF4gszMTG1iYmIbPUmzpLS0NJ1ZPbl169b/AwB44YUX/nL06NFt9vZ76NChaytWrBizC4B5Qj5ZVFS0c+bMmTfLy8sT7G2TCzt37nxny5Yt11555ZXInTt3rqR/IMvl8p5vf/vbYz5MLS0evG/fvp8DAPnJJ5+cnD9//nsqleo5ZnJaVVUlO3ToUB0X86OEVF1dHZaSkjKSGNXW1m7Kzs4e2R9TrVZvT09Pbzx16tQv0tLS/tMdiwEXFha+w5ZEU++xioqK+XFxcWP+Eq6oqIii/3GQn5+/nkq6AQDWr19fT1VR5XJ5j1qtfsna95OQkHB7z549B3Nzc0vpf9js2LHj++vXr6+vrq5esnr16p8zh03RxESQpPXh98FnnnnLx9//Jd4DuXTJrvPufPc7XpmoXE1fCw8WyEEilcJPd77sdDve+v2fz1ZDm2wmAADk/ujHEDHnW7afdPo0kGlp/AY2WjpBkqf4aJgg3Don2K45NY5KTExsNy/gOoZSqdz/4MEDVXV19UgSs3v37j/V1NS89fjx40Lm8Km1trKzs9/o7OxU0Z+TkpKimzJlyl+pDz+FQlHB3PCcgXrBrb4W9Diys7PfKCoq2snWllqt3v7VV1/tpC6qkEgk5PLly09bW/dLrVZvb29v/2f695GYmNgeHh5+hf48lUqlefz48R+otuVyeU9UVNR7RUVFv4yPj2++fPnyLGvfgzn2N5mvmbVz79+//yP6z8oSlUr1nLkqZPfryNLfGyaTaQnz58X2WgAM/6FA3wDdkt27d/8JAODll1+2+QcF7fuAnJycmLa2tgPl5eXx9HPS09NvhYaGaq0lWDk5OTEGg+Hdu3fvJjEvFlm7du1lf3//ZmvDt4mJiW3U96xWq7cbDIY8ehyzZs0aio2NrRSLxdswSZuY2HIym4nawDPPbBL5+1sdT3eZwQDETfuG4r01UekVi+HUpuH/TzI1z0FsQqKNZ4zVdeZLuKP8DtehuYU3JGoESfKWTbk5UfMo6enpjY4kakKxlqi5PRiE0ITElpPZM/TJ/wUF9+/z3oXQggwGCNMNf59nTjh3MS1e6ckrXJoDIYSQx7GZqPldv94IfF5Q8PXXAD0T4wpkarN2fUcHNNbXO/Tc/uZ7XllJ9CJNQgeAEEIIMdlM1AB4vqBAZ9cV+eNCmO7BSFXtUpVjS3VgNY13p4QOACGEEGKyN1Hjdll9yuPHAP39vDTtqaiqWvPdu9B89+92Pae/+R60ffxXPsNCWFFDCCHkgexL1PjYoWBwEODhQ86b9XRhugcQ2jq8fZy9c9WwmuYWtUIHgBBCCDGNWUWc9aRr10rJxYu57fnRI4CBAYefNveLv426f+bEcThz8gRXUbkVVVWzdQXkrPf+CLPe++PIfaPRCO+/uRv6eNjofaIiSLJW6BgQQgghJrsqagAA5ODgRc56HRwEePKEs+a8mTML4F46ewaTNG5dEToAhBBCiI0jiRp389RaWpyqpo1HdTU1oG9vt32imdFohItVZ3mMaEI6JXQACCGEEBu7hj4BRuapub5DQV/f8JIcHJFMmgQRc+Zw1p4Qmu/+HWIn2bcA7q3661hN416t0AGMNyqVSqPVag8DAFRUVIx53LwqPrWyo6ALylK7HBQVFVk6hTSfd8raTgQIIcQHmzsT0JGLF7u+Nc2dOwAdHWyBuNz0RPDo4UPoM/YKHYZLpk6XQWBgoO0T3bczwRyCJJv47GAi70yAEELIPmw5md0VNQAAcnDwBCESrXY6AoOBNUlD9gufPl3oEMYbPd9JmidRq9XbjUZj9tmzZ1dSm0gDDG/pNG3atEpr+xQiZGbxr+q8vLysAwcOlLgzGFdt3Ljxdx9//PFvnHjeax9//PH/4SMmxBuvfO/aPUcNAGBoaKjSpd4m4HIcyOOdEjoAd1CpVJrExMS2wsLCt0tLS9MWLlz4MCcnJxaGhx2JadOmVdbV1SkiIiL6s7Oz30hPT28EnjZ3R9zauHHj70JDQ4cAgExJSXmSl5eXyXOXxMaNG1/juQ+3MSdbBHWbNWsW6wRqhUJRTz8PkzSv5JXvXccqagMDn4Cf3y6nejIYhm8IeZZTQgfAt+zs7DcqKip+QVXQUlJSdFVVVTPo51CVtMTExDb6xuTmuWYFbg0Y2S0vLy/zwIEDI9WgqqqqyS0tLVoA8BMuKoQQlxyqqPldv95IDg3ddKqnpiannoYQz7RCB8AntVq9vaioaCd9mHPKlCkWt7morq4Oi4iIMLknOuSqrq6u7cxjLS0tvps2bfqpAOEghHjgUKIGAEAODVU53MvXX0+4raKQV7g3nuen5eTkxFy6dOkN+jGJREIWFRX90trz4uPj3+E1MIQQQnZzOFEbGhz8b4d7mUAbryOvckroAPj0+PHjwubm5lFDYDKZzOYlw0VFRb9MTExsBwDw8fGZxVd8yHUhISHvMI/NmjVr4ODBg+8LEA5CiAcOJ2p+dXX/Sw4N2X9VgE6H1TTkqbRCB8AXlUqlqaiomM88PmnSpA57nh8eHn4FAGBwcFDGcWiIQwcOHCjZuHHja9QE+JSUlNb09HSVwGEhDqnV6nK1Wl2+evXqe4AX+ExIDl1MQCGHhv5G+Pj80OaJuFUU8lx6giS1QgfBF71e/+9sxwMCArrteb5YLN4GAHWcBoV4Yb768P8AAFRVVUFVleOzU5DnoZYNKSwsFDoUJDCnErUhk+k/fHx9bSdqTm68jpAbaIUOgE81NTXz2I77+vp22fP8Q4cOXQMAwspq/QghhNzA4aFPADuv/uzrw2oa8mRaoQPgi1qt3k6/ypPOz89P7+54EEIIOc+pRA0AYGhwMN/qCQ8fYjUNebJaoQPgi9FozBY6BoTQxJKXl5cZExPTBQCkWq0uFzqe8cTpRI0E+H8WH+R443WEODaul+UwmUwSvvvIycmJUSgUFXK5vBuGJziP3NauXVujVCr3W3oubdcDS7dRfUgkkiFm+yqVSkNvU61Wb1+7dm0Nsy2FQlHBPJfNxo0bf6dUKs8zn69Wq8vZ1iQzfxCxxq9QKK4DAGzatOmn1AdXaGjoUE5OjtUrMZ999tnC1atX32C2p1Qqz2/cuPF3LE+x+BpaOB8AADZv3rxArVaXx8XFPWJ77qxZs0xqtbrcVrzOcPR1Zpo1a1ZzSEjIINtzExISbspkMreuAbhhw4bPwMrPgb5LhFqtLp81a5aJeiw0NHSILaGh3ltWtrVi/X1hcvW1puTk5LzP1k5MTEyXWq0u37x58wIAgNbW1jeuXbv2FADA8ePHR7aa5PJ3hSCIzqioqEaZTGZga8/X13coKiqqcfr06fX2fn/2cvX1XLFixfmEhIRetucqlcrz5vcGO5Iknb4NLFpUMJSYSI65SaXkEIBDN4TGOHXK4feRnbd3SBfe987c3MlaIqRQKCpcbT8zM1NLtSeRSIa2bt06si6bSqU6Rz0ml8u71Wr1dkvtZGdnv2EhTmuPjfRLJWD0eGydy4Z2NR25fv36kf/g6d+L+Zwx2D6oFQrF9by8vExqWyf6jW17p+eff/51c4JBAgCZkpJygXosKysrh3b8CfWhSDG3Z3eixvzQNLcPAABsH0LmY2OY27eamDC58jqnpqZuDgkJGYyKivp63bp1v6KO79ix4/srV65sAQDSx8eH5CJRoydT9BuVVLCx9HPIy8vL3LRp008ttQkwnBi/+uqry5ltWnqN7fkeXHmtKZs3b16QkpLyhDo/IiKi/5VXXokEAMjNzS2lx2QhGRvF1d+VqKioUf+v+fr6PqYek8vld5nPNx8bw93v3by8vMyEhIRehUJxd8eOHd+njtPfu2B+HwAA6+eHUxcTUMiBgQ/B11c96qCTG6+T6emuhILGIyfeR3Y6xVfD4116enpjSUnJyLIfmZmZf9u7d+/IorparTZZIpEM6fV6oqGhIVin072lVquhsLDwHXv7UKvV2y9evLjjhRdeOPjRRx/9IwBAdHR0d319fTB1jl6vJ7q7u3+tVCozi4uLs3Nzc4/m5+crXnnllcg//elPjfT146hzAWDMVlgxMTFdJ06ceIq6n5SUpDh69OiY7+XEiRMRKSkpT6qqqqbYir+0tDQaAI6wPWbeSWBk4+dnn3228NNPP32Wur969eqbJ06cSKLuP/XUU2nU11VVVZODgoLKAGC2rRjYKJXK84WFhUn0Y9QyLAAAUqn0VWbcxcXFSeZtqlzarNrV1/nChQt/9Pf3H2xsbHy6sbFx5PiePXv+CgB/zc3NLf3kk0/WuxIjHw4cOHAkIiLCFBMTc+vFF19U7Nq1q4n5Xn7w4IHvF198cRgApnPRJ1fv6fPnz1+iKmQAACtWrDi+a9euJgCA/Px8BdUOAEBhYeEaAIBNmzb9c3Fx8XtLlixpOXHihM1Y7f1dkcvldxsaGiLpjw8ODgZSX9++fTuA+fyGhoZIPz8/nclkcmmJIVdfz8OHDxcFBAQM1tTUzCktLR05Tn/v5ufnW3/vulopGIyP142qponFfFVB8IY3Lm5N7q6mjZeKmvm5o9rbsmXLHuZ50dHRo4ZDLVW0LFXNkpKSvt65c+dK+rnMv+DpbdP/SgUY/VcudUtMTGxj+X6uM9uy9b0wh6osDX2FhoYObd68eQH9L3EAIOlDOhqN5o/M5z377LOF9PbZKg30YRZHKmpsbZnjd7gtR6oSrr7OixYtKgMAMjIy0urK6dOnTzd5WkUtOjq6+4UXXvgL/Vzme9lSJdCZihoX72kA9uFK5vcRERHRzzzHWlXKld8VtudFRkY2UA/6+fnp2M6RSqU3mHG4872bnJxcBACkXC5vsvS6AAy/ltYqak7PUaMMmUzfrNeEG68jz/dnoQMQUm9v7wzbZ42Vk5MTc/bs2ZXM435+fo+Yx0JCQoz0+3q9nrC0rhubefPmnX/zzTdPM/phnfSamZn5N/NfpiOCg4PHJGVMGzdu/J35r/kREolkzNVPzO+FPvfGmrS0tIsffvjhjenTp/8HtRjt6tWrmw8dOvRTAIAf/vCH8vLy8h8xn+fn59dAv9/Z2Tnm6l1nFyGOiIjoYR7z9fUd80HGNDAwsMDWOZZw8TrPnj1bCgDQ1NQ0PTIyUsdMGGh97e/v72e92lkoISEhRqoqTLH0XnYVl+9ptmNisXjUuorTpk0b82HPtvesLbZ+VwAAwsLCxiSyHR0dNn/WUqnU6b+SuXg929vb4wAAGhoaZsvl8qaUlJSTFvr6H2vvXZcTNdLH52MAGF6bCTdeR57vz0IHwLegoKAHXLdpMBjetbTkB0v/YxKCioqK+Tk5OTH2PH/69OkWN41nmjFjxm57z6XT6/Vq22eN1dnZSdgzcTgoKKgGAODgwYPvt7S0+AEAceLEiZEhy6+//novWxLm6+t7jn4/JSWllX4/NDSUDA4Otvv1oYuLi9tJb2/Dhg2HzYvl8oaL13lgYCCEOt7U1DT9o48+2gSMCmxubm7phg0b3mltbXVpOg/X5HJ5qe2zuMHVezovLy+T7b1pD6PR6PAfEbZ+V8zt3o+IiBhZrDsyMvJGR0eH039A2IOL19NkMgVRxxsaGmZXVVWlA+29O2nSpL7ExMTLGRkZ7z169Mjie9flRM3vypVWcnDwPG68jrzAR+P5ak+Kr68v6yRaV3R0dETZe25wcDBrWb23t/fn9jw/JCTkrL19MStv9qqrqxvz/ZjntY0aDrlw4UIY87yenh6b/4EHBASwzruhXL9+PcWeOOfNm/eDmJiYboDhJC0zM/P1Dz/80GYVjM3BgwffN8+fIQCA+OyzzzY4044juHidAwMDrQ55XrhwISw/P3/9smXL6j1tWQhmFYpPfL+n7WHvgtp0tn5XAAB6enq+1dzcHALm925TU5PcmfgcwcXrGRIS8pj5GF17e7t/dXV13KpVq64988wz1yyd53KiBgAw1NW1HzdeR17gt0IH4A5BQUFvcd3m/fv3bU6it2VwcHDMf2hsqAnLtkRERDg9H6mlpWXMX6/mYRfC1q2wsHCtrfZtTb5/8uTJmMnPltq5du1aCAAQnZ2dPlxVwDZu3Pg7tVpdnpycPDIH58CBAzY/MB3FxevMtvG8JYWFhWv4WFbEWUFBQaxXzfKBq/f0gQMHSkJDQ50aMgwICGh29DmOXqgilUpvREVFNdKv9DSZTJxciEHHxesZHh5ud8X/6tWrC81z2sbgJFHzvXUrH/r7rV7qi5DA/msiVNMAhrd/SkxMbGd7rLOzc7K97SQmJraZL0zgBEmSEq7aQs6hr9FVWFi4prOzc8aGDRsOAwCRl5eXJXR8bA4cOFBijtEuLS0tz/EZz0SwZs2aMZdsGgyGWPr9r776Sky/HxoaSoaGhvI2lE4tz9HR0fHtxsbG+WKxOPSFF144CADEzp070/jq1xXl5eV/SUxMtHvz3Zs3b36H7TgniZrZbzlsCyEu6WGCvT+nTZtW6crzVSqVprq6ehI1lDFz5kyX94PjY0jWWdRwolCmTJnS587+Nm/evCAmJqaLWkYBYPg1qK+vl/I5BMrV6/zZZ59tOHbs2CqVSmWzQnXt2rWnuejT23D5np40adI2Znsmk2nU60pfAgcAwJVheWsIgugMCwvrb2xsHFkWKDo6uufChQtPMy/U4BJXr2d1dfXyzz//fK1cLrdZzOro6PBnO85ZokaQ5J8B4Iqt8xASwA8IkuwQOgh3KikpUbENDT558iSE7Xwm6ipNam9QqVTqcmWNjyFZZ33rW9+yuNSCO8yfP5+1f5IkI6w9b9WqVZdXrVp12dH+2tvb36WviQUAEBUV9b+OtuMoLl7nlJSUJ7t3796/bt26Cq1Wmwzm4aUtW7a8lZubezQ3N/dodHT0yAUszk6E93Zcvqc//PDDG0uXLl1MP3bmzJk11FI45iVGAGC4krZx48bX+LowZf78+V+1tbWNSgrj4uKcmpvqCC7fu88+++xx8zpwBAAQq1ev/iQxMbE2MTGxNigoaGTJD0tLOXFZUQMA2M5xewi56r8IktQKHYQQFi9e/EvmMb1eb/OqOJVKpamoqJhPPyYWi7dJJBK75q309PSImcfS09NvHTp0yOJkWXczL+46CtucFKbo6OiONWvWHHW1/7CwsF1sx20tvXHjxo0YsVhc42h/bMstiESiDkfbcRQXr/Pt27dDdu3alcc8Z9++fTvy8/MV+fn5ivr6+qdyc3OPAghfLRWKs6/1Sy+9dOv555//lHm8vb39XWq5DIDhCtqePXsOAgCZn5+/PiYmplutVh/ncu4kG3oljcLXEid0zr6eOTk5LW+//fabAAC3bt0K2bVr1wvMc06cOLGxuro6vrq6Or63t1eUmJhYCwBAT9roOE3UCJI8BQD/xWWbCLngCkGS24UOQiiFhYXvZGZmjpqcqtfrCWvbOgEA3Lx58wD1NUEQeoDheW/Lly8f81esyWQKZx7r7e0Npt+XSCSkRCL5NwfD59WBAwdKlErlBeZx5hZNdEuXLi168OCB+Pjx4y6vgJ+fn//Fd77znWrmcaPRmGzpOcuWLTtlNBqJoqKizY72x1Zl6u7uHrVGVF9fH+dz1Jx5ndevX3+go6PjKfrr3NPTI0pLSyuz1ldYWNgpAOGrpe7y2muvzW5vb29/7bXXNADOvdbx8fF/+8Mf/jD3008/fZ46lpeXlzlr1iyTSCTqoJbLYLtdu3YtxJ4La/jw+PHjRPr9zs5OJdd9OPN6PvPMM+Wff/75jJdeemkndaynp8dn5cqVx6z1NXXq1FMAAJGRkS1sj3NdUQPzByMOgSKh3QOANKGDEFpJSYmKmawZjcZstnNzcnJiEhMT2xoaGoLZHi8tLU1PT0+/RT9mMBjGXCZ/8+bNSfT7aWlp/6nVasds3yS04uLipcx1yrq6uv6V7dxly5Z92NDQ8N2MjIz/4Kr/v/3tb4tXr159k36su7ubdUHi1NTUV69fv56anp6+35m+2KpMpaWl0dQVknl5eZkXLlz4Adtz29rakmgrxzvMkdf5+eeff72iomJTQkLCH5iPnTp1at3KlStZK5EAAPfv31eHhoaSU6ZMGVPB8EYikYh1KQVqCZKqqqrSZ555JuQ3v/nNyO+Wo+/p2trajMTExIP0462trW+0tLT48nlhgCPYFrs9evSonNoVZefOnSu//PLLn7A919fXN5wgiM558+bZXASbjSOv57x5845ev359TWxs7CfMxyorK9d+73vf+xdL/TQ1NT1LEATMmzfvWdYT+NguZwhAOgTQ4QHbBeFtYt46hgDihNgqyhO2kGKTnZ39Bn3LF+ZWUgqFokIikQylpKQ8UKvV281bpZBKpXI/sy3mVlL0baTMGxaTAK5tys5kXo1+1Hnm72cMtu2m2LaQotC3rgkPDx+gb5m0cuXKXUuWLGmaPXv24PPPP/8687mWtsWx1Bcb87ZRI8+lb8oOAJCamnouKiqKtX97t30yL8DJFicJAKRMJhtcu3btu5Y2yAYYvTWOqxtbM1/nTZs2/XT16tU3QkNDh5jf59SpU3sBgAwNDe0BAHLJkiU11ObgAMObW69fv75+xowZg/YsRmwLl1tIMbdCAxj7Xra2mXxMTEwXW7vUzdJSJK68py39/G3dlErleWuvv7O/K8HBwX+31m9oaOiQVCq9YWkbKQAgzVeMAgD3711rr+eUKVN6zf1/BQBkbm5uKdt7VyQSkenp6a8AAPvnB18fTEMAcUOYrOHN/TePS9I8IVGjZGZmatn2AlUoFBXmxAkAAMwJGkk/RpeTkxOjUCgq5HJ5N7OttWvX1mRmZmotxWBtL1L67fDhwxt/8YtfnLH33E2bNjXbcy7bvqPUumLMc2fMmNGdmpp6jnk+27lsN2r/PnsolcoTCQkJbfTni8XiQbb+zaz2nZKSMupK3U2bNv2UuXdhSkrKE+YisXl5eZn0D6aYmJguRuLnUL90ll7nlJSUJ0qlknUX76lTp/YmJCTUAgCsWrXq/9LXz4Lhn9GgWq0utzYkZY2VPTWt3jZu3Pg7K8nHqNvu3bv37969ez/bYz4+PiM3kiTJV199dTkV2+bNmxcolcrzzOcoFIrrbHuwMr8vR97TNA6/FvQbM3nk4nclODj473K5/CH9/IiIiC56AgYwvOenuXpGAgAZFhbWz9jvk/P3rrXXc8qUKb0JCQlXAIZ//5g/S7b3LtvnB8HnhwhJEHEAcAoAJLx1gtA3rsDwFZ61QgfCRBAT8kI0hJCXiYmJ6WJeIeyIWbNmDZjntiEnsOVknM9RozN/YKbB8HwhhPh0GgDSPDFJQwghb7Fw4ULWTe/t1dLS4svFEDT6Bq+JGsBIshYHeIEB4s8ugiTTJtpaaQghxLVDhw79dOPGja+50obJZHqGq3iQGxI1AACCJDsIkowDAItX7CDkhCsAEE+Q5G+FDgQhhMYLvV6vBgDYunXry2DH3pYAQCgUiu8FBgYOAQD4+Pi0srWLnOTuSdVDAGlDALUeMOkcb9576xgC+K3QFwh448UECCFkDTXhPTo62uGFg+Vy+Q0AINeuXbuE+8gmBrbPD7dU1OgIkjxlrq69BMN7MCJkLz0MV2UjsYqGEELcysvLyywuLk5y9vl6vT5cIpGYysvLL3IZ10Tn9kSNQpDkOwAQCcMfvJiwIWuuwHBiH0mQ5G9xLhpCCHHPz8/vDvV1fX19MH3NL1tiY2Pf0+l00oULF/4nL8FNZEIPCZmHQ6VDAD8YwiFRvH1zaxoCeGcIIFLo9ycOfSKEJgr6GnpJSUl27am5dOnSL/z9/ck5c+Yc5ze68Y/t84PXddScYV577QcAoAKA2ULGgtzuCgD8GQBOjbdlNnAdNYSQt1AoFNdLS0ujAQAiIiJMK1asOD5//vx/3rVrVxP9PLlcfmNoaEgGABAeHv5SZWXlhwKEO66w5WQel6jRmZO2NNoNF84dX+7B8ILIpwBAO56HNDFRQwh5k7y8vMyBgYF/uX379tILFy6EMR9ftmyZLiUl5cuLFy+WY4LGHa9L1JhIgoiE4TXZ6DesunkPemJ2iiDJJiGDQQghhDydVyVqbEiCkMJwwpYGmLx5Ej0A1MJwUlYLALWYmCGEEEKO8fpEzRKSINJg+KrSSBhO4iIBEzi+3AOAJsCkDCGEEOLUuE3ULDHPe5PCcPImheEKnBQAFgkTkVe5AsMJWa353yaCJE8JFw5CCCE0vk24RM0a2jAqwHAiB/BNIieF8Z/MUZWxMTeskCGEEELuh4maE2hVOYBvEjnm11LwnMTuCgB0mL+uNX/dYf4aYHiosgMQQggh5FEwUXMTRrWOwnaMEmm+samFbxIv1mM4JIkQQgh5P0zUEEIIIYQ8lGB7fSKEEEIIIev+f+RCfwjJhqC+AAAAAElFTkSuQmCC' />""",
-width=412, height=100)
-
-fila_timin = df.loc[df['TInt'].idxmin()]
-fila_temin = df.loc[df['TExterio'].idxmin()]
-fila_temax = df.loc[df['TExterio'].idxmax()]
-tiempo_transcurrido = data_cds['Tiempo'].iloc[-1] - data_cds['Tiempo'].iloc[0]
-inicio = data_cds['Tiempo'].iloc[0]
-fin = data_cds['Tiempo'].iloc[-1]
-footer_info = Div(text="La TInt mínima: " + str(fila_timin) + "<br> La TExt mínima: " + str(fila_temin) + "<br>La TExt maxima: " + str(fila_temax) + "<br><br>Tiempo de operacion: " + str(tiempo_transcurrido) + "hs (" + str(inicio) + " | " + str(fin) +")<br><br>", width=1200, height=100)
-
-# Calcular el tiempo total de los ciclos con TInt menor a valores minimos
-footers = []
-
-for valor_minimo in valores_minimos:
-    filt = data_cds['TInt'] < float(valor_minimo)
-    indices_cambio_condicion = np.where(filt.astype(int).diff() != 0)[0]
-    
-    if len(indices_cambio_condicion) == 0:
-        footer = Div(text="No hay ciclos con TInt menor a "+str(valor_minimo)+"<br>", width=1200, height=100)
-    else:
-        tiempo_total_ciclos = datetime.timedelta(seconds=0)
-        for i in range(len(indices_cambio_condicion) - 1):
-            inicio_ciclo = data_cds.loc[indices_cambio_condicion[i], 'Tiempo']
-            fin_ciclo = data_cds.loc[indices_cambio_condicion[i+1]-1, 'Tiempo']
-            tiempo_ciclo = fin_ciclo - inicio_ciclo
-            tiempo_total_ciclos += tiempo_ciclo
-        
-        porcentaje_minimo = round(len(data_cds[data_cds['TInt'] < float(valor_minimo)]) / len(data_cds) * 100,2)
-        tiempo_minimo = tiempo_total_ciclos.total_seconds() * porcentaje_minimo / 100
-        tiempo_minimo_timedelta = datetime.timedelta(seconds=tiempo_minimo)
-        tiempo_minimo_str = datetime.datetime.utcfromtimestamp(tiempo_minimo_timedelta.total_seconds()).strftime("%H:%M:%S")
-        
-        tiempo_total_timedelta = tiempo_total_ciclos
-        tiempo_total_ciclos = tiempo_total_ciclos.total_seconds()
-        footer = Div(text="Tiempo total con TInt menor a " + str(valor_minimo) + ": " + str(tiempo_minimo_str) + "hs - " + str(porcentaje_minimo) + "% (" + str(tiempo_minimo) + "s).", width=1200, height=100)
-    
-    footers.append(footer)
+def main():
+    parser = crear_parser()
+    parser.add_argument('archivo', type=str, help='Nombre del archivo a procesar (con extensión)')
+    parser.add_argument('nombre_grafico', type=str, help='Nombre del archivo de salida (sin extensión)')
+    args = parser.parse_args()
 
-for valor_minimo in valores_minimos:
-    us.add_layout(Span(location=float(valor_minimo), dimension='width', line_color='green', line_dash='dashed', y_range_name="foo"))
-   
-div = Div(width=400, height=us.height, height_policy="fixed")
+    fn_in = args.archivo
+    namedemo = args.nombre_grafico
 
+    df, desde = (None, None) if en_partes(args) else leer_datos(fn_in, args)
 
-if datos_extendidos == 1:
-    layout = column(row(header),row(us), row(footer_info), *footers)
-else:
-    layout = column(row(header),row(us))
+    NAME_DEMO = ("Logger " + namedemo)
 
+    print(f'Graficando {NAME_DEMO}...')
 
-#layout = column(row(header), row(us, text_input), row(footer))
+    valores = valores_desde_args(args)
+    datos_extendidos, valores_minimos = valores if valores is not None else preguntar_valores_minimos()
 
-output_file(("..\Grafica " + namedemo + ".html"), title=("DataLogger " + namedemo))
-show(layout) 
+    layout = construir_grafico(fn_in, namedemo, args, datos_extendidos, valores_minimos, df=df, desde=desde)
 
-print(f'Abriendo {NAME_DEMO}...')
+    output_file(("..\Grafica " + namedemo + ".html"), title=("DataLogger " + namedemo))
+    show(layout) 
 
-#show(layout([header, us, data_table, footer])) 
+    print(f'Abriendo {NAME_DEMO}...')
 
+    #show(layout([header, us, data_table, footer]))
 
 
+if __name__ == '__main__':
+    main()
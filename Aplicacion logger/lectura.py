@@ -0,0 +1,772 @@
+# lectura.py
+# Lectura de los archivos logNNNN.txt escritos por DHT22.ino
+
+import hashlib
+import io
+import os
+import pickle
+from logging import getLogger, NullHandler
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+# Cabecera que escribe el firmware en setup() con dos sensores; con mas
+# sensores las columnas se toman de la cabecera de cada archivo
+variables = ['Tiempo', 'TInt', 'HInt', 'TExterio', 'HExt', 'Puerta']
+lecturas = ['TInt', 'HInt', 'TExterio', 'HExt']
+
+# RTC.now() se imprime sin ceros a la izquierda: 2023/1/5 7:3:9
+formato_tiempo = '%Y/%m/%d %H:%M:%S'
+
+# Puerta se lee como float32 porque una linea cortada (corte de energia
+# con la SD abierta) la deja vacia; pasa a int8 al limpiar.
+tipos: Dict[str, str] = {'TInt': 'float32',
+                         'HInt': 'float32',
+                         'TExterio': 'float32',
+                         'HExt': 'float32',
+                         'Puerta': 'float32'}
+
+motores = ('c', 'pyarrow')
+
+
+def nombres_lecturas(sensores: int) -> List[str]:
+    """Reading columns DHT22.ino writes for a number of DHT22 sensors.
+
+    The first two sensors keep their historical names (TInt/HInt,
+    TExterio/HExt); sensor 3 on is T3/H3, T4/H4 and so on.
+    """
+    nombres = lecturas[:2 * sensores]
+    for sensor in range(3, sensores + 1):
+        nombres += [f'T{sensor}', f'H{sensor}']
+    return nombres
+
+
+def lecturas_de(columnas: Iterable[str]) -> List[str]:
+    """Reading columns among ``columnas`` (all but Tiempo and Puerta)."""
+    return [col for col in columnas if col not in ('Tiempo', 'Puerta')]
+
+
+def tipos_columnas(columnas: Iterable[str]) -> Dict[str, str]:
+    """dtypes to read ``columnas`` with, as :data:`tipos` for any header."""
+    return {col: 'float32' for col in columnas if col != 'Tiempo'}
+
+# Formato binario (DHT22.ino con LOG_BINARIO): cabecera de 8 bytes
+# 'DHTB', version, bytes por registro y 2 reservados, seguida de registros
+# little-endian sin relleno (13 bytes con dos sensores, 4 mas por cada
+# sensor extra). Las lecturas van en centesimos y -32768 marca una lectura
+# fallida del sensor.
+firma_binaria = b'DHTB'
+version_binaria = 1
+bytes_cabecera = 8
+sin_dato = -32768
+
+
+def registro_binario(sensores: int) -> np.dtype:
+    """dtype of one binary record written with ``sensores`` DHT22 sensors."""
+    return np.dtype([('Tiempo', '<u4')] +
+                    [(col, '<i2') for col in nombres_lecturas(sensores)] +
+                    [('Puerta', 'u1')])
+
+
+registro = registro_binario(2)
+
+
+def _leer_c(fuente, cabecera: bool = True,
+            columnas: List[str] = variables) -> pd.DataFrame:
+    df = pd.read_csv(fuente, names=columnas, header=0 if cabecera else None,
+                     usecols=columnas, dtype=tipos_columnas(columnas),
+                     engine='c')
+    df['Tiempo'] = pd.to_datetime(df['Tiempo'], format=formato_tiempo,
+                                  errors='coerce')
+    return df
+
+
+def _opciones_pyarrow(cabecera: bool = True, bloque: int = None,
+                      columnas: List[str] = variables) -> Dict:
+    try:
+        import pyarrow as pa
+        from pyarrow import csv
+    except ImportError:
+        raise ImportError("El motor 'pyarrow' requiere el paquete pyarrow "
+                          "(pip install pyarrow)")
+    tipos_arrow = {col: pa.float32() for col in tipos_columnas(columnas)}
+    tipos_arrow['Tiempo'] = pa.timestamp('s')
+    lectura = dict(column_names=columnas, skip_rows=1 if cabecera else 0)
+    if bloque:
+        lectura['block_size'] = bloque
+    # una linea cortada por un corte de energia se descarta en vez de abortar
+    return dict(read_options=csv.ReadOptions(**lectura),
+                parse_options=csv.ParseOptions(
+                    invalid_row_handler=lambda fila: 'skip'),
+                convert_options=csv.ConvertOptions(
+                    column_types=tipos_arrow, include_columns=columnas,
+                    timestamp_parsers=[formato_tiempo]))
+
+
+def _leer_pyarrow(fuente, cabecera: bool = True,
+                  columnas: List[str] = variables) -> pd.DataFrame:
+    opciones = _opciones_pyarrow(cabecera, columnas=columnas)
+    from pyarrow import csv
+    return csv.read_csv(fuente, **opciones).to_pandas()
+
+
+_lectores = {'c': _leer_c, 'pyarrow': _leer_pyarrow}
+
+
+def _vacio(columnas: List[str]) -> pd.DataFrame:
+    return _leer_c(io.BytesIO(','.join(columnas).encode() + b'\n'),
+                   columnas=columnas)
+
+
+def es_binario(ruta: str) -> bool:
+    """Whether ``ruta`` is a log in the binary format, by its first bytes."""
+    with open(ruta, 'rb') as f:
+        return f.read(len(firma_binaria)) == firma_binaria
+
+
+def limites_log(ruta: str) -> Tuple[pd.Timestamp, pd.Timestamp]:
+    """Approximate time span of a log, reading only both ends of the file.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :return: (earliest timestamp in the first 4 KiB, latest in the last
+            4 KiB); NaT if there is none.
+    """
+    if es_binario(ruta):
+        registros = _registros(ruta)
+        if not len(registros):
+            return pd.NaT, pd.NaT
+        n = 4096 // registros.dtype.itemsize
+        return (pd.Timestamp(int(registros['Tiempo'][:n].min()), unit='s'),
+                pd.Timestamp(int(registros['Tiempo'][-n:].max()), unit='s'))
+    tam = os.path.getsize(ruta)
+    with open(ruta, 'rb') as f:
+        f.readline()
+        cabeza = f.read(min(4096, tam))
+        f.seek(max(0, tam - 4096))
+        cola = f.read()
+
+    def tiempos(bloque):
+        # las lineas de los extremos pueden estar cortadas o fuera de orden
+        textos = [linea.split(b',', 1)[0].decode('ascii', errors='replace')
+                  for linea in bloque.splitlines()]
+        return pd.to_datetime(pd.Series(textos, dtype=object),
+                              format=formato_tiempo, errors='coerce')
+
+    return tiempos(cabeza).min(), tiempos(cola).max()
+
+
+def decodificar_registros(registros: np.ndarray) -> pd.DataFrame:
+    """Turn binary records into the raw frame the CSV readers return.
+
+    The readings of all sensors are converted together as one (rows x
+    readings) int16 view of the records, so the frame holds a single 2-D
+    float32 block whatever the number of sensors.
+
+    :param registros: array with a :func:`registro_binario` dtype, e.g. a
+            memmap.
+    :return: data frame with Tiempo (datetime64), the readings (float32,
+            failed reads as NaN) and Puerta (float32).
+    """
+    columnas = lecturas_de(registros.dtype.names)
+    registros = np.ascontiguousarray(registros)
+    if len(registros):
+        # las lecturas son int16 contiguos a partir del byte 4 de cada registro
+        crudo = np.ndarray((len(registros), len(columnas)), dtype='<i2',
+                           buffer=registros, offset=4,
+                           strides=(registros.dtype.itemsize, 2))
+    else:
+        crudo = np.zeros((0, len(columnas)), dtype='<i2')
+    valores = crudo.astype('float32')
+    valores /= np.float32(100)
+    valores[crudo == sin_dato] = np.nan
+    df = pd.DataFrame(valores, columns=columnas, copy=False)
+    df.insert(0, 'Tiempo', pd.to_datetime(registros['Tiempo'].astype('int64'),
+                                          unit='s'))
+    df['Puerta'] = registros['Puerta'].astype('float32')
+    return df
+
+
+def _registros(ruta: str) -> np.ndarray:
+    with open(ruta, 'rb') as f:
+        cabecera = f.read(bytes_cabecera)
+    if cabecera[:4] != firma_binaria:
+        raise ValueError(f'{ruta} no es un log binario')
+    if cabecera[4] != version_binaria or (cabecera[5] - 5) % 4:
+        raise ValueError(f'{ruta}: version {cabecera[4]} con registros de '
+                         f'{cabecera[5]} bytes no soportada')
+    tipo = registro_binario((cabecera[5] - 5) // 4)
+    # un corte de energia puede dejar un registro incompleto al final
+    n = (os.path.getsize(ruta) - bytes_cabecera) // tipo.itemsize
+    if n <= 0:
+        return np.zeros(0, dtype=tipo)
+    return np.memmap(ruta, dtype=tipo, mode='r', offset=bytes_cabecera,
+                     shape=(n,))
+
+
+def columnas_log(ruta: str) -> List[str]:
+    """Columns of a log, from its header line or binary record size.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :return: column names, Tiempo first and Puerta last.
+    """
+    if es_binario(ruta):
+        return list(_registros(ruta).dtype.names)
+    with open(ruta, 'rb') as f:
+        columnas = f.readline().decode('ascii', errors='replace').strip().split(',')
+    if columnas[0] != 'Tiempo':
+        raise ValueError(f'{ruta}: la cabecera debe empezar con Tiempo, '
+                         f'no {columnas[0]!r}')
+    return columnas
+
+
+def leer_binario(ruta: str) -> pd.DataFrame:
+    """Read a binary log (LOG_BINARIO in DHT22.ino) without parsing.
+
+    The file is memory-mapped and viewed as an array of :data:`registro`;
+    the only work left is scaling the centi-unit integers to float32.
+
+    :param ruta: path to a logNNNN.bin file.
+    :return: raw data frame, as :func:`leer_log` with ``limpiar=False``.
+    """
+    return decodificar_registros(_registros(ruta))
+
+
+def escribir_binario(ruta: str, df: pd.DataFrame) -> str:
+    """Write a frame in the binary format, e.g. to convert old CSV logs.
+
+    Readings are rounded to hundredths, the precision the firmware prints.
+
+    :param ruta: output file path.
+    :param df: frame with Tiempo, Puerta and the readings of N sensors named
+            as :func:`nombres_lecturas` (N).
+    :return: path of the written file.
+    """
+    columnas = lecturas_de(df.columns)
+    sensores = len(columnas) // 2
+    if columnas != nombres_lecturas(sensores):
+        raise ValueError(f'columnas {columnas} no se pueden escribir en binario, '
+                         f'se esperaba {nombres_lecturas(sensores)}')
+    tipo = registro_binario(sensores)
+    registros = np.zeros(len(df), dtype=tipo)
+    registros['Tiempo'] = (pd.to_datetime(df['Tiempo']).values
+                           .astype('datetime64[s]').astype('int64'))
+    for col in columnas:
+        valores = df[col].to_numpy(dtype='float64')
+        registros[col] = np.where(np.isnan(valores), sin_dato,
+                                  np.round(np.nan_to_num(valores) * 100))
+    registros['Puerta'] = df['Puerta'].fillna(0).to_numpy()
+    with open(ruta, 'wb') as f:
+        f.write(firma_binaria + bytes([version_binaria, tipo.itemsize, 0, 0]))
+        f.write(registros.tobytes())
+    return ruta
+
+
+def limpiar_log(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop incomplete samples and narrow Puerta to int8.
+
+    The firmware writes ``nan`` when a DHT22 read fails, and a power cut can
+    leave a truncated last line; both rows are discarded.
+
+    :param df: raw frame as returned by :func:`leer_log` with ``limpiar=False``.
+    :return: new frame with a 0..n-1 index.
+    """
+    df = df.dropna()
+    if 'Puerta' in df:
+        df = df.astype({'Puerta': 'int8'})
+    return df.reset_index(drop=True)
+
+
+def leer_log(ruta: str, motor: str = 'c', limpiar: bool = True) -> pd.DataFrame:
+    """Read a DHT22 logger file with fixed dtypes.
+
+    Readings are parsed as float32, Puerta as int8 and Tiempo with the
+    explicit firmware format, so no dtype or date format is inferred.
+    Binary logs (see :func:`leer_binario`) are detected by their first
+    bytes and decoded without parsing.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :param motor: parser engine, 'c' (pandas) or 'pyarrow' (multithreaded,
+            requires pyarrow). Not used for binary logs.
+    :param limpiar: drop incomplete rows (see :func:`limpiar_log`).
+            Default True. If False Puerta stays float32 to hold NaN.
+    :return: data frame with the columns of the file header (``variables``
+            with two sensors).
+    """
+    logger = getLogger(__name__)
+    if motor not in motores:
+        raise ValueError(f"motor debe ser uno de {motores}, no '{motor}'")
+    if es_binario(ruta):
+        df = leer_binario(ruta)
+        logger.debug(f'{ruta}: {len(df)} registros binarios')
+    else:
+        df = _lectores[motor](ruta, columnas=columnas_log(ruta))
+        logger.debug(f'{ruta}: {len(df)} filas leidas con el motor {motor}')
+    return limpiar_log(df) if limpiar else df
+
+
+def leer_log_por_partes(ruta: str, filas: int = 1000000,
+                        motor: str = 'c') -> Iterator[pd.DataFrame]:
+    """Read a log in chunks of about ``filas`` rows, for files larger than RAM.
+
+    Chunks are raw (see :func:`leer_log` with ``limpiar=False``) and keep the
+    row labels they would have in the whole file, so row positions and
+    ``idxmin``/``idxmax`` results match the in-memory path.
+
+    :param ruta: path to a logNNNN.txt file.
+    :param filas: rows per chunk ('c') or approximate rows per block
+            ('pyarrow', which splits on byte blocks).
+    :param motor: parser engine, 'c' or 'pyarrow'.
+    :return: generator of data frames.
+    """
+    if motor not in motores:
+        raise ValueError(f"motor debe ser uno de {motores}, no '{motor}'")
+    if es_binario(ruta):
+        registros = _registros(ruta)
+        for inicio in range(0, len(registros), filas):
+            parte = decodificar_registros(registros[inicio:inicio + filas])
+            parte.index = pd.RangeIndex(inicio, inicio + len(parte))
+            yield parte
+        return
+    columnas = columnas_log(ruta)
+    if motor == 'c':
+        partes = pd.read_csv(ruta, names=columnas, header=0, usecols=columnas,
+                             dtype=tipos_columnas(columnas), engine='c',
+                             chunksize=filas)
+        for parte in partes:
+            parte['Tiempo'] = pd.to_datetime(parte['Tiempo'],
+                                             format=formato_tiempo,
+                                             errors='coerce')
+            yield parte
+        return
+    # ~40 bytes por linea en el formato del firmware
+    opciones = _opciones_pyarrow(bloque=max(filas * 40, 1 << 20),
+                                 columnas=columnas)
+    from pyarrow import csv
+    lector = csv.open_csv(ruta, **opciones)
+    inicio = 0
+    for lote in lector:
+        parte = lote.to_pandas()
+        parte.index = pd.RangeIndex(inicio, inicio + len(parte))
+        inicio += len(parte)
+        yield parte
+
+
+def clave_cache(ruta: str, contenido: bool = False) -> str:
+    """Key identifying one version of a log file.
+
+    :param ruta: path to the log file.
+    :param contenido: hash the file bytes instead of size and mtime. Slower,
+            but survives copies that reset mtime (e.g. from the SD card).
+    :return: hexadecimal key.
+    """
+    h = hashlib.sha1(os.path.abspath(ruta).encode('utf-8'))
+    if contenido:
+        with open(ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(1 << 20), b''):
+                h.update(bloque)
+    else:
+        st = os.stat(ruta)
+        h.update(f'{st.st_size}:{st.st_mtime_ns}'.encode())
+    return h.hexdigest()
+
+
+def _entradas_cache(carpeta: str) -> List[Tuple[float, int, str]]:
+    entradas = []
+    for nombre in os.listdir(carpeta):
+        if nombre.endswith('.h5'):
+            ruta = os.path.join(carpeta, nombre)
+            st = os.stat(ruta)
+            entradas.append((st.st_mtime, st.st_size, ruta))
+    return sorted(entradas)
+
+
+def limpiar_cache(carpeta: str, max_bytes: int):
+    """Evict the least recently used entries until the cache fits max_bytes.
+
+    :param carpeta: cache directory.
+    :param max_bytes: maximum total size of the entries.
+    """
+    logger = getLogger(__name__)
+    entradas = _entradas_cache(carpeta)
+    total = sum(tam for _, tam, _ in entradas)
+    for _, tam, ruta in entradas:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(ruta)
+        except OSError:
+            # otro proceso (graficado en lote) la esta usando o ya la borro
+            continue
+        total -= tam
+        logger.debug(f'cache: {ruta} eliminado')
+
+
+def leer_log_cache(ruta: str, carpeta: str = '.cache_logs',
+                   max_bytes: int = 1 << 30, motor: str = 'c',
+                   limpiar: bool = True, contenido: bool = False) -> pd.DataFrame:
+    """Read a log through a persistent cache of parsed frames.
+
+    Parsed frames are stored as HDF5 files (the PyTables stack listed in
+    requirements.txt) named after :func:`clave_cache`. A hit skips CSV
+    parsing entirely and marks the entry as recently used; after a miss the
+    new entry is written and the least recently used ones are evicted so
+    the directory stays under max_bytes.
+
+    :param ruta: path to a logNNNN.txt file.
+    :param carpeta: cache directory, created if missing.
+    :param max_bytes: maximum total size of the cache. Default 1 GiB.
+    :param motor: parser engine on a miss, see :func:`leer_log`.
+    :param limpiar: drop incomplete rows (see :func:`limpiar_log`).
+    :param contenido: key entries by file content hash, see :func:`clave_cache`.
+    :return: data frame as returned by :func:`leer_log`.
+    """
+    logger = getLogger(__name__)
+    os.makedirs(carpeta, exist_ok=True)
+    entrada = os.path.join(carpeta, clave_cache(ruta, contenido) + '.h5')
+    if os.path.exists(entrada):
+        logger.debug(f'cache: {ruta} leido de {entrada}')
+        df = pd.read_hdf(entrada, 'log')
+        os.utime(entrada)
+    else:
+        df = leer_log(ruta, motor=motor, limpiar=False)
+        temporal = f'{entrada}.{os.getpid()}.tmp'
+        df.to_hdf(temporal, 'log', mode='w')
+        os.replace(temporal, entrada)
+        limpiar_cache(carpeta, max_bytes)
+    return limpiar_log(df) if limpiar else df
+
+
+# bytes del comienzo del archivo que identifican la tarjeta/sesion; si
+# cambian el archivo fue reemplazado y se vuelve a leer entero
+_bytes_huella = 256
+
+
+def _ruta_incremental(ruta: str, carpeta: str) -> str:
+    clave = hashlib.sha1(os.path.abspath(ruta).encode('utf-8')).hexdigest()
+    return os.path.join(carpeta, clave + '.inc.h5')
+
+
+def _huella(ruta: str) -> str:
+    with open(ruta, 'rb') as f:
+        return hashlib.sha1(f.read(_bytes_huella)).hexdigest()
+
+
+def leer_log_incremental(ruta: str, carpeta: str = '.cache_logs',
+                         motor: str = 'c',
+                         limpiar: bool = True) -> Tuple[pd.DataFrame, int]:
+    """Read a log that only grows at the end, parsing only the new lines.
+
+    DHT22.ino only appends to its file, so a per-log HDF5 store keeps the
+    parsed rows together with the byte offset already consumed and a hash of
+    the first bytes of the file. On every call only the complete lines (or
+    binary records) after that offset are parsed and appended; a partially
+    written last one is left for the next call. If the file shrank or its first bytes changed it
+    is parsed again from the start.
+
+    :param ruta: path to a logNNNN.txt file.
+    :param carpeta: directory of the stores, created if missing.
+    :param motor: parser engine, see :func:`leer_log`.
+    :param limpiar: drop incomplete rows (see :func:`limpiar_log`).
+    :return: (all rows, position of the first row added by this call).
+    """
+    logger = getLogger(__name__)
+    if motor not in motores:
+        raise ValueError(f"motor debe ser uno de {motores}, no '{motor}'")
+    os.makedirs(carpeta, exist_ok=True)
+    almacen = _ruta_incremental(ruta, carpeta)
+    huella = _huella(ruta)
+    tam = os.path.getsize(ruta)
+    offset, filas, ultimo = 0, 0, pd.NaT
+    with pd.HDFStore(almacen, mode='a') as store:
+        if '/estado' in store:
+            estado = store['estado'].iloc[0]
+            if estado['huella'] == huella and estado['offset'] <= tam:
+                offset, filas = int(estado['offset']), int(estado['filas'])
+                ultimo = estado['ultimo']
+        if not offset:
+            for clave in store.keys():
+                store.remove(clave)
+        binario = es_binario(ruta)
+        if binario:
+            tipo = _registros(ruta).dtype  # valida la cabecera
+            offset = offset or bytes_cabecera
+        else:
+            columnas = columnas_log(ruta)
+        with open(ruta, 'rb') as f:
+            f.seek(offset)
+            cola = f.read(tam - offset)
+        if binario:
+            # solo registros completos; el resto queda para la proxima vez
+            completo = cola[:len(cola) - len(cola) % tipo.itemsize]
+        else:
+            completo = cola[:cola.rfind(b'\n') + 1]
+        nuevas = None
+        if binario and completo:
+            nuevas = decodificar_registros(np.frombuffer(completo, dtype=tipo))
+        elif not binario and completo.strip():
+            nuevas = _lectores[motor](io.BytesIO(completo), cabecera=not offset,
+                                      columnas=columnas)
+        if nuevas is not None:
+            if pd.notna(ultimo) and len(nuevas) and \
+                    nuevas['Tiempo'].iloc[0] < ultimo:
+                logger.warning(f'{ruta}: el reloj retrocedio al agregar filas')
+            store.append('log', nuevas, format='table', index=False)
+            if len(nuevas):
+                ultimo = nuevas['Tiempo'].iloc[-1]
+        offset += len(completo)
+        store.put('estado', pd.DataFrame({'huella': [huella],
+                                          'offset': [offset],
+                                          'filas': [store.get_storer('log').nrows
+                                                    if '/log' in store else 0],
+                                          'ultimo': [ultimo]}))
+        df = store['log'] if '/log' in store else _vacio(columnas_log(ruta))
+    os.utime(almacen)
+    logger.debug(f'{ruta}: {len(df) - filas} filas nuevas de {len(df)}')
+    if not limpiar:
+        return df, filas
+    return limpiar_log(df), posicion_limpia(df, filas)
+
+
+def posicion_limpia(df: pd.DataFrame, posicion: int) -> int:
+    """Translate a row position of a raw frame to the frame after limpiar_log.
+
+    :param df: raw frame.
+    :param posicion: row position in df.
+    :return: number of complete rows before posicion.
+    """
+    return int(df.notna().all(axis=1).values[:posicion].sum())
+
+
+def guardar_agregados(ruta: str, nombre: str, df: pd.DataFrame, filas: int,
+                      carpeta: str = '.cache_logs'):
+    """Store a frame derived from a log next to its incremental store.
+
+    :param ruta: path to the log file.
+    :param nombre: name of the aggregate, a valid Python identifier.
+    :param df: aggregate to store.
+    :param filas: number of rows of the log the aggregate covers, counted
+            as its reader will (clean rows for frames built from the
+            cleaned log, raw rows for accumulators fed the raw one).
+    :param carpeta: directory of the stores.
+    """
+    with pd.HDFStore(_ruta_incremental(ruta, carpeta), mode='a') as store:
+        store.put(f'agregados/{nombre}', df)
+        store.get_storer(f'agregados/{nombre}').attrs.filas = filas
+
+
+def leer_agregados(ruta: str, nombre: str, filas: int,
+                   carpeta: str = '.cache_logs') -> Optional[pd.DataFrame]:
+    """Load an aggregate stored with :func:`guardar_agregados`.
+
+    :param ruta: path to the log file.
+    :param nombre: name of the aggregate.
+    :param filas: rows of the log the caller already had before the last
+            :func:`leer_log_incremental` call.
+    :param carpeta: directory of the stores.
+    :return: the aggregate, or None if missing or computed on another
+            number of rows (the log was re-read from the start).
+    """
+    almacen = _ruta_incremental(ruta, carpeta)
+    if not os.path.exists(almacen):
+        return None
+    with pd.HDFStore(almacen, mode='r') as store:
+        clave = f'agregados/{nombre}'
+        if f'/{clave}' not in store or \
+                getattr(store.get_storer(clave).attrs, 'filas', -1) != filas:
+            return None
+        return store[clave]
+
+
+def guardar_objeto(ruta: str, nombre: str, objeto, filas: int,
+                   carpeta: str = '.cache_logs'):
+    """Store any picklable object (e.g. an accumulator) as an aggregate.
+
+    The pickle goes through :func:`guardar_agregados` as a uint8 series, so
+    it lives in the same store and is dropped with it when the log is
+    re-read from the start.
+    """
+    datos = np.frombuffer(pickle.dumps(objeto, protocol=pickle.HIGHEST_PROTOCOL), dtype='uint8')
+    guardar_agregados(ruta, nombre, pd.Series(datos), filas, carpeta=carpeta)
+
+
+def leer_objeto(ruta: str, nombre: str, filas: int,
+                carpeta: str = '.cache_logs'):
+    """Load an object stored with :func:`guardar_objeto`.
+
+    :return: the object, or None as in :func:`leer_agregados`.
+    """
+    datos = leer_agregados(ruta, nombre, filas, carpeta=carpeta)
+    return None if datos is None else pickle.loads(datos.to_numpy().tobytes())
+
+
+# filas entre dos entradas del indice de tiempo de un log de texto
+filas_indice = 10000
+
+
+def _ruta_indice(ruta: str, carpeta: str) -> str:
+    clave = hashlib.sha1(os.path.abspath(ruta).encode('utf-8')).hexdigest()
+    return os.path.join(carpeta, clave + '.idx.h5')
+
+
+def _escanear_lineas(ruta: str, inicio: int, linea: int, fin: int,
+                     cada: int) -> Tuple[List[int], List[int], int, int]:
+    # offsets de las lineas completas en [inicio, fin) cuyo numero es
+    # multiplo de cada; devuelve tambien donde y en que linea quedo
+    filas, offsets = [], []
+    with open(ruta, 'rb') as f:
+        f.seek(inicio)
+        base = inicio
+        while base < fin:
+            buf = f.read(min(1 << 24, fin - base))
+            if not buf:
+                break
+            saltos = np.flatnonzero(np.frombuffer(buf, dtype='uint8') == 10)
+            if len(saltos):
+                comienzos = np.concatenate([[inicio], base + saltos[:-1] + 1])
+                numeros = linea + np.arange(len(saltos))
+                elegidas = numeros % cada == 0
+                filas.extend(numeros[elegidas].tolist())
+                offsets.extend(comienzos[elegidas].tolist())
+                inicio = int(base + saltos[-1] + 1)
+                linea += len(saltos)
+            base += len(buf)
+    return filas, offsets, inicio, linea
+
+
+def indice_tiempo(ruta: str, carpeta: str = '.cache_logs',
+                  cada: int = filas_indice) -> pd.DataFrame:
+    """Sparse time index of a text log: one entry every ``cada`` rows.
+
+    Building it only looks for line breaks (no CSV parsing) and parses one
+    timestamp per entry. The index is stored in ``carpeta``; as the logger
+    only appends, a later call just scans the bytes added since, and the
+    whole file again only if its first bytes changed.
+
+    :param ruta: path to a logNNNN.txt file.
+    :param carpeta: directory of the stored indexes, created if missing.
+    :param cada: rows between entries.
+    :return: data frame with fila (row number, 0 = first data row), offset
+            (byte where that row starts) and tiempo. Rows whose timestamp
+            cannot be read are left out.
+    """
+    os.makedirs(carpeta, exist_ok=True)
+    almacen = _ruta_indice(ruta, carpeta)
+    huella = _huella(ruta)
+    tam = os.path.getsize(ruta)
+    with pd.HDFStore(almacen, mode='a') as store:
+        escaneado = 0
+        if '/estado' in store:
+            estado = store['estado'].iloc[0]
+            if estado['huella'] == huella and estado['cada'] == cada and \
+                    estado['escaneado'] <= tam:
+                escaneado, linea = int(estado['escaneado']), int(estado['linea'])
+        if not escaneado:
+            for clave in store.keys():
+                store.remove(clave)
+            with open(ruta, 'rb') as f:
+                escaneado, linea = len(f.readline()), 0
+        filas, offsets, escaneado, linea = _escanear_lineas(
+            ruta, escaneado, linea, tam, cada)
+        if filas:
+            with open(ruta, 'rb') as f:
+                textos = []
+                for offset in offsets:
+                    f.seek(offset)
+                    textos.append(f.readline().split(b',', 1)[0].decode(
+                        'ascii', errors='replace'))
+            nuevas = pd.DataFrame({'fila': np.array(filas, dtype='int64'),
+                                   'offset': np.array(offsets, dtype='int64'),
+                                   'tiempo': pd.to_datetime(
+                                       textos, format=formato_tiempo,
+                                       errors='coerce')})
+            store.append('indice', nuevas.dropna(), format='table', index=False)
+        store.put('estado', pd.DataFrame({'huella': [huella], 'cada': [cada],
+                                          'escaneado': [escaneado],
+                                          'linea': [linea]}))
+        if '/indice' in store:
+            return store['indice'].reset_index(drop=True)
+    return pd.DataFrame({'fila': np.array([], dtype='int64'),
+                         'offset': np.array([], dtype='int64'),
+                         'tiempo': np.array([], dtype='datetime64[ns]')})
+
+
+def _bloques(tiempos: np.ndarray, desde: pd.Timestamp,
+             hasta: pd.Timestamp) -> Optional[Tuple[int, int]]:
+    # entradas del indice a leer: desde la ultima con tiempo <= desde hasta
+    # la primera con tiempo > hasta (excluida); None si el reloj retrocede
+    if len(tiempos) > 1 and (np.diff(tiempos) < np.timedelta64(0)).any():
+        return None
+    ini = np.searchsorted(tiempos, desde.to_datetime64(), side='right') - 1
+    fin = np.searchsorted(tiempos, hasta.to_datetime64(), side='right')
+    return int(ini), int(fin)
+
+
+def leer_log_rango(ruta: str, desde=None, hasta=None,
+                   carpeta: str = '.cache_logs', motor: str = 'c',
+                   limpiar: bool = True,
+                   cada: int = filas_indice) -> pd.DataFrame:
+    """Read only the rows of a log between two times.
+
+    Binary logs are memory-mapped and searched by time directly; text logs
+    use :func:`indice_tiempo` to find the byte range and parse only that.
+    Either way the time spent depends on the size of the window, not of
+    the file. The search assumes the log is in time order (the RTC was not
+    set back); if it is not, the whole file is read and filtered.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :param desde: first time wanted (anything pandas.Timestamp accepts);
+            None for the start of the log.
+    :param hasta: last time wanted, inclusive; None for the end of the log.
+    :param carpeta: directory of the stored indexes.
+    :param motor: parser engine for text logs, see :func:`leer_log`.
+    :param limpiar: drop incomplete rows (see :func:`limpiar_log`).
+    :param cada: rows between index entries.
+    :return: rows with ``desde <= Tiempo <= hasta``. Unless limpiar, the
+            index holds the row numbers in the whole file.
+    """
+    logger = getLogger(__name__)
+    if motor not in motores:
+        raise ValueError(f"motor debe ser uno de {motores}, no '{motor}'")
+    desde = pd.Timestamp.min if desde is None else pd.Timestamp(desde)
+    hasta = pd.Timestamp.max if hasta is None else pd.Timestamp(hasta)
+    if es_binario(ruta):
+        registros = _registros(ruta)
+        muestras = pd.to_datetime(registros['Tiempo'][::cada].astype('int64'),
+                                  unit='s').values
+        bloques = _bloques(muestras, desde, hasta)
+        ini, fin = bloques or (-1, len(muestras))
+        ini = max(ini, 0) * cada
+        fin = len(registros) if fin >= len(muestras) else fin * cada
+        df = decodificar_registros(registros[ini:fin])
+        df.index = pd.RangeIndex(ini, ini + len(df))
+    else:
+        indice = indice_tiempo(ruta, carpeta, cada)
+        columnas = columnas_log(ruta)
+        bloques = _bloques(indice['tiempo'].values, desde, hasta)
+        ini, fin = bloques or (-1, len(indice))
+        if ini < 0:
+            with open(ruta, 'rb') as f:
+                fila, offset = 0, len(f.readline())
+        else:
+            fila, offset = indice['fila'].iloc[ini], indice['offset'].iloc[ini]
+        with open(ruta, 'rb') as f:
+            f.seek(offset)
+            if fin < len(indice):
+                datos = f.read(int(indice['offset'].iloc[fin]) - offset)
+            else:
+                datos = f.read()
+        if datos.strip():
+            df = _lectores[motor](io.BytesIO(datos), cabecera=False,
+                                  columnas=columnas)
+        else:
+            df = _vacio(columnas)
+        df.index = pd.RangeIndex(fila, fila + len(df))
+    if bloques is None:
+        logger.warning(f'{ruta}: el reloj retrocede, se lee el archivo entero')
+    df = df[(df['Tiempo'] >= desde) & (df['Tiempo'] <= hasta)]
+    logger.debug(f'{ruta}: {len(df)} filas entre {desde} y {hasta}')
+    return limpiar_log(df) if limpiar else df
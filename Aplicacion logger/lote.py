@@ -0,0 +1,145 @@
+# lote.py
+# Genera los graficos de muchos logNNNN.txt/.bin en paralelo, sin preguntas
+
+import argparse
+import glob
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging import getLogger, NullHandler
+from typing import Dict, List
+
+import graficar
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+
+def buscar_logs(entrada: str) -> List[str]:
+    """List the log files to process.
+
+    :param entrada: directory (all log*.txt and log*.bin inside it) or glob
+            pattern.
+    :return: sorted file paths.
+    """
+    if os.path.isdir(entrada):
+        return sorted(glob.glob(os.path.join(entrada, 'log*.txt')) +
+                      glob.glob(os.path.join(entrada, 'log*.bin')))
+    return sorted(glob.glob(entrada))
+
+
+def procesar(ruta: str, carpeta_salida: str, args: argparse.Namespace) -> Dict:
+    """Render the report of one log file; runs in a worker process.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :param carpeta_salida: directory for the HTML report.
+    :param args: options parsed by :func:`graficar.crear_parser`.
+    :return: summary of the file for the index page. Errors are returned in
+            the 'error' key instead of raised, so one bad card does not stop
+            the batch.
+    """
+    from bokeh.io import save
+    from bokeh.resources import CDN
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    resumen = {'archivo': ruta, 'nombre': nombre}
+    try:
+        datos_extendidos, valores_minimos = graficar.valores_desde_args(args)
+        resultado = graficar.calcular_datos(ruta, args, valores_minimos)
+        layout = graficar.construir_grafico(ruta, nombre, args, datos_extendidos,
+                                            valores_minimos, resultado=resultado)
+        salida = os.path.join(carpeta_salida, f'Grafica {nombre}.html')
+        save(layout, filename=salida, resources=CDN,
+             title=f'DataLogger {nombre}')
+        resumen.update(salida=salida, filas=resultado['num_filas'],
+                       inicio=resultado['inicio'], fin=resultado['fin'])
+        if resultado['histogramas'] is not None:
+            # solo los conteos vuelven al proceso principal
+            resumen['histogramas'] = resultado['histogramas']
+    except Exception as e:
+        resumen['error'] = f'{type(e).__name__}: {e}'
+    return resumen
+
+
+def escribir_indice(resumenes: List[Dict], carpeta_salida: str) -> str:
+    """Write index.html linking every report of the batch.
+
+    :param resumenes: summaries returned by :func:`procesar`.
+    :param carpeta_salida: directory holding the reports.
+    :return: path of the index page.
+    """
+    filas = []
+    for r in sorted(resumenes, key=lambda r: r['nombre']):
+        if 'error' in r:
+            filas.append(f"<tr><td>{html.escape(r['nombre'])}</td>"
+                         f"<td colspan='3'>Error: {html.escape(r['error'])}</td></tr>")
+            continue
+        enlace = html.escape(os.path.basename(r['salida']))
+        filas.append(f"<tr><td><a href='{enlace}'>{html.escape(r['nombre'])}</a></td>"
+                     f"<td>{r['filas']}</td><td>{r['inicio']}</td><td>{r['fin']}</td></tr>")
+    ruta = os.path.join(carpeta_salida, 'index.html')
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write("<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+                "<title>DataLogger - indice</title></head><body>\n"
+                "<h1>DataLogger</h1>\n<table border='1' cellpadding='4'>\n"
+                "<tr><th>Archivo</th><th>Filas</th><th>Inicio</th><th>Fin</th></tr>\n"
+                + '\n'.join(filas) + "\n</table>\n</body></html>\n")
+    return ruta
+
+
+def escribir_histogramas(resumenes: List[Dict], carpeta_salida: str) -> str:
+    """Write Histogramas.html with the histograms of every file of the batch.
+
+    The fixed-edge counts of each file (see
+    :class:`estadisticas.AcumuladorHistogramas`) are merged, so no reading
+    is held in the main process.
+
+    :param resumenes: summaries returned by :func:`procesar`.
+    :param carpeta_salida: directory holding the reports.
+    :return: path of the page, None if no file had histograms.
+    """
+    from bokeh.io import save
+    from bokeh.resources import CDN
+    acumulados = [r['histogramas'] for r in sorted(resumenes, key=lambda r: r['nombre'])
+                  if 'histogramas' in r]
+    if not acumulados:
+        return None
+    total = acumulados[0]
+    for otro in acumulados[1:]:
+        total.fusionar(otro)
+    ruta = os.path.join(carpeta_salida, 'Histogramas.html')
+    save(graficar.grafico_histogramas(total, f'{len(acumulados)} archivos'), filename=ruta,
+         resources=CDN, title='DataLogger - histogramas')
+    return ruta
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Graficar muchos archivos del logger sin preguntas')
+    parser.add_argument('entrada', type=str, help='Carpeta con archivos log*.txt/log*.bin o patron (ej. "tarjetas/*/log*.txt")')
+    parser.add_argument('-o', '--salida', type=str, default='graficos', help='Carpeta de salida (default: graficos)')
+    parser.add_argument('-p', '--procesos', type=int, default=os.cpu_count(), help='Procesos en paralelo (default: cantidad de CPUs)')
+    graficar.crear_parser(parser)
+    # en lote no se pregunta: estadisticas activadas salvo -ex n
+    parser.set_defaults(datos_extendidos='s')
+    args = parser.parse_args()
+
+    archivos = buscar_logs(args.entrada)
+    if not archivos:
+        parser.error(f'No se encontraron archivos en {args.entrada}')
+    os.makedirs(args.salida, exist_ok=True)
+
+    print(f'Graficando {len(archivos)} archivos con {args.procesos} procesos...')
+    resumenes = []
+    with ProcessPoolExecutor(max_workers=args.procesos) as pool:
+        tareas = [pool.submit(procesar, ruta, args.salida, args) for ruta in archivos]
+        for tarea in as_completed(tareas):
+            resumen = tarea.result()
+            resumenes.append(resumen)
+            estado = resumen.get('error', 'ok')
+            print(f"[{len(resumenes)}/{len(archivos)}] {resumen['archivo']}: {estado}")
+    print(f'Indice: {escribir_indice(resumenes, args.salida)}')
+    if args.histogramas:
+        print(f'Histogramas: {escribir_histogramas(resumenes, args.salida)}')
+
+
+if __name__ == '__main__':
+    main()
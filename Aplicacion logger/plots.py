@@ -1,8 +1,8 @@
 # plots.py
 
-from bokeh.layouts import layout
+from bokeh.layouts import gridplot, layout
 from bokeh.models import (Range1d, ColumnDataSource, RangeTool,
-                          LinearColorMapper, BasicTicker,
+                          LinearColorMapper, LogColorMapper, BasicTicker,
                           ColorBar, HoverTool, BoxSelectTool, Span, Paragraph,
                           DataRange1d)
 from bokeh.models.widgets.tables import (NumberFormatter, DateFormatter,
@@ -13,9 +13,13 @@ from bokeh.palettes import brewer, mpl, d3, Colorblind
 from bokeh.plotting import figure
 from bokeh.transform import jitter
 from itertools import zip_longest
+import re
 from logging import getLogger, NullHandler
-from numpy import linspace, histogram, zeros, pi, polyfit, poly1d, isnan, array
-from pandas import notnull, DataFrame, Series
+from numpy import (linspace, histogram, histogram2d, histogram_bin_edges,
+                   zeros, pi, polyfit, poly1d, isnan, arange, array, asarray,
+                   concatenate, flatnonzero, searchsorted, unique, nan,
+                   nanquantile, errstate, where)
+from pandas import notnull, factorize, DataFrame, Series
 from pandas.api.types import is_numeric_dtype, is_datetime64_any_dtype
 from typing import Dict, Iterable, Tuple, Union, Sequence, List
 
@@ -343,11 +347,18 @@ def heatmap(obj: DataFrame,
     :param reverse: reverse color mapping.
     :return: bokeh figure.
     :author: Tecnalia Research and Innovation (Miguel Esteras and Sandra Riaño).
+
+    The input is not modified. Only xvar, yvar, value and the columns named
+    in hoover_format are copied into the plot, so pass pre-aggregated cells
+    (e.g. one row per day and hour) rather than raw data.
     """
-    obj.fillna(0, inplace=True)
+    # work on a copy of the columns used by the plot only
+    columns = [xvar, yvar, value]
+    obj = obj[columns + [c for c in _tip_columns(obj, hoover_format)
+                         if c not in columns]].fillna(0)
     # set low and high threshold for color map
-    color_low = color_low or obj[value].min()
-    color_high = color_high or obj[value].max()
+    color_low = obj[value].min() if color_low is None else color_low
+    color_high = obj[value].max() if color_high is None else color_high
     # continuous colormap from list of colours
     c = (brewer[palette][9]
          if isinstance(palette, str)
@@ -400,7 +411,7 @@ def heatmap(obj: DataFrame,
 
 
 def histograms(obj: Union[DataFrame, Series],
-               bins: int = 10,
+               bins: Union[int, Sequence, Dict[str, Sequence]] = 10,
                width: int = None,
                height: int = None,
                groupby: Union[str, Series] = None,
@@ -410,48 +421,80 @@ def histograms(obj: Union[DataFrame, Series],
                **kwargs) -> figure:
     """Create a histogram figure for each column in obj that are of type bool, int or float.
 
+    Every group of a column is counted with the same edges, so the bars of
+    the groups line up.
+
     :param obj: input data.
     :param groupby: name of column to group columns in independent correlation matrices.
     :param width: width of plot in pixels.
     :param height: height of plot in pixels.
     :param title: title of plot.
     :param color: color or palette of colors to use in the plot.
-    :param bins: number of bins in histograms.
+    :param bins: number of bins in histograms, bin edges, or dict column -> bins.
     :param hoover: include a hoover tool. Default True.
-    :return: bokeh figure
+    :return: bokeh figure, or a grid of figures (n_columns per row, default up to 3) if
+            obj has more than one column.
     :author: Tecnalia Research and Innovation (Miguel Esteras and Sandra Riaño)
     """
-    logger = getLogger(__name__)
-    groups = obj[groupby] if groupby else None
-    source = obj.drop(groupby, axis=1) if groupby else obj.copy()
-    source = source.select_dtypes(include=['bool', 'float'])
-    if source.shape[1] > 1:
-        list_of_plots = [histograms(source[col], title=col,
-                                    width=width or 300,
-                                    height=height or 200,
-                                    hoover=hoover,
-                                    groupby=groups,
-                                    color=color, bins=bins)
-                         for col in source]
-        n = kwargs.pop('n_columns', None) or min([3, source.shape[1]])
-        return plots_to_grid(plots=list_of_plots, n_columns=n)
-
-    title = title or obj.name or ''
-
+    groups = obj[groupby] if isinstance(groupby, str) else groupby
+    if isinstance(obj, Series):
+        source = obj.to_frame(title or obj.name or '')
+    else:
+        source = obj.drop(groupby, axis=1) if isinstance(groupby, str) else obj
+        source = source.select_dtypes(include=['bool', 'float'])
+    parts = _partition(groups) if groups is not None else None
+    single = source.shape[1] == 1
+
+    list_of_plots = []
+    for col in source:
+        values = source[col].values.astype('float64')
+        col_bins = bins[col] if isinstance(bins, dict) else bins
+        # shared edges for every group of the column
+        edges = histogram_bin_edges(values[~isnan(values)], bins=col_bins)
+        if parts is None:
+            hists = {str(col): histogram(values[~isnan(values)], bins=edges)}
+        else:
+            hists = {}
+            for g, pos in parts.items():
+                sample = values[pos]
+                hists[str(g)] = histogram(sample[~isnan(sample)], bins=edges)
+        list_of_plots.append(
+            plot_histogram(hists, title=title if single else str(col),
+                           width=width or (800 if single else 300),
+                           height=height or (600 if single else 200),
+                           color=color, hoover=hoover))
+    if single:
+        return list_of_plots[0]
+    n = kwargs.pop('n_columns', None) or min([3, source.shape[1]])
+    return plots_to_grid(plots=list_of_plots, n_columns=n)
+
+
+def plot_histogram(hists: Dict[str, Tuple], title: str = None,
+                   width: int = 800, height: int = 600,
+                   color: Union[str, Iterable[str]] = None,
+                   hoover: bool = True) -> figure:
+    """Draw histograms already counted, e.g. accumulated over several files.
+
+    :param hists: dict series name -> (counts, edges), as returned by numpy.histogram.
+    :param title: title of plot.
+    :param width: width of plot in pixels.
+    :param height: height of plot in pixels.
+    :param color: color or palette of colors to use in the plot.
+    :param hoover: include a hoover tool. Default True.
+    :return: bokeh figure
+    """
     # x range
-    xmin, xmax = float(min(source)), float(source.max())
-    xpad = abs(abs(xmin) - abs(xmax)) * 0.05
+    xmin = min(float(edges[0]) for _, edges in hists.values())
+    xmax = max(float(edges[-1]) for _, edges in hists.values())
+    xpad = (xmax - xmin) * 0.05
     xrange = (xmin - xpad, xmax + (xpad * 2))
 
-    p = figure(title=title, tools='box_zoom,reset',
+    p = figure(title=title or '', tools='box_zoom,reset',
                background_fill_color="white",
-               plot_height=height or 600, plot_width=width or 800,
+               plot_height=height, plot_width=width,
                toolbar_location='above', x_range=xrange)
-    data = [(title, obj)] if groupby is None else [(str(key), df) for key, df
-                                                   in source.groupby(groups)]
-    color = color or brewer_sets_123
-    for c, (name, sample) in zip(color, data):
-        hist, edges = histogram(sample.dropna().values, bins=bins)
+    color = [color] if isinstance(color, str) else color or brewer_sets_123
+    for c, (name, (hist, edges)) in zip(color, hists.items()):
         source = ColumnDataSource(
             data=dict(values=hist, left=edges[:-1], right=edges[1:]))
         gly = p.quad(top='values', bottom=0, left='left', right='right',
@@ -459,7 +502,8 @@ def histograms(obj: Union[DataFrame, Series],
                      legend_label=str(name))
         if hoover:
             p.add_tools(HoverTool(renderers=[gly],
-                                  tooltips=[('Freq(x)', '@values')],
+                                  tooltips=[('x', '@left - @right'),
+                                            ('Freq(x)', '@values')],
                                   toggleable=False))
     p.y_range.start = 0
     p.xaxis.axis_label = 'x'
@@ -619,16 +663,12 @@ def time_lines(obj: Union[DataFrame, Series],
     # define x variable
     obj.index.name = obj.index.name or 'index'
     xvar = xvar or obj.index.name
-    df = obj.reset_index()
+    df = _plot_frame(obj, [xvar] + list(yvar) + [groupby], hoover_tips)
     # define x range
     if xrange is None:
-        xr = sorted(set(df[xvar]))
-        xrange = (xr[0], xr[int(len(xr) / 5)])
+        xrange = default_xrange(df[str(xvar)], 5)
     # plot only the time component of datetime variables in the y axis
-    ydtype = 'auto'
-    for dtvar in [y for y in yvar if is_datetime64_any_dtype(df[y])]:
-        df[dtvar] = df[dtvar].dt.time
-        ydtype = 'datetime'
+    ydtype = _time_of_day(df, yvar)
     # define title
     t = title or "; ".join([str(x) for x in yvar])
     # create figure
@@ -636,32 +676,31 @@ def time_lines(obj: Union[DataFrame, Series],
                toolbar_location='above', y_axis_type=ydtype,
                x_axis_type="datetime", background_fill_color="#f8f9f9",
                x_range=xrange, title=t)
-    # plot data
+    # plot data: every series draws its own column of a shared source
     color_palette = color_palette or palette_dark
+    sources = _group_sources(df, groupby)
     for col, c in zip(yvar, color_palette):
         if groupby:
-            groups = df[groupby].unique()
-            for g, cc in zip(groups, color_palette):
-                source = df[df[groupby] == g].rename(columns={col: 'y'})
-                if source['y'].empty or source['y'].isnull().all():
+            for (g, source), cc in zip(sources.items(), color_palette):
+                if _is_empty(source, col):
                     continue
                 w = 4 if g in highlight else line_width
-                gly = p.line(x=xvar, y='y', line_color=color or cc,
+                gly = p.line(x=str(xvar), y=str(col), line_color=color or cc,
                              line_width=w, source=source, legend_label=str(g))
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
         else:
-            source = df.rename(columns={col: 'y'})
-            if source['y'].empty or source['y'].isnull().all():
+            source = sources[None]
+            if _is_empty(source, col):
                 continue
             w = 4 if col in highlight else line_width
-            gly = p.line(x=xvar, y='y', line_color=color or c,
+            gly = p.line(x=str(xvar), y=str(col), line_color=color or c,
                          line_width=w, source=source, legend_label=str(col))
             if hoover:
-                tips = hoover_tips or [('value', '@y')]
-                p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                p.add_tools(HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
                                       toggleable=False))
     # title format
     p.title.text_font_size = '10pt' if title else '0pt'
@@ -750,51 +789,45 @@ def time_lines_and_dots(obj: Union[Series, DataFrame],
     # define datetime x variable
     obj.index.name = obj.index.name or 'index'
     xvar = xvar or obj.index.name
-    df = obj.reset_index()
+    df = _plot_frame(obj, [xvar] + list(yvar) + [groupby], hoover_tips)
 
     if xrange is None:
-        xr = sorted(set(df[xvar]))
-        xrange = (xr[0], xr[int(len(xr) / 10)])
+        xrange = default_xrange(df[str(xvar)], 10)
 
     # plot only the time component of datetime variables in the y axis
-    ydtype = 'auto'
-    for dtvar in [y for y in yvar if is_datetime64_any_dtype(df[y])]:
-        df[dtvar] = df[dtvar].dt.time
-        ydtype = 'datetime'
+    ydtype = _time_of_day(df, yvar)
 
     t = title or "; ".join([str(x) for x in yvar])
     p = figure(plot_height=height, plot_width=width, tools=toolbar,
                toolbar_location='above', x_axis_type="datetime",
                y_axis_type=ydtype,
                background_fill_color="#f8f9f9", x_range=xrange, title=t)
-    # plot data
+    # plot data: every series draws its own column of a shared source
     line_color_palette = line_color_palette or palette_dark
+    sources = _group_sources(df, groupby)
     for col, c in zip(yvar, line_color_palette):
         if groupby:
-            groups = df[groupby].unique()
-            for g, cc in zip(groups, line_color_palette):
-                source = df[df[groupby] == g].rename(columns={col: 'y'})
-                if source['y'].empty or source['y'].isnull().all():
+            for (g, source), cc in zip(sources.items(), line_color_palette):
+                if _is_empty(source, col):
                     continue
-                else:
-                    gly = p.line(x=xvar, y='y', line_color=line_color or cc,
-                                 line_width=line_width,
-                                 source=source, legend_label=str(g))
+                gly = p.line(x=str(xvar), y=str(col),
+                             line_color=line_color or cc,
+                             line_width=line_width,
+                             source=source, legend_label=str(g))
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
         else:
-            source = df.rename(columns={col: 'y'})
-            if source['y'].empty or source['y'].isnull().all():
+            source = sources[None]
+            if _is_empty(source, col):
                 continue
-            else:
-                gly = p.line(x=xvar, y='y', line_color=line_color or c,
-                             line_width=line_width,
-                             source=source, legend_label=str(col))
+            gly = p.line(x=str(xvar), y=str(col), line_color=line_color or c,
+                         line_width=line_width,
+                         source=source, legend_label=str(col))
             if hoover:
-                tips = hoover_tips or [('value', '@y')]
-                p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                p.add_tools(HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
                                       toggleable=False))
 
     if dots is not None:
@@ -802,37 +835,37 @@ def time_lines_and_dots(obj: Union[Series, DataFrame],
         dots_xvar = dots_xvar or dots.index.name
         dots_yvar = [dots_yvar] if isinstance(dots_yvar, str) else (
             dots_yvar if dots_yvar is not None else [dots.name])
-        df = dots.reset_index()
+        df = _plot_frame(dots, [dots_xvar] + list(dots_yvar) + [dots_groupby],
+                         hoover_tips)
         dots_color_palette = dots_color_palette or palette_dark
+        sources = _group_sources(df, dots_groupby)
         for col, c in zip(dots_yvar, dots_color_palette):
-            df.rename(columns={col: 'y'}, inplace=True)
             if dots_groupby:
-                for g, cc in zip(df[dots_groupby].unique(),
-                                 dots_color_palette):
-                    source = df[df[dots_groupby] == g]
-                    if source['y'].empty or source['y'].isnull().all():
+                for (g, source), cc in zip(sources.items(),
+                                           dots_color_palette):
+                    if _is_empty(source, col):
                         continue
-                    else:
-                        gly = p.circle(dots_xvar, 'y', size=dots_size,
-                                       fill_color=dots_color or cc,
-                                       fill_alpha=0.8, line_color='white',
-                                       source=source,
-                                       legend_label=str(g))
-                        if hoover:
-                            tips = hoover_tips or [('value', '@y')]
-                            p.add_tools(
-                                HoverTool(renderers=[gly], tooltips=tips,
-                                          toggleable=False))
+                    gly = p.circle(str(dots_xvar), str(col), size=dots_size,
+                                   fill_color=dots_color or cc,
+                                   fill_alpha=0.8, line_color='white',
+                                   source=source,
+                                   legend_label=str(g))
+                    if hoover:
+                        p.add_tools(
+                            HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
+                                      toggleable=False))
             else:
-                if df['y'].empty or df['y'].isnull().all():
+                source = sources[None]
+                if _is_empty(source, col):
                     continue
-                gly = p.circle(dots_xvar, 'y', size=dots_size, fill_alpha=0.8,
-                               line_color='white',
-                               fill_color=dots_color or c, source=df,
+                gly = p.circle(str(dots_xvar), str(col), size=dots_size,
+                               fill_alpha=0.8, line_color='white',
+                               fill_color=dots_color or c, source=source,
                                legend_label=str(col))
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
     else:
         logger.warning('Dots data is missing.')
@@ -906,17 +939,13 @@ def time_bars(obj: Union[DataFrame, Series], yvar: Union[str, List[str]],
     # define datetime x variable
     obj.index.name = obj.index.name or 'index'
     xvar = xvar or obj.index.name
-    df = obj.reset_index()
+    df = _plot_frame(obj, [xvar] + list(yvar) + [groupby], hoover_tips)
 
     if xrange is None:
-        xr = sorted(set(df[xvar]))
-        xrange = (xr[0], xr[int(len(xr) / 10)])
+        xrange = default_xrange(df[str(xvar)], 10)
 
     # plot only the time component of datetime variables in the y axis
-    ydtype = 'auto'
-    for dtvar in [y for y in yvar if is_datetime64_any_dtype(df[y])]:
-        df[dtvar] = df[dtvar].dt.time
-        ydtype = 'datetime'
+    ydtype = _time_of_day(df, yvar)
 
     t = title or "; ".join([str(x) for x in yvar])
     p = figure(plot_height=height, plot_width=width, tools=toolbar,
@@ -924,32 +953,31 @@ def time_bars(obj: Union[DataFrame, Series], yvar: Union[str, List[str]],
                x_axis_type="datetime", y_axis_type=ydtype,
                background_fill_color="#f8f9f9",
                x_range=xrange, title=t)
-    # plot data
+    # plot data: every series draws its own column of a shared source
     color_palette = color_palette or brewer_sets_23
+    sources = _group_sources(df, groupby)
     for col, c in zip(yvar, color_palette):
         if groupby:
-            groups = df[groupby].unique()
-            for g, cc in zip(groups, brewer['Set3'][12] * 10):
-                source = df[df[groupby] == g].rename(columns={col: 'y'})
-                if source['y'].empty or source['y'].isnull().all():
+            for (g, source), cc in zip(sources.items(), brewer['Set3'][12] * 10):
+                if _is_empty(source, col):
                     continue
-                gly = p.vbar(x=xvar, top='y', width=bar_width, source=source,
-                             legend_label=str(g),
+                gly = p.vbar(x=str(xvar), top=str(col), width=bar_width,
+                             source=source, legend_label=str(g),
                              fill_color=color or cc, line_color=color or cc)
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
         else:
-            source = df.rename(columns={col: 'y'})
-            if source['y'].empty or source['y'].isnull().all():
+            source = sources[None]
+            if _is_empty(source, col):
                 continue
-            gly = p.vbar(x=xvar, top=col, width=bar_width, source=source,
-                         legend_label=str(col),
+            gly = p.vbar(x=str(xvar), top=str(col), width=bar_width,
+                         source=source, legend_label=str(col),
                          fill_color=color or c, line_color=color or c)
             if hoover:
-                tips = hoover_tips or [('value', '@y')]
-                p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                p.add_tools(HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
                                       toggleable=False))
     # title format
     p.title.text_font_size = '10pt'
@@ -1024,51 +1052,46 @@ def time_scatter(obj: Union[DataFrame, Series],
     # define datetime x variable
     obj.index.name = obj.index.name or 'index'
     xvar = xvar or obj.index.name
-    df = obj.reset_index()
+    df = _plot_frame(obj, [xvar] + list(yvar) + [groupby], hoover_tips)
     # define x range
     if xrange is None:
-        xr = sorted(set(df[xvar]))
-        xrange = (xr[0], xr[int(len(xr) / 10)])
+        xrange = default_xrange(df[str(xvar)], 10)
 
     # plot only the time component of datetime variables in the y axis
-    ydtype = 'auto'
-    for dtvar in [y for y in yvar if is_datetime64_any_dtype(df[y])]:
-        df[dtvar] = df[dtvar].dt.time
-        ydtype = 'datetime'
+    ydtype = _time_of_day(df, yvar)
 
     t = title or "; ".join([str(x) for x in yvar])
     p = figure(plot_height=height, plot_width=width, tools=toolbar,
                toolbar_location='above', y_axis_type=ydtype,
                x_axis_type="datetime",
                background_fill_color="#f8f9f9", x_range=xrange, title=t)
-    # plot data
+    # plot data: every series draws its own column of a shared source
     color_palette = color_palette or brewer_sets_23
+    sources = _group_sources(df, groupby)
     for col, c in zip(yvar, color_palette):
         if groupby:
-            groups = df[groupby].unique()
-            for g, cc in zip(groups, color_palette):
-                source = df[df[groupby] == g].rename(columns={col: 'y'})
-                if source['y'].empty or source['y'].isnull().all():
+            for (g, source), cc in zip(sources.items(), color_palette):
+                if _is_empty(source, col):
                     continue
-                gly = p.circle(x=xvar, y='y', source=source,
+                gly = p.circle(x=str(xvar), y=str(col), source=source,
                                size=size, fill_color=color or cc,
                                fill_alpha=alpha, line_alpha=0,
                                legend_label=str(g))
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
         else:
-            source = df.rename(columns={col: 'y'})
-            if source['y'].empty or source['y'].isnull().all():
+            source = sources[None]
+            if _is_empty(source, col):
                 continue
-            gly = p.circle(x=xvar, y='y', source=source,
+            gly = p.circle(x=str(xvar), y=str(col), source=source,
                            size=size, fill_color=color or c, fill_alpha=alpha,
                            line_alpha=0,
                            legend_label=str(col))
             if hoover:
-                tips = hoover_tips or [('value', '@y')]
-                p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                p.add_tools(HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
                                       toggleable=False))
     # title format
     p.title.text_font_size = '10pt'
@@ -1171,7 +1194,9 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
             hoover_tips: Iterable[Tuple] = None,
             toolbar: str = "pan,box_zoom,reset",
             xaxis_labels_map: Dict = None,
-            yaxis_labels_map: Dict = None) -> Union[figure, None]:
+            yaxis_labels_map: Dict = None,
+            density: bool = False,
+            density_cell: int = 4) -> Union[figure, None]:
     """Scatter plot + Histograms on x and y axis + regression line/curve.
 
     :param obj: input table.
@@ -1211,11 +1236,19 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
     :param title: title of plot.
     :param xaxis_labels_map: dict used to override major x axis labels. Default None.
     :param yaxis_labels_map: dict used to override major y axis labels. Default None.
+    :param density: draw the number of points per cell as an image instead of one marker
+                per row, so the size of the html does not grow with the rows. With colorvar
+                each cell shows the mean of colorvar. Markers ignore groupby, size and
+                jitter; hoover tips can use $x, $y, @points and @image. Default False.
+    :param density_cell: size of the density cells in pixels. Default 4.
     :return: bokeh figure.
     :author: Tecnalia Research and Innovation (Miguel Esteras and Sandra Riaño)
     """
 
     logger = getLogger(__name__)
+    if density and not (is_numeric_dtype(obj[xvar]) and is_numeric_dtype(obj[yvar])):
+        logger.error('Density needs numerical x and y.')
+        return
     # define axis range
     if not xrange:
         if is_numeric_dtype(obj[xvar]):
@@ -1240,9 +1273,27 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
 
     color_palette = color_palette or brewer_sets_123
     scatter_params = {size_type: size}
-    if groupby:
-        for g, cc in zip(obj[groupby].unique(), color_palette):
-            source = obj[obj[groupby] == g]
+    # split rows by group once, reused by markers, regression and histograms
+    parts = _partition(obj[groupby]) if groupby else {}
+    if density:
+        gly = _density_image(p, obj[xvar].values, obj[yvar].values,
+                             None if colorvar is None else obj[colorvar].values,
+                             density_cell, rainbow if not color_asc else rainbow[::-1],
+                             color_min, color_max)
+        if gly is None:
+            logger.error('All NaN values in axis.')
+            return
+        if colorvar is not None:
+            p.title.text = p.title.text + f' | Color Bar: {colorvar}'
+        if hoover:
+            tips = hoover_tips or ([('x', '$x'), ('y', '$y'), ('points', '@points')] +
+                                   ([] if colorvar is None else [('c', '@image')]))
+            p.add_tools(
+                HoverTool(renderers=[gly], tooltips=tips, toggleable=False))
+
+    elif groupby:
+        for (g, pos), cc in zip(parts.items(), color_palette):
+            source = obj.take(pos)
             source.insert(0, 'x', source[xvar])
             source.insert(0, 'y', source[yvar])
             if source.y.isnull().all() or source.x.isnull().all():
@@ -1295,9 +1346,11 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
     if get_regression:
         source = obj[(notnull(obj[xvar])) & (notnull(obj[yvar]))]
         if groupby:
-            for g, cc in zip(source[groupby].unique(), color_palette):
-                x = source[source[groupby] == g][xvar].values
-                y = source[source[groupby] == g][yvar].values
+            for (g, pos), cc in zip(parts.items(), color_palette):
+                x = obj[xvar].values[pos]
+                y = obj[yvar].values[pos]
+                valid = notnull(x) & notnull(y)
+                x, y = x[valid], y[valid]
                 try:
                     fit = polyfit(x, y, deg)
                     fit_fn = poly1d(fit)
@@ -1372,8 +1425,8 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
     xh.xaxis.axis_label_standoff = 20
     line_param = dict(color="#3A5785", line_color=None)
     if groupby:
-        for g, cc in zip(obj[groupby].unique(), brewer_sets_123):
-            xx = obj[obj[groupby] == g][xvar].values
+        for pos, cc in zip(parts.values(), brewer_sets_123):
+            xx = obj[xvar].values[pos]
             xxhist, xxedges = histogram(xx[~isnan(xx)], bins=nbins)
             xh.quad(bottom=0, left=xxedges[:-1], right=xxedges[1:], top=xxhist,
                     color=cc,
@@ -1405,8 +1458,8 @@ def scatter(obj: DataFrame, xvar: str, yvar: str, xrange: Tuple = None,
     yh.yaxis.axis_label_standoff = 20
 
     if groupby:
-        for g, cc in zip(obj[groupby].unique(), brewer_sets_123):
-            yy = obj[obj[groupby] == g][yvar].values
+        for pos, cc in zip(parts.values(), brewer_sets_123):
+            yy = obj[yvar].values[pos]
             yyhist, yyedges = histogram(yy[~isnan(yy)], bins=nbins)
             yh.quad(left=0, bottom=yyedges[:-1], top=yyedges[1:], right=yyhist,
                     color=cc,
@@ -1480,44 +1533,44 @@ def lines(obj: Union[DataFrame, Series],
     # define datetime x variable
     obj.index.name = obj.index.name or 'index'
     xvar = xvar or obj.index.name
-    df = obj.reset_index()
+    df = _plot_frame(obj, [xvar] + list(yvar) + [groupby], hoover_tips)
     # define axis range
-    xdiff = (obj[xvar].max() - obj[xvar].min()) * 1.1
-    xrange = xrange or [obj[xvar].max() - xdiff, obj[xvar].min() + xdiff]
+    xmin, xmax = default_xrange(df[str(xvar)])
+    xdiff = (xmax - xmin) * 1.1
+    xrange = xrange or [xmax - xdiff, xmin + xdiff]
     # define title
     t = title or "; ".join([str(x) for x in yvar])
     # create figure
     p = figure(plot_height=height, plot_width=width, tools=toolbar,
                toolbar_location="above",
                background_fill_color="#f8f9f9", x_range=xrange, title=t)
-    # plot data
+    # plot data: every series draws its own column of a shared source
     color_palette = color_palette or brewer_sets_123
+    sources = _group_sources(df, groupby)
     for col, c in zip(yvar, color_palette):
         if groupby:
-            groups = df[groupby].unique()
-            for g, cc in zip(groups, color_palette):
-                source = df[df[groupby] == g].rename(columns={col: 'y'})
-                if source['y'].empty or source['y'].isnull().all():
+            for (g, source), cc in zip(sources.items(), color_palette):
+                if _is_empty(source, col):
                     continue
                 w = 4 if g in highlight else line_width
-                gly = p.line(x=xvar, y='y', line_color=color or cc,
+                gly = p.line(x=str(xvar), y=str(col), line_color=color or cc,
                              line_width=w, source=source,
                              legend_label=str(g))
                 if hoover:
-                    tips = hoover_tips or [('value', '@y')]
-                    p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                    p.add_tools(HoverTool(renderers=[gly],
+                                          tooltips=_series_tips(hoover_tips, col),
                                           toggleable=False))
         else:
-            source = df.rename(columns={col: 'y'})
-            if source['y'].empty or source['y'].isnull().all():
+            source = sources[None]
+            if _is_empty(source, col):
                 continue
             w = 4 if col in highlight else line_width
-            gly = p.line(x=xvar, y='y', line_color=color or c, line_width=w,
-                         source=source,
+            gly = p.line(x=str(xvar), y=str(col), line_color=color or c,
+                         line_width=w, source=source,
                          legend_label=str(col))
             if hoover:
-                tips = hoover_tips or [('value', '@y')]
-                p.add_tools(HoverTool(renderers=[gly], tooltips=tips,
+                p.add_tools(HoverTool(renderers=[gly],
+                                      tooltips=_series_tips(hoover_tips, col),
                                       toggleable=False))
 
     # reference lines
@@ -1700,3 +1753,210 @@ def plot_text(text: str, width: float = 50, height: float = 50,
     p.outline_line_color = outline_color
 
     return p
+
+
+def plots_to_grid(plots: List, n_columns: int = 3):
+    """Arrange figures in rows of n_columns with one shared toolbar.
+
+    :param plots: bokeh figures.
+    :param n_columns: figures per row. Default 3.
+    :return: bokeh grid.
+    """
+    return gridplot(plots, ncols=n_columns, toolbar_location='above')
+
+
+def columnar_source(obj: DataFrame, columns: Iterable[str] = None,
+                    dtypes: Dict[str, str] = None) -> ColumnDataSource:
+    """Build a ColumnDataSource holding only the given columns as typed arrays.
+
+    Bokeh embeds numeric numpy arrays as base64 binary buffers, but falls back
+    to JSON lists for int64 and object arrays, and ``ColumnDataSource(df)``
+    also ships the index. Datetime columns are sent as float64 milliseconds
+    since epoch (what BokehJS uses; exact up to year 287396), boolean columns
+    as uint8 and the rest in their own dtype unless overridden.
+
+    :param obj: input data.
+    :param columns: columns to include. Default None. If None all columns are
+            included. The index is never included.
+    :param dtypes: dtype per column to cast to, v.g. {'Puerta': 'uint8'}.
+    :return: bokeh ColumnDataSource.
+    """
+    columns = list(columns) if columns is not None else list(obj.columns)
+    dtypes = dtypes or {}
+    data = {}
+    for col in columns:
+        values = obj[col].values
+        if is_datetime64_any_dtype(obj[col]):
+            values = (values.astype('datetime64[ns]').astype('int64') /
+                      1e6).astype('float64')
+        elif values.dtype == bool:
+            values = values.astype('uint8')
+        if col in dtypes:
+            values = values.astype(dtypes[col])
+        data[col] = values
+    return ColumnDataSource(data=data)
+
+
+def default_xrange(values: Union[Series, Sequence], part: int = None) -> Tuple:
+    """Default x range of a plot over the distinct values of x.
+
+    Same result as ``xr = sorted(set(values)); (xr[0], xr[int(len(xr) / part)])``
+    but without boxing every value into a Python object: on sorted numeric or
+    datetime64 data (time series) the distinct values come from a single
+    vectorized pass, O(n); unsorted data is sorted natively with
+    ``numpy.unique``. Missing values are ignored.
+
+    :param values: x values.
+    :param part: the range covers the first 1/part of the distinct values.
+            Default None, the full (min, max) span.
+    :return: (start, end) as Python scalars or pandas Timestamps.
+    """
+    v = asarray(values)
+    if v.dtype.kind not in 'biufmM':
+        xr = sorted(set(v))
+        return (xr[0], xr[-1]) if part is None else (xr[0], xr[int(len(xr) / part)])
+    if v.dtype.kind in 'fmM':
+        v = v[notnull(v)]
+    if len(v) > 1 and not (v[1:] >= v[:-1]).all():
+        v = unique(v)
+    if part is None:
+        ends = v[[0, -1]]
+    else:
+        # positions where a new distinct value starts
+        starts = concatenate([[0], flatnonzero(v[1:] != v[:-1]) + 1])
+        ends = v[[0, starts[int(len(starts) / part)]]]
+    return tuple(Series(ends).tolist())
+
+
+def _tip_columns(obj: DataFrame, tips: Iterable[Tuple[str, str]]) -> List:
+    """Columns of obj referenced in hover tips as @column or @{column}."""
+    text = ' '.join(str(tip) for _, tip in (tips or ()))
+    return [c for c in obj.columns
+            if f'@{c}' in text or f'@{{{c}}}' in text]
+
+
+def _plot_frame(obj: Union[DataFrame, Series], columns: Iterable,
+                tips: Iterable[Tuple[str, str]] = None) -> DataFrame:
+    """Narrow frame with only the columns a plot needs, named as strings.
+
+    Columns are taken from obj or from its index (as reset_index would
+    expose them), plus any column referenced in the hover tips. None entries
+    are skipped. The rest of obj is neither copied nor modified.
+
+    :param obj: input data.
+    :param columns: x, y and group columns.
+    :param tips: hover tips, v.g. [('label', '@column_name')].
+    :return: data frame with string column names.
+    """
+    frame = obj.to_frame(obj.name if obj.name is not None else 0) \
+        if isinstance(obj, Series) else obj
+    wanted = [c for c in columns if c is not None]
+    wanted += [c for c in _tip_columns(frame, tips) if c not in wanted]
+    data = {}
+    for col in wanted:
+        if col in frame.columns:
+            data[str(col)] = frame[col].values
+        else:
+            data[str(col)] = frame.index.get_level_values(col).values
+    return DataFrame(data)
+
+
+def _time_of_day(df: DataFrame, yvar: Iterable) -> str:
+    """Replace datetime y columns of df by their time of day.
+
+    :return: 'datetime' if any column was replaced, else 'auto'.
+    """
+    ydtype = 'auto'
+    for dtvar in [str(y) for y in yvar if is_datetime64_any_dtype(df[str(y)])]:
+        df[dtvar] = df[dtvar].dt.time
+        ydtype = 'datetime'
+    return ydtype
+
+
+def _group_sources(df: DataFrame, groupby: str = None) -> Dict:
+    """One ColumnDataSource per group of df, or a single one under None.
+
+    All series of a group share its source and reference their own column,
+    so each value is embedded once whatever the number of series.
+    """
+    if not groupby:
+        return {None: columnar_source(df)}
+    return {g: columnar_source(df.take(pos))
+            for g, pos in _partition(df[str(groupby)]).items()}
+
+
+def _partition(values: Union[Series, Sequence]) -> Dict:
+    """Row positions of every group, from a single stable sort of the codes.
+
+    Replaces one ``values == g`` scan per group (and per column) by one
+    factorize and one argsort, so splitting stays O(n log n) whatever the
+    number of groups. Groups come in order of appearance, as ``unique()``;
+    missing values form no group.
+
+    :param values: group label of every row.
+    :return: dict group -> array of row positions, in their original order.
+    """
+    codes, groups = factorize(values)
+    order = codes.argsort(kind='stable')
+    bounds = searchsorted(codes[order], arange(len(groups) + 1))
+    return {g: order[bounds[i]:bounds[i + 1]] for i, g in enumerate(groups)}
+
+
+def _is_empty(source: ColumnDataSource, col) -> bool:
+    """True if the column of a source has no values or only missing ones."""
+    values = source.data[str(col)]
+    return len(values) == 0 or Series(values).isnull().all()
+
+
+def _series_tips(tips: Iterable[Tuple[str, str]], col) -> List[Tuple[str, str]]:
+    """Hover tips of one series; @y and @{y} refer to the series column."""
+    field = f'@{{{col}}}'
+    return [(label, re.sub(r'@\{y\}|@y\b', field, tip))
+            for label, tip in (tips or [('value', '@y')])]
+
+
+def _density_cells(lo: float, hi: float, plot_range, pixels: int, cell: int) -> int:
+    # cells of about `cell` pixels over the data span [lo, hi] of the axis
+    shown = (plot_range.end - plot_range.start) if isinstance(plot_range, Range1d) else 0
+    fraction = min(1, (hi - lo) / abs(shown)) if shown else 1
+    return max(1, int(pixels * fraction / cell))
+
+
+def _density_image(p: figure, x, y, c=None, cell: int = 4,
+                   palette: List[str] = rainbow, color_min: float = None,
+                   color_max: float = None):
+    # points per cell (or mean of c per cell) drawn as one image on p
+    x = asarray(x, dtype='float64')
+    y = asarray(y, dtype='float64')
+    valid = ~(isnan(x) | isnan(y))
+    if c is not None:
+        c = asarray(c, dtype='float64')
+        valid &= ~isnan(c)
+    x, y = x[valid], y[valid]
+    if not len(x):
+        return None
+    bins = (_density_cells(x.min(), x.max(), p.x_range, p.plot_width, cell),
+            _density_cells(y.min(), y.max(), p.y_range, p.plot_height, cell))
+    counts, xedges, yedges = histogram2d(x, y, bins=bins)
+    if c is None:
+        image = where(counts > 0, counts, nan)
+        mapper = LogColorMapper(palette=palette, low=1, high=max(counts.max(), 2),
+                                nan_color=(0, 0, 0, 0))
+    else:
+        sums = histogram2d(x, y, bins=[xedges, yedges], weights=c[valid])[0]
+        with errstate(invalid='ignore', divide='ignore'):
+            image = sums / counts
+        low, high = nanquantile(image, [.01, .99])
+        mapper = LinearColorMapper(palette=palette,
+                                   low=low if color_min is None else color_min,
+                                   high=high if color_max is None else color_max,
+                                   nan_color=(0, 0, 0, 0))
+    # images are indexed [y, x]
+    source = ColumnDataSource({'image': [image.T.astype('float32')],
+                               'points': [counts.T.astype('int32')]})
+    gly = p.image(image='image', x=xedges[0], y=yedges[0], dw=xedges[-1] - xedges[0],
+                  dh=yedges[-1] - yedges[0], color_mapper=mapper, source=source)
+    p.add_layout(ColorBar(color_mapper=mapper, major_label_text_font_size="10pt",
+                          ticker=BasicTicker(desired_num_ticks=10), label_standoff=10,
+                          border_line_color=None, location=(0, 0), width=10), 'right')
+    return gly
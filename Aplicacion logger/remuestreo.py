@@ -0,0 +1,212 @@
+# remuestreo.py
+# Agregados por hora, dia, etc. (min/media/max y aperturas de puerta) de un log
+
+import hashlib
+import os
+from logging import getLogger, NullHandler
+from typing import Dict, Iterable, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from lectura import clave_cache, lecturas_de, leer_log, limpiar_cache
+
+# Add do-nothing handler to the module logger.
+getLogger(__name__).addHandler(NullHandler())
+
+agregaciones_default = ('min', 'mean', 'max')
+
+# como se combinan dos resultados parciales de la misma cubeta; 'mean' se
+# guarda como suma y cuenta hasta el final
+_reglas = {'min': 'min', 'max': 'max', 'sum': 'sum', 'count': 'sum',
+           'first': 'first', 'last': 'last', '': 'sum', 'abierta': 'sum'}
+
+Agregaciones = Union[Sequence[str], Dict[str, Sequence[str]]]
+
+
+def aperturas(puerta, previa: float = 0) -> np.ndarray:
+    """Rows where the door goes from closed to open.
+
+    :param puerta: Puerta column, in time order.
+    :param previa: Puerta value of the row before the first one, for chunks.
+    :return: boolean mask.
+    """
+    abierta = np.asarray(puerta) > 0
+    antes = np.concatenate([[previa > 0], abierta[:-1]])
+    return abierta & ~antes
+
+
+def _por_columna(columnas: Iterable[str], agregaciones: Agregaciones) -> Dict[str, List[str]]:
+    if isinstance(agregaciones, dict):
+        return {col: list(agregaciones[col]) for col in columnas if col in agregaciones}
+    return {col: list(agregaciones) for col in columnas}
+
+
+def _parcial(df: pd.DataFrame, paso: int, por_columna: Dict[str, List[str]],
+             xvar: str, puerta: str, previa: float) -> pd.DataFrame:
+    # agregados de df por cubeta, con 'mean' como suma y cuenta
+    t = df[xvar].values.astype('datetime64[ns]').astype('int64')
+    cubeta = t // paso * paso
+    internas = {col: list(dict.fromkeys([a for a in aggs if a != 'mean'] +
+                                        (['sum', 'count'] if 'mean' in aggs else [])))
+                for col, aggs in por_columna.items()}
+    grupos = df[list(internas)].groupby(cubeta)
+    parcial = grupos.agg(internas) if internas else pd.DataFrame(index=np.unique(cubeta))
+    parcial[('muestras', '')] = grupos.size() if internas else \
+        pd.Series(cubeta).groupby(cubeta).size()
+    if puerta in df:
+        valores = df[puerta].to_numpy()
+        parcial[('aperturas', '')] = pd.Series(aperturas(valores, previa)).groupby(cubeta).sum()
+        parcial[(puerta, 'abierta')] = pd.Series(valores > 0).groupby(cubeta).sum()
+    return parcial
+
+
+def _final(parcial: pd.DataFrame, por_columna: Dict[str, List[str]],
+           xvar: str, puerta: str) -> pd.DataFrame:
+    # medias y fraccion abierta a partir de sumas y cuentas, columnas 'TInt_min'...
+    resultado = {xvar: pd.to_datetime(parcial.index.values)}
+    resultado['muestras'] = parcial[('muestras', '')].to_numpy(dtype='int64')
+    for col, aggs in por_columna.items():
+        for agg in aggs:
+            if agg == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    valores = parcial[(col, 'sum')].to_numpy(dtype='float64') / \
+                        parcial[(col, 'count')].to_numpy()
+            else:
+                valores = parcial[(col, agg)].to_numpy()
+            resultado[f'{col}_{agg}'] = valores
+    if ('aperturas', '') in parcial:
+        resultado['aperturas'] = parcial[('aperturas', '')].to_numpy(dtype='int64')
+        resultado[f'{puerta}_abierta'] = parcial[(puerta, 'abierta')].to_numpy() / resultado['muestras']
+    return pd.DataFrame(resultado)
+
+
+def remuestrear(df: pd.DataFrame, intervalo: str, columnas: Iterable[str] = None,
+                agregaciones: Agregaciones = agregaciones_default,
+                xvar: str = 'Tiempo', puerta: str = 'Puerta') -> pd.DataFrame:
+    """Aggregate a log per time bucket (hour, day...).
+
+    Buckets are aligned to multiples of ``intervalo`` since the epoch, so
+    '1h' buckets start on the hour and '1D' buckets at midnight. Buckets
+    without readings are left out. NaN readings are skipped by every
+    aggregation.
+
+    :param df: log as returned by :func:`lectura.leer_log`, in time order.
+    :param intervalo: bucket size as a pandas Timedelta string, e.g. '1h', '1D'.
+    :param columnas: reading columns. Default all but Tiempo and Puerta.
+    :param agregaciones: pandas aggregation names applied to every column,
+            or a dictionary column -> names. Default min, mean and max.
+    :param xvar: datetime column.
+    :param puerta: door column; if present the result also has the number
+            of openings ('aperturas') and the fraction of samples with the
+            door open ('Puerta_abierta') per bucket.
+    :return: one row per bucket: xvar (bucket start), 'muestras' and one
+            column per column and aggregation, named like 'TInt_min'.
+    """
+    paso = pd.Timedelta(intervalo).value
+    if paso <= 0:
+        raise ValueError(f'intervalo debe ser positivo, no {intervalo}')
+    por_columna = _por_columna(lecturas_de(df.columns) if columnas is None else columnas,
+                               agregaciones)
+    return _final(_parcial(df, paso, por_columna, xvar, puerta, 0), por_columna, xvar, puerta)
+
+
+class AcumuladorRemuestreo:
+    """Build the result of :func:`remuestrear` from consecutive chunks.
+
+    Each chunk is aggregated on its own and buckets cut by a chunk edge are
+    merged at the end, so memory depends on the chunk and the number of
+    buckets, not on the log. Only aggregations that can be merged are
+    accepted: min, max, mean, sum, count, first and last.
+
+    :param intervalo: bucket size, see :func:`remuestrear`.
+    :param columnas: reading columns.
+    :param agregaciones: see :func:`remuestrear`.
+    :param xvar: datetime column.
+    :param puerta: door column.
+    """
+
+    def __init__(self, intervalo: str, columnas: Iterable[str],
+                 agregaciones: Agregaciones = agregaciones_default,
+                 xvar: str = 'Tiempo', puerta: str = 'Puerta'):
+        self.paso = pd.Timedelta(intervalo).value
+        if self.paso <= 0:
+            raise ValueError(f'intervalo debe ser positivo, no {intervalo}')
+        self.por_columna = _por_columna(columnas, agregaciones)
+        invalidas = {agg for aggs in self.por_columna.values() for agg in aggs} - set(_reglas) - {'mean'}
+        if invalidas:
+            raise ValueError(f'agregaciones que no se pueden calcular por partes: {sorted(invalidas)}')
+        self.xvar = xvar
+        self.puerta = puerta
+        self._partes = []
+        self._previa = 0
+
+    def agregar(self, parte: pd.DataFrame):
+        """Add the next chunk (in time order)."""
+        if not len(parte):
+            return
+        self._partes.append(_parcial(parte, self.paso, self.por_columna, self.xvar,
+                                     self.puerta, self._previa))
+        if self.puerta in parte:
+            self._previa = parte[self.puerta].iloc[-1]
+
+    def resultado(self) -> pd.DataFrame:
+        """Buckets of all the chunks together, as :func:`remuestrear`."""
+        if not self._partes:
+            return _final(pd.DataFrame(columns=pd.MultiIndex.from_tuples([('muestras', '')])),
+                          {}, self.xvar, self.puerta)
+        parcial = pd.concat(self._partes)
+        if parcial.index.has_duplicates:
+            parcial = parcial.groupby(level=0).agg({c: _reglas[c[1]] for c in parcial.columns})
+        self._partes = [parcial]
+        return _final(parcial, self.por_columna, self.xvar, self.puerta)
+
+
+def _clave_remuestreo(intervalo: str, columnas, agregaciones: Agregaciones) -> str:
+    # '1h' y '60min' son la misma cubeta
+    texto = repr((pd.Timedelta(intervalo).value, None if columnas is None else list(columnas),
+                  agregaciones if isinstance(agregaciones, dict) else list(agregaciones)))
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:12]
+
+
+def remuestrear_log(ruta: str, intervalo: str, df: pd.DataFrame = None,
+                    columnas: Iterable[str] = None,
+                    agregaciones: Agregaciones = agregaciones_default,
+                    carpeta: str = '.cache_logs', max_bytes: int = 1 << 30,
+                    motor: str = 'c', contenido: bool = False) -> pd.DataFrame:
+    """Aggregates of a log file, through a cache per (file, bucket size).
+
+    The result is stored in ``carpeta`` next to the parsed frames of
+    :func:`lectura.leer_log_cache` and shares its eviction, keyed by the
+    file version and the aggregation asked for. Going back and forth
+    between hourly and daily views of the same file reads only the
+    aggregates, never the log.
+
+    :param ruta: path to a logNNNN.txt or logNNNN.bin file.
+    :param intervalo: bucket size, see :func:`remuestrear`.
+    :param df: the clean log if the caller already has it; on a miss it is
+            used instead of reading ``ruta``.
+    :param columnas: reading columns, see :func:`remuestrear`.
+    :param agregaciones: see :func:`remuestrear`.
+    :param carpeta: cache directory, created if missing.
+    :param max_bytes: maximum total size of the cache. Default 1 GiB.
+    :param motor: parser engine on a miss, see :func:`lectura.leer_log`.
+    :param contenido: key entries by file content, see :func:`lectura.clave_cache`.
+    :return: same as :func:`remuestrear` on the clean log.
+    """
+    logger = getLogger(__name__)
+    os.makedirs(carpeta, exist_ok=True)
+    entrada = os.path.join(carpeta, f'{clave_cache(ruta, contenido)}.'
+                                    f'{_clave_remuestreo(intervalo, columnas, agregaciones)}.h5')
+    if os.path.exists(entrada):
+        logger.debug(f'remuestreo {intervalo}: {ruta} leido de {entrada}')
+        os.utime(entrada)
+        return pd.read_hdf(entrada, 'agregados')
+    if df is None:
+        df = leer_log(ruta, motor=motor)
+    resultado = remuestrear(df, intervalo, columnas, agregaciones)
+    temporal = f'{entrada}.{os.getpid()}.tmp'
+    resultado.to_hdf(temporal, 'agregados', mode='w')
+    os.replace(temporal, entrada)
+    limpiar_cache(carpeta, max_bytes)
+    return resultado
@@ -18,6 +18,51 @@ char filename[16];
 
 DHT dht[] = {{DHTPIN1, DHT22},{DHTPIN2, DHT22},}; //,{DHTPIN3, DHT22},{DHTPIN4, DHT22}
 
+// Sensores conectados (descomentar los pines de arriba para sumar mas).
+// Cada sensor agrega dos columnas al log: los dos primeros conservan los
+// nombres TInt/HInt y TExterio/HExt, los siguientes T3/H3, T4/H4...
+const int SENSORES = sizeof(dht) / sizeof(dht[0]);
+const char* const COLUMNAS[] = {"TInt", "HInt", "TExterio", "HExt", "T3", "H3", "T4", "H4"};
+float temperatura[SENSORES];
+float humedad[SENSORES];
+
+// Comentar para volver al formato de texto (logNNNN.txt)
+#define LOG_BINARIO
+
+#ifdef LOG_BINARIO
+#define FORMATO_ARCHIVO "log%04d.bin"
+// Registro de 13 bytes con dos sensores (4 mas por sensor): hora del RTC
+// (segundos desde 1970), temperatura y humedad de cada sensor en centesimos
+// y puerta. Se juntan en RAM y se escriben de a un sector de la SD (512
+// bytes, 39 registros): un corte de energia pierde a lo sumo ~80 s.
+struct __attribute__((packed)) Registro {
+  uint32_t tiempo;
+  int16_t lecturas[2 * SENSORES];
+  uint8_t puerta;
+};
+const int REGISTROS_POR_SECTOR = 512 / sizeof(Registro);
+Registro registros[REGISTROS_POR_SECTOR];
+int cantidadRegistros = 0;
+
+int16_t centesimos(float valor) {
+  if (isnan(valor)) return INT16_MIN; // lectura fallida del sensor
+  return (int16_t) lround(valor * 100);
+}
+
+void escribirRegistros() {
+  File archivo = SD.open(filename, FILE_WRITE);
+  if (archivo) {
+    archivo.write((const uint8_t*) registros, cantidadRegistros * sizeof(Registro));
+    archivo.close();
+  } else {
+    Serial.println("Error al abrir/crear el archivo en tarjeta SD");
+  }
+  cantidadRegistros = 0;
+}
+#else
+#define FORMATO_ARCHIVO "log%04d.txt"
+#endif
+
 void setup() {
   Serial.begin(9600);
   Serial.println("Iniciando programa...");
@@ -49,16 +94,27 @@ void setup() {
   
   
   int n = 0;
-  snprintf(filename, sizeof(filename), "log%04d.txt", n); // includes a three-digit sequence number in the file name
+  snprintf(filename, sizeof(filename), FORMATO_ARCHIVO, n); // includes a three-digit sequence number in the file name
   while(SD.exists(filename)) {
     n++;
-    snprintf(filename, sizeof(filename), "log%04d.txt", n);
+    snprintf(filename, sizeof(filename), FORMATO_ARCHIVO, n);
   }
   File logFile = SD.open(filename,FILE_READ);
   Serial.println(filename);
   logFile.close();
   File archivo = SD.open(filename, FILE_WRITE);
-  archivo.println("Tiempo,TInt,HInt,TExterio,HExt,Puerta");
+#ifdef LOG_BINARIO
+  // firma, version, bytes por registro y 2 reservados
+  const uint8_t cabecera[8] = {'D', 'H', 'T', 'B', 1, sizeof(Registro), 0, 0};
+  archivo.write(cabecera, sizeof(cabecera));
+#else
+  archivo.print("Tiempo,");
+  for (int i = 0; i < 2 * SENSORES; i++) {
+    archivo.print(COLUMNAS[i]);
+    archivo.print(",");
+  }
+  archivo.println("Puerta");
+#endif
   archivo.close(); 
   
   pinMode(PULSADOR,INPUT);
@@ -67,12 +123,23 @@ void setup() {
 
 
 long tiempoUltimaLectura=0; //Para guardar el tiempo de la última lectura
-float hi=0; //INICIA HumedadInterior
-float he=0; //INICIA HumedadExterior
-float ti=0; //INICIA TemperaturaInterior
-float te=0; //INICIA TemperaturaExterior
 int puerta=0; //INICIA PULSADOR
 
+// "H Ext: 45.10% T Ext: 22.30 *C - "; los sensores extra se nombran por numero
+void imprimirSensor(int i) {
+  const char* nombre = i == 0 ? "Int" : "Ext";
+  Serial.print("H ");
+  if (i < 2) Serial.print(nombre); else Serial.print(i + 1);
+  Serial.print(": ");
+  Serial.print(humedad[i]);
+  Serial.print("% ");
+  Serial.print("T ");
+  if (i < 2) Serial.print(nombre); else Serial.print(i + 1);
+  Serial.print(": ");
+  Serial.print(temperatura[i]);
+  Serial.print(" *C - ");
+}
+
 void loop() {
   digitalWrite(LED_BUILTIN, HIGH);   // turn the LED on (HIGH is the voltage level)      
   if  (digitalRead(PULSADOR) == LOW){     // Si la lectura del pulsador es HIGH (pulsado)...
@@ -83,24 +150,18 @@ void loop() {
   //---------Lectura del Sensor--------------------------
   if(millis()-tiempoUltimaLectura>2000)
   {    
-       hi = dht[0].readHumidity(); //Leemos la Humedad //PIN2
-       ti = dht[0].readTemperature(); //Leemos la temperatura en grados Celsius
-       he = dht[1].readHumidity(); //Leemos la Humedad //PIN3
-       te = dht[1].readTemperature(); //Leemos la temperatura en grados Celsius
+       for (int i = 0; i < SENSORES; i++) {
+         humedad[i] = dht[i].readHumidity(); //Leemos la Humedad
+         temperatura[i] = dht[i].readTemperature(); //Leemos la temperatura en grados Celsius
+       }
  
       //--------Enviamos las lecturas por el puerto serial-------------
-      Serial.print("H Ext: ");
-      Serial.print(he);
-      Serial.print("% ");
-      Serial.print("T Ext: ");
-      Serial.print(te);
-      Serial.print(" *C - ");
-      Serial.print("H Int: ");
-      Serial.print(hi);
-      Serial.print("% ");
-      Serial.print("T Int: ");
-      Serial.print(ti);
-      Serial.print(" *C - ");
+      // exterior, interior y despues los sensores extra
+      imprimirSensor(1);
+      imprimirSensor(0);
+      for (int i = 2; i < SENSORES; i++) {
+        imprimirSensor(i);
+      }
       tiempoUltimaLectura=millis(); //actualizamos el tiempo de la última lectura
   //----Fin de la lectura---------------------------
 
@@ -116,6 +177,19 @@ void loop() {
  
   //----Inicio de escritura---------------------------
  
+#ifdef LOG_BINARIO
+       DateTime now = RTC.now();
+       Registro &registro = registros[cantidadRegistros++];
+       registro.tiempo = now.unixtime();
+       for (int i = 0; i < SENSORES; i++) {
+         registro.lecturas[2 * i] = centesimos(temperatura[i]);
+         registro.lecturas[2 * i + 1] = centesimos(humedad[i]);
+       }
+       registro.puerta = puerta;
+       if (cantidadRegistros == REGISTROS_POR_SECTOR) {
+         escribirRegistros();
+       }
+#else
  File logFile = SD.open(filename, FILE_WRITE);
        DateTime now = RTC.now();
         if (logFile) { 
@@ -131,20 +205,19 @@ void loop() {
                 logFile.print(':');
                 logFile.print(now.second(), DEC);
               logFile.print(",");
-              logFile.print(ti);
-              logFile.print(",");
-              logFile.print(hi);
-              logFile.print(",");
-              logFile.print(te);
-              logFile.print(",");
-              logFile.print(he);
-              logFile.print(",");
+              for (int i = 0; i < SENSORES; i++) {
+                logFile.print(temperatura[i]);
+                logFile.print(",");
+                logFile.print(humedad[i]);
+                logFile.print(",");
+              }
               logFile.println(puerta);
               logFile.close(); 
         } 
         else {
           Serial.println("Error al abrir/crear el archivo en tarjeta SD");
         }
+#endif
 
   puerta = 0;
  }